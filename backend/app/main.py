@@ -1,6 +1,10 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import resume_analysis
+from app.services.skill_taxonomy import skill_taxonomy
+from app.services.warmup_service import WarmupService
 
 app = FastAPI(title="Resume ATS Checker API")
 
@@ -16,10 +20,50 @@ app.add_middleware(
 # Include routers
 app.include_router(resume_analysis.router, prefix="/api")
 
+# Loads the models and runs dummy work before the first real request
+warmup_service = WarmupService(
+    resume_analysis.executor_service,
+    resume_analysis.scoring_service,
+    resume_analysis.distilbert_service
+)
+
+@app.on_event("startup")
+async def start_warmup():
+    """Warm up the models, in the background unless WARMUP_BLOCKING is set"""
+    if not warmup_service.enabled:
+        return
+    
+    if os.getenv("WARMUP_BLOCKING", "false").lower() in ("1", "true", "yes"):
+        await warmup_service.run()
+    else:
+        app.state.warmup_task = asyncio.create_task(warmup_service.run())
+
+@app.on_event("startup")
+async def start_taxonomy_watcher():
+    """Reload the skill taxonomy when its file changes"""
+    skill_taxonomy.start_watcher()
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    """Stop the worker pools used for blocking work"""
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    resume_analysis.executor_service.shutdown()
+    skill_taxonomy.stop_watcher()
+
 @app.get("/")
 async def root():
     return {"message": "Resume ATS Checker API is running"}
 
+@app.get("/ready")
+async def ready(response: Response):
+    """Readiness probe: 503 until the warmup has finished and every component is warm"""
+    status = warmup_service.status()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
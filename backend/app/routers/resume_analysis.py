@@ -1,23 +1,501 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from app.services.enhanced_text_extraction import EnhancedTextExtractionService
 from app.services.qwen_processing import QwenProcessingService
 from app.services.distilbert_extraction import DistilBERTExtractionService
 from app.services.scoring_service import ScoringService
+from app.services.job_profile import JobProfile
+from app.services.model_registry import model_registry
+from app.services.extraction_cache import ExtractionCache
+from app.services.skill_taxonomy import skill_taxonomy
 from app.services.supabase_storage import SupabaseStorageService
+from app.services.executor_service import (
+    ExecutorService,
+    extract_text_job,
+    extract_page_range_job,
+    extract_candidate_info_job
+)
+from app.services.supervised_pool import JobTimeoutError, WorkerCrashedError, WorkerMemoryError
+import asyncio
 import json
 import time
 import os
 import logging
 
 router = APIRouter()
+executor_service = ExecutorService()
 text_extraction_service = EnhancedTextExtractionService()
 qwen_service = QwenProcessingService()
 distilbert_service = DistilBERTExtractionService()
-scoring_service = ScoringService()
-storage_service = SupabaseStorageService()
+scoring_service = ScoringService(job_keyword_extractor=qwen_service._extract_keywords_regex)
+storage_service = SupabaseStorageService(executor=executor_service)
+# Extraction runs in worker processes, so the cache lives here in the API process
+extraction_cache = ExtractionCache()
 logger = logging.getLogger(__name__)
 
+# Maximum number of resumes a batch request processes at the same time
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+# PDFs with at least this many pages are split across the process pool (0 disables)
+PAGE_PARALLEL_THRESHOLD = int(os.getenv("PAGE_PARALLEL_THRESHOLD", "10"))
+
+# Wall-clock limit of one extraction job; the worker is killed when it is exceeded (0 disables)
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "60"))
+
+# Largest accepted resume file in bytes (0 disables); larger uploads are rejected while reading
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Size of the chunks uploads are read in
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# PDF readers accept the %PDF- header anywhere in the first 1024 bytes
+PDF_HEADER_SEARCH_BYTES = 1024
+
+async def _read_pdf_upload(upload: UploadFile) -> bytes:
+    """
+    Read an uploaded PDF chunk by chunk, rejecting it as early as possible
+    
+    The declared size is checked before reading, the PDF header in the first
+    PDF_HEADER_SEARCH_BYTES bytes, and the running total against
+    MAX_UPLOAD_BYTES while reading, so an oversized or non-PDF file is never
+    buffered whole in memory. (Starlette has already spooled the multipart
+    body to a temporary file by this point.)
+    
+    Raises:
+        HTTPException: 413 if the file exceeds MAX_UPLOAD_BYTES, 400 if it is
+            not a PDF
+    """
+    too_large = HTTPException(
+        status_code=413, detail=f"File exceeds the maximum upload size of {MAX_UPLOAD_BYTES} bytes"
+    )
+    if MAX_UPLOAD_BYTES and upload.size is not None and upload.size > MAX_UPLOAD_BYTES:
+        raise too_large
+    
+    not_pdf = HTTPException(status_code=400, detail="File content is not a PDF")
+    chunks = []
+    total = 0
+    header_checked = False
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if MAX_UPLOAD_BYTES and total > MAX_UPLOAD_BYTES:
+            raise too_large
+        chunks.append(chunk)
+        if not header_checked and total >= PDF_HEADER_SEARCH_BYTES:
+            if b"%PDF-" not in b"".join(chunks)[:PDF_HEADER_SEARCH_BYTES]:
+                raise not_pdf
+            header_checked = True
+    
+    if not chunks:
+        raise HTTPException(status_code=400, detail="File is empty")
+    content = b"".join(chunks)
+    if not header_checked and b"%PDF-" not in content:
+        raise not_pdf
+    return content
+
+async def _run_extraction_job(func, *args):
+    """Run an extraction job on the supervised pool with the extraction timeout"""
+    return await executor_service.run_isolated(func, *args, timeout=EXTRACTION_TIMEOUT_SECONDS or None)
+
+def _extraction_failure(file_content: bytes, filename: str, status: str, message: str):
+    """Failed extraction result for a job that timed out, ran out of memory or whose worker crashed"""
+    metadata = {
+        "file_name": filename,
+        "original_filename": filename,
+        "file_size_mb": len(file_content) / (1024 * 1024),
+        "extraction_status": status
+    }
+    if status == "timeout":
+        metadata["timeout_seconds"] = EXTRACTION_TIMEOUT_SECONDS
+    return False, message, metadata
+
+async def _extract_text(file_content: bytes, filename: str, enable_fallback: bool):
+    """
+    Extract text from an uploaded PDF on the supervised process pool
+    
+    Results are cached by the SHA-256 of the file content and the extraction
+    options; a cache hit skips the extraction. metadata["extraction_cache"]
+    is "memory", "disk" or "miss".
+    
+    An extraction that exceeds EXTRACTION_TIMEOUT_SECONDS is stopped and
+    reported with metadata["extraction_status"] = "timeout"; one that exceeded
+    the worker memory limit with "memory_limit", and one whose worker died with
+    "crashed". The pdftotext fallback runs here as an asyncio subprocess
+    instead of in a worker.
+    
+    Returns:
+        Tuple of (success, text or error message, metadata)
+    """
+    if not filename.lower().endswith('.pdf'):
+        return await executor_service.run_in_process(extract_text_job, file_content, filename, enable_fallback)
+    
+    key = extraction_cache.make_key(
+        file_content,
+        enable_fallback=enable_fallback,
+        engine_order=text_extraction_service.engine_order,
+        page_budget=text_extraction_service.page_budget
+    )
+    
+    # The disk tier blocks, so only then go through the thread pool
+    if extraction_cache.cache_dir:
+        cached = await executor_service.run_in_thread(extraction_cache.get, key)
+    else:
+        cached = extraction_cache.get(key)
+    
+    if cached is not None:
+        text, metadata, tier = cached
+        metadata["file_name"] = filename
+        metadata["original_filename"] = filename
+        metadata["extraction_cache"] = tier
+        return True, text, metadata
+    
+    page_count = None
+    # Splitting needs at least two supervised workers
+    split_threshold = 0
+    if executor_service.use_processes and executor_service.isolated_workers > 1:
+        split_threshold = PAGE_PARALLEL_THRESHOLD
+    try:
+        # The job counts the pages; a long PDF comes back unextracted to be split
+        success, text_or_error, metadata = await _run_extraction_job(
+            extract_text_job, file_content, filename, enable_fallback, False, split_threshold
+        )
+        
+        if not success and metadata is not None and "split_pages" in metadata:
+            page_count = metadata["split_pages"]
+            success, text_or_error, metadata = await _extract_text_page_parallel(file_content, filename, page_count)
+            if not success:
+                success, text_or_error, metadata = await _run_extraction_job(
+                    extract_text_job, file_content, filename, enable_fallback, False, 0, page_count
+                )
+    except JobTimeoutError:
+        logger.error(f"Extraction of {filename} exceeded {EXTRACTION_TIMEOUT_SECONDS:g}s")
+        return _extraction_failure(
+            file_content, filename, "timeout", f"Extraction timed out after {EXTRACTION_TIMEOUT_SECONDS:g}s"
+        )
+    except WorkerMemoryError as e:
+        logger.error(f"Extraction of {filename} exceeded the worker memory limit: {str(e)}")
+        return _extraction_failure(
+            file_content, filename, "memory_limit", "Extraction exceeded the worker memory limit"
+        )
+    except WorkerCrashedError as e:
+        logger.error(f"Extraction worker crashed on {filename}: {str(e)}")
+        return _extraction_failure(file_content, filename, "crashed", f"Extraction worker crashed: {str(e)}")
+    
+    if not success and text_extraction_service.uses_pdftotext(enable_fallback):
+        fallback = await _extract_text_pdftotext(file_content, filename, page_count)
+        if fallback is not None:
+            success, text_or_error, metadata = fallback
+    
+    if success and metadata is not None:
+        if extraction_cache.cache_dir:
+            await executor_service.run_in_thread(extraction_cache.put, key, text_or_error, metadata)
+        else:
+            extraction_cache.put(key, text_or_error, metadata)
+        metadata["extraction_cache"] = "miss"
+    
+    return success, text_or_error, metadata
+
+async def _extract_text_page_parallel(file_content: bytes, filename: str, page_count: Optional[int]):
+    """
+    Extract a long PDF by splitting its pages across the process pool
+    
+    Only used for PDFs with at least PAGE_PARALLEL_THRESHOLD pages to extract
+    (after the page budget). The pages are split into one range per worker and
+    reassembled in order.
+    
+    Args:
+        file_content: PDF content
+        filename: Name of the file
+        page_count: Page count from the PDF structure, read by extract_text_job
+    
+    Returns:
+        Same as _extract_text; (False, "", None) if the PDF is too short or the
+        page-parallel extraction failed, so the caller extracts it as a whole
+        
+    Raises:
+        JobTimeoutError: A page range exceeded the extraction timeout; the
+            whole document is not retried
+        WorkerMemoryError: A page range exceeded the worker memory limit; the
+            whole document is not retried either
+    """
+    if not page_count:
+        return False, "", None
+    
+    page_budget = text_extraction_service.page_budget
+    pages_to_extract = min(page_count, page_budget) if page_budget else page_count
+    if pages_to_extract < PAGE_PARALLEL_THRESHOLD:
+        return False, "", None
+    
+    workers = min(executor_service.isolated_workers, pages_to_extract)
+    if workers < 2:
+        return False, "", None
+    pages_per_range = -(-pages_to_extract // workers)  # Ceiling division
+    logger.info(f"Extracting {pages_to_extract} pages of {filename} in {workers} parallel ranges")
+    
+    start = time.time()
+    try:
+        ranges = await asyncio.gather(*[
+            _run_extraction_job(
+                extract_page_range_job, file_content, first_page, min(first_page + pages_per_range, pages_to_extract)
+            )
+            for first_page in range(0, pages_to_extract, pages_per_range)
+        ])
+    except (JobTimeoutError, WorkerMemoryError):
+        raise
+    except Exception as e:
+        logger.warning(f"Page-parallel extraction of {filename} failed: {str(e)}")
+        return False, "", None
+    
+    success, text_or_error, metadata = text_extraction_service.combine_page_ranges(
+        ranges, filename, len(file_content) / (1024 * 1024), page_count, time.time() - start, pages_to_extract
+    )
+    if not success:
+        logger.warning(f"Page-parallel extraction of {filename} failed: {text_or_error}")
+        return False, "", None
+    
+    metadata["original_filename"] = filename
+    return success, text_or_error, metadata
+
+async def _extract_text_pdftotext(file_content: bytes, filename: str, page_count: Optional[int]):
+    """
+    Extract a PDF with the pdftotext fallback, without blocking the event loop
+    
+    The PDF is not parsed again here: this path runs after the isolated engines
+    failed on it, so only a page count they already read is used.
+    
+    Args:
+        file_content: PDF content
+        filename: Name of the file
+        page_count: Page count read by extract_text_job, None to estimate it
+            from the text
+    
+    Returns:
+        Same as _extract_text, or None if pdftotext extracted no text
+    """
+    page_budget = text_extraction_service.page_budget
+    start = time.time()
+    text = await text_extraction_service.extract_with_pdftotext_async(file_content, page_budget)
+    if not text:
+        return None
+    elapsed = round(time.time() - start, 4)
+    
+    primary_engines, _ = text_extraction_service._engine_plan()
+    metadata = text_extraction_service.build_metadata(
+        text, filename, len(file_content) / (1024 * 1024), page_count, page_budget, "pdftotext",
+        "success" if primary_engines == ["pdftotext"] else "fallback", {"pdftotext": elapsed}
+    )
+    metadata["original_filename"] = filename
+    return True, text, metadata
+
+async def _extract_candidate_info(resume_text: str, use_distilbert: bool) -> Dict[str, Any]:
+    """
+    Extract candidate information, optionally using DistilBERT for name/email
+    
+    The regex extraction runs on the process pool; the DistilBERT model runs on
+    the thread pool so it is loaded only once in the API process.
+    
+    Args:
+        resume_text: Text extracted from the resume
+        use_distilbert: Whether to use DistilBERT for name/email extraction
+        
+    Returns:
+        Candidate information dictionary
+    """
+    if use_distilbert:
+        # Use DistilBERT for name/email extraction and Qwen for other information
+        distilbert_info, candidate_info = await asyncio.gather(
+            executor_service.run_in_thread(distilbert_service.extract_name_and_email, resume_text),
+            executor_service.run_in_process(extract_candidate_info_job, resume_text)
+        )
+        
+        _apply_distilbert_info(candidate_info, distilbert_info)
+    else:
+        # Use Qwen for all information extraction
+        candidate_info = await executor_service.run_in_process(extract_candidate_info_job, resume_text)
+    
+    return candidate_info
+
+def _apply_distilbert_info(candidate_info: Dict[str, Any], distilbert_info: Dict[str, str]):
+    """Only update with DistilBERT results if they were found"""
+    if distilbert_info["name"]:
+        candidate_info["name"] = distilbert_info["name"]
+    if distilbert_info["email"]:
+        candidate_info["email"] = distilbert_info["email"]
+
+async def _get_job_profile(job_description: str) -> JobProfile:
+    """Get the cached (or newly parsed) job description profile"""
+    return await executor_service.run_in_thread(scoring_service.get_job_profile, job_description)
+
+async def _calculate_match_score(candidate_info: Dict[str, Any], job_profile: JobProfile,
+                                 weight_dict: Optional[Dict[str, float]],
+                                 similarities: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, Any]:
+    """Calculate the match score on the thread pool (uses the in-process sentence model)"""
+    return await executor_service.run_in_thread(
+        scoring_service.calculate_match_score, candidate_info, job_profile, weight_dict, similarities
+    )
+
+def _batch_error_result(filename: str, error: Union[Exception, str]) -> Dict[str, Any]:
+    """Minimal result for a resume that failed, so the frontend still gets an entry"""
+    return {
+        "filename": filename,
+        "error": str(error),
+        "score": 0,
+        "matchedKeywords": [],
+        "missingKeywords": [],
+        "storage": {"success": False, "message": f"Processing error: {str(error)}"}
+    }
+
+async def _prepare_batch_resume(
+    resume: UploadFile,
+    semaphore: asyncio.Semaphore,
+    enable_fallback_extraction: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract the text and candidate information of one resume of a batch
+    
+    Both stages run on the executor pools while holding the semaphore. DistilBERT
+    name/email extraction is done afterwards for the whole batch at once.
+    
+    Returns:
+        {"filename", "metadata", "candidateInfo", "resumeText"}, an error result, or
+        None if the file was skipped
+    """
+    # Validate file type
+    file_ext = os.path.splitext(resume.filename)[1].lower()
+    if file_ext != '.pdf':
+        return None  # Skip non-PDF files
+    
+    try:
+        # Read file content
+        content = await _read_pdf_upload(resume)
+        
+        async with semaphore:
+            # Step 1: Extract text from resume
+            success, resume_text, metadata = await _extract_text(
+                content, resume.filename, enable_fallback_extraction
+            )
+            
+            if not success:
+                logger.warning(f"Failed to extract text from {resume.filename}: {resume_text}")
+                if metadata is not None and metadata.get("extraction_status") in ("timeout", "memory_limit", "crashed"):
+                    # Report stopped extractions instead of silently dropping the file
+                    return {**_batch_error_result(resume.filename, resume_text), "metadata": metadata}
+                return None  # Skip files that couldn't be processed
+            
+            # Step 2: AI Processing - Extract candidate information
+            candidate_info = await _extract_candidate_info(resume_text, use_distilbert=False)
+        
+        return {
+            "filename": resume.filename,
+            "metadata": metadata,
+            "candidateInfo": candidate_info,
+            "resumeText": resume_text
+        }
+    except HTTPException as e:
+        # Rejected upload (too large or not a PDF); report it with the other results
+        logger.warning(f"Rejected {resume.filename}: {e.detail}")
+        return _batch_error_result(resume.filename, e.detail)
+    except Exception as e:
+        # Log the error but continue processing other files
+        logger.error(f"Error processing {resume.filename}: {str(e)}")
+        return _batch_error_result(resume.filename, e)
+
+async def _finish_batch_resume(
+    prepared: Dict[str, Any],
+    similarities: Dict[str, Optional[float]],
+    semaphore: asyncio.Semaphore,
+    job_profile: JobProfile,
+    job_description_id: Optional[str],
+    folder_id: str,
+    user_id: str,
+    file_id_map: Dict[str, str],
+    weight_dict: Optional[Dict[str, float]],
+    store_results: bool
+) -> Dict[str, Any]:
+    """
+    Score one prepared resume of a batch and store the result
+    
+    Scoring holds the semaphore; storing the result happens outside of it so the
+    Supabase round trip overlaps with the scoring of other resumes.
+    
+    Args:
+        prepared: Result of _prepare_batch_resume
+        similarities: This resume's entry from ScoringService.compute_similarities
+        
+    Returns:
+        Analysis result or an error result
+    """
+    filename = prepared["filename"]
+    
+    try:
+        async with semaphore:
+            # Step 3: Calculate match score
+            score_result = await _calculate_match_score(
+                prepared["candidateInfo"], job_profile, weight_dict, similarities
+            )
+        
+        # Combine results
+        analysis_result = {
+            "filename": filename,
+            "metadata": prepared["metadata"],
+            "candidateInfo": prepared["candidateInfo"],
+            "score": score_result["score"],
+            "matchedKeywords": score_result["matchedKeywords"],
+            "missingKeywords": score_result["missingKeywords"],
+            "aspectScores": score_result["aspectScores"],
+            "achievementBonus": score_result["achievementBonus"],
+            "recommendations": score_result["recommendations"]
+        }
+        
+        # Add detailed analysis explanation if available
+        if "analysis" in score_result:
+            analysis_result["analysis"] = score_result["analysis"]
+        
+        # Step 4: Store results in Supabase if requested
+        storage_result = {
+            "success": False,
+            "message": "Results not stored (storage disabled)"
+        }
+        
+        if store_results and job_description_id:
+            try:
+                # Get file ID if available
+                file_id = file_id_map.get(filename, filename)
+                
+                # Store analysis result
+                analysis_success, analysis_message, analysis_data = await storage_service.store_analysis_result(
+                    file_id, job_description_id, folder_id, user_id, analysis_result
+                )
+                
+                if analysis_success:
+                    storage_result = {
+                        "success": True,
+                        "message": analysis_message,
+                        "result_id": analysis_data["id"] if analysis_data else None
+                    }
+                else:
+                    storage_result = {
+                        "success": False,
+                        "message": f"Failed to store analysis result: {analysis_message}"
+                    }
+            except Exception as storage_e:
+                logger.error(f"Error storing analysis result for {filename}: {str(storage_e)}")
+                storage_result = {
+                    "success": False,
+                    "message": f"Storage error: {str(storage_e)}"
+                }
+        
+        # Add storage result to the analysis
+        analysis_result["storage"] = storage_result
+        
+        return analysis_result
+    except Exception as e:
+        # Log the error but continue processing other files
+        logger.error(f"Error processing {filename}: {str(e)}")
+        return _batch_error_result(filename, e)
+
 @router.post("/analyze")
 async def analyze_resume(
     resume: UploadFile = File(...),
@@ -60,50 +538,34 @@ async def analyze_resume(
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid weights format. Must be a valid JSON object.")
     
+    # Read file content, rejecting oversized and non-PDF uploads
+    content = await _read_pdf_upload(resume)
+    
     try:
-        # Read file content
-        content = await resume.read()
-        
         # Step 1: Extract text from resume using enhanced extraction service
-        success, resume_text, metadata = text_extraction_service.extract_text_from_upload(
-            content, 
-            resume.filename,
-            enable_fallback=enable_fallback_extraction
+        success, resume_text, metadata = await _extract_text(
+            content, resume.filename, enable_fallback_extraction
         )
         
         if not success:
             raise HTTPException(status_code=400, detail=f"Failed to extract text from resume: {resume_text}")
         
         # Step 2: AI Processing - Extract candidate information
-        candidate_info = {}
         processing_method = "DistilBERT + Qwen" if use_distilbert else "Qwen"
         processing_start = time.time()
         
-        if use_distilbert:
-            # Use DistilBERT for name/email extraction
-            distilbert_info = distilbert_service.extract_name_and_email(resume_text)
-            
-            # Use Qwen for other information
-            candidate_info = qwen_service.extract_candidate_info(resume_text)
-            
-            # Only update with DistilBERT results if they were found
-            if distilbert_info["name"]:
-                candidate_info["name"] = distilbert_info["name"]
-            if distilbert_info["email"]:
-                candidate_info["email"] = distilbert_info["email"]
-        else:
-            # Use Qwen for all information extraction
-            candidate_info = qwen_service.extract_candidate_info(resume_text)
+        candidate_info = await _extract_candidate_info(resume_text, use_distilbert)
         
         processing_time = time.time() - processing_start
         
         # Step 3: Calculate match score
         scoring_start = time.time()
-        score_result = scoring_service.calculate_match_score(candidate_info, job_description, weight_dict)
+        job_profile = await _get_job_profile(job_description)
+        score_result = await _calculate_match_score(candidate_info, job_profile, weight_dict)
         scoring_time = time.time() - scoring_start
         
-        # Calculate most common skills in job description (for context)
-        job_keywords = qwen_service._extract_keywords_regex(job_description)
+        # Most common skills in job description (for context), parsed once per job description
+        job_keywords = job_profile.analysis_keywords
         
         # Prepare response with more detailed information
         analysis_result = {
@@ -113,6 +575,7 @@ async def analyze_resume(
                 "method": processing_method,
                 "processingTimeSeconds": round(processing_time, 2),
                 "scoringTimeSeconds": round(scoring_time, 2),
+                "scoringStepTimesMs": score_result["timings"],
                 "totalTimeSeconds": round(processing_time + scoring_time, 2)
             },
             "candidateInfo": candidate_info,
@@ -183,6 +646,8 @@ async def analyze_resume(
         analysis_result["storage"] = storage_result
         
         return analysis_result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing resume: {str(e)}")
         logger.error(f"Exception type: {type(e).__name__}")
@@ -200,7 +665,8 @@ async def analyze_batch(
     use_distilbert: bool = Form(False),
     weights: Optional[str] = Form(None),
     store_results: bool = Form(True),
-    enable_fallback_extraction: bool = Form(True)
+    enable_fallback_extraction: bool = Form(True),
+    max_concurrency: Optional[int] = Form(None)
 ) -> Dict[str, Any]:
     """
     Analyze multiple resumes against a job description and store results in Supabase
@@ -214,6 +680,8 @@ async def analyze_batch(
         use_distilbert: Whether to use DistilBERT for name/email extraction
         weights: JSON string of weights for different aspects
         store_results: Whether to store results in Supabase
+        max_concurrency: Maximum number of resumes processed at once, at least 1; capped at
+            and defaulting to BATCH_MAX_CONCURRENCY
         
     Returns:
         Analysis results for each resume
@@ -221,6 +689,9 @@ async def analyze_batch(
     if not resumes:
         raise HTTPException(status_code=400, detail="No resume files provided")
     
+    if max_concurrency is not None and max_concurrency < 1:
+        raise HTTPException(status_code=400, detail="max_concurrency must be at least 1")
+    
     # Parse weights if provided
     weight_dict = None
     if weights:
@@ -252,124 +723,94 @@ async def analyze_batch(
         except Exception as e:
             logger.error(f"Error storing job description: {str(e)}")
     
-    results = []
+    # Bound the number of resumes processed at once so a large folder cannot
+    # exhaust the worker pool or the model's memory; a request can only lower
+    # the limit, since more would just queue behind other work on the pools
+    concurrency = min(max_concurrency or BATCH_MAX_CONCURRENCY, BATCH_MAX_CONCURRENCY)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
     
-    for resume in resumes:
-        # Validate file type
-        file_ext = os.path.splitext(resume.filename)[1].lower()
-        if file_ext != '.pdf':
-            continue  # Skip non-PDF files
-        
+    # Every resume shares one parsed job description
+    job_profile = await _get_job_profile(job_description)
+    
+    # Stage 1: extract text and candidate information of all resumes
+    prepared = await asyncio.gather(*[
+        _prepare_batch_resume(resume, semaphore, enable_fallback_extraction)
+        for resume in resumes
+    ])
+    
+    # gather() preserves the upload order, so the stable sort below gives the
+    # same ordering as processing the files one after another
+    results: List[Optional[Dict[str, Any]]] = list(prepared)
+    ready = [i for i, item in enumerate(prepared) if item is not None and "error" not in item]
+    
+    if ready:
+        # Stage 2: encode all resumes with batched model calls
         try:
-            # Read file content
-            content = await resume.read()
-            
-            # Step 1: Extract text from resume
-            success, resume_text, metadata = text_extraction_service.extract_text_from_upload(
-                content,
-                resume.filename,
-                enable_fallback=enable_fallback_extraction
-            )
-            
-            if not success:
-                logger.warning(f"Failed to extract text from {resume.filename}: {resume_text}")
-                continue  # Skip files that couldn't be processed
-            
-            # Step 2: AI Processing - Extract candidate information
-            candidate_info = {}
-            
             if use_distilbert:
-                # Use DistilBERT for name/email extraction
-                distilbert_info = distilbert_service.extract_name_and_email(resume_text)
-                
-                # Use Qwen for other information
-                candidate_info = qwen_service.extract_candidate_info(resume_text)
-                
-                # Only update with DistilBERT results if they were found
-                if distilbert_info["name"]:
-                    candidate_info["name"] = distilbert_info["name"]
-                if distilbert_info["email"]:
-                    candidate_info["email"] = distilbert_info["email"]
-            else:
-                # Use Qwen for all information extraction
-                candidate_info = qwen_service.extract_candidate_info(resume_text)
-            
-            # Step 3: Calculate match score
-            score_result = scoring_service.calculate_match_score(candidate_info, job_description, weight_dict)
-            
-            # Combine results
-            analysis_result = {
-                "filename": resume.filename,
-                "metadata": metadata,
-                "candidateInfo": candidate_info,
-                "score": score_result["score"],
-                "matchedKeywords": score_result["matchedKeywords"],
-                "missingKeywords": score_result["missingKeywords"],
-                "aspectScores": score_result["aspectScores"],
-                "achievementBonus": score_result["achievementBonus"],
-                "recommendations": score_result["recommendations"]
-            }
-            
-            # Add detailed analysis explanation if available
-            if "analysis" in score_result:
-                analysis_result["analysis"] = score_result["analysis"]
-            
-            # Step 4: Store results in Supabase if requested
-            storage_result = {
-                "success": False,
-                "message": "Results not stored (storage disabled)"
-            }
-            
-            if store_results and job_description_id:
-                try:
-                    # Get file ID if available
-                    file_id = file_id_map.get(resume.filename, resume.filename)
-                    
-                    # Store analysis result
-                    analysis_success, analysis_message, analysis_data = await storage_service.store_analysis_result(
-                        file_id, job_description_id, folder_id, user_id, analysis_result
-                    )
-                    
-                    if analysis_success:
-                        storage_result = {
-                            "success": True,
-                            "message": analysis_message,
-                            "result_id": analysis_data["id"] if analysis_data else None
-                        }
-                    else:
-                        storage_result = {
-                            "success": False,
-                            "message": f"Failed to store analysis result: {analysis_message}"
-                        }
-                except Exception as storage_e:
-                    logger.error(f"Error storing analysis result for {resume.filename}: {str(storage_e)}")
-                    storage_result = {
-                        "success": False,
-                        "message": f"Storage error: {str(storage_e)}"
-                    }
-            
-            # Add storage result to the analysis
-            analysis_result["storage"] = storage_result
+                # DistilBERT name/email extraction for the whole batch in one model call
+                distilbert_infos = await executor_service.run_in_thread(
+                    distilbert_service.extract_name_and_email_batch,
+                    [prepared[i]["resumeText"] for i in ready]
+                )
+                for i, distilbert_info in zip(ready, distilbert_infos):
+                    _apply_distilbert_info(prepared[i]["candidateInfo"], distilbert_info)
             
-            results.append(analysis_result)
+            similarities = await executor_service.run_in_thread(
+                scoring_service.compute_similarities,
+                [prepared[i]["candidateInfo"] for i in ready],
+                job_profile
+            )
         except Exception as e:
-            # Log the error but continue processing other files
-            logger.error(f"Error processing {resume.filename}: {str(e)}")
-            # Add minimal error result to not break frontend expectations
-            results.append({
-                "filename": resume.filename,
-                "error": str(e),
-                "score": 0,
-                "matchedKeywords": [],
-                "missingKeywords": [],
-                "storage": {"success": False, "message": f"Processing error: {str(e)}"}
-            })
+            logger.error(f"Error calculating batch similarities: {str(e)}")
+            for i in ready:
+                results[i] = _batch_error_result(prepared[i]["filename"], e)
+            ready = []
+            similarities = []
+        
+        # Stage 3: score and store each resume
+        finished = await asyncio.gather(*[
+            _finish_batch_resume(
+                prepared[i], resume_similarities, semaphore, job_profile, job_description_id,
+                folder_id, user_id, file_id_map, weight_dict, store_results
+            )
+            for i, resume_similarities in zip(ready, similarities)
+        ])
+        for i, result in zip(ready, finished):
+            results[i] = result
+    
+    results = [result for result in results if result is not None]
     
     # Sort results by score (highest first)
     results.sort(key=lambda x: x.get("score", 0), reverse=True)
     
     return {"results": results}
 
+@router.get("/cache-stats")
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss counters of the caches
+    
+    Returns:
+        Statistics for each cache
+    """
+    stats = scoring_service.cache_stats()
+    stats["extraction"] = extraction_cache.stats()
+    stats["skillTaxonomy"] = skill_taxonomy.stats()
+    return stats
+
+@router.get("/models")
+async def get_model_stats() -> Dict[str, Any]:
+    """
+    Get the models loaded in the API process
+    
+    Returns:
+        Load time and memory of each shared model, and the state of the
+        extraction workers
+    """
+    stats = model_registry.stats()
+    stats["extractionWorkers"] = executor_service.isolated_stats()
+    return stats
+
 @router.get("/weights/default")
 async def get_default_weights() -> Dict[str, float]:
     """
@@ -498,15 +939,13 @@ async def test_extraction(
     if file_ext != '.pdf':
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
+    # Read file content, rejecting oversized and non-PDF uploads
+    content = await _read_pdf_upload(resume)
+    
     try:
-        # Read file content
-        content = await resume.read()
-        
         # Extract text using enhanced extraction service
-        success, text_or_error, metadata = text_extraction_service.extract_text_from_upload(
-            content, 
-            resume.filename,
-            enable_fallback=enable_fallback_extraction
+        success, text_or_error, metadata = await _extract_text(
+            content, resume.filename, enable_fallback_extraction
         )
         
         if not success:
@@ -522,5 +961,7 @@ async def test_extraction(
             "text_length": len(text_or_error),
             "metadata": metadata
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error testing extraction: {str(e)}") 
\ No newline at end of file
@@ -1,10 +1,10 @@
 import re
+import os
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-import torch
-from transformers import DistilBertTokenizer, DistilBertForSequenceClassification
-from transformers import DistilBertTokenizer, DistilBertForTokenClassification
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from app.services.model_registry import model_registry
 
 # Configure logging
 logging.basicConfig(
@@ -13,6 +13,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sentence embedding model used to rank candidate name lines (shared with ScoringService)
+SENTENCE_MODEL_NAME = 'distilbert-base-nli-mean-tokens'
+
+# Common name patterns; candidate lines are ranked by similarity to their average embedding
+NAME_EXAMPLES = [
+    "John Smith",
+    "Jane Doe",
+    "Robert Johnson",
+    "Emily Williams",
+    "Michael Brown"
+]
+
+# Optional directory where the averaged name embedding is kept between restarts
+NAME_PROTOTYPE_CACHE_DIR = os.getenv("NAME_PROTOTYPE_CACHE_DIR")
+
 class DistilBERTExtractionService:
     """Service for extracting name and email from resume text using DistilBERT"""
     
@@ -24,26 +39,67 @@ class DistilBERTExtractionService:
             model_name: Name of the DistilBERT model to use
         """
         self.model_name = model_name
-        self.tokenizer = None
-        self.model = None
+        # Only the sentence transformer is used for extraction; it is loaded
+        # on the first name lookup that falls through to the embedding ranking
         self.sentence_model = None
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"DistilBERTExtractionService initialized with model: {model_name}, using device: {self.device}")
+        self.name_prototype = None
+        # Resolved on first model use so constructing the service does not import torch
+        self._device = None
+        logger.info(f"DistilBERTExtractionService initialized with model: {model_name}")
+    
+    @property
+    def device(self) -> str:
+        """Device used for model inference ("cuda" or "cpu")"""
+        if self._device is None:
+            import torch
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        return self._device
     
     def _load_models(self):
-        """Load the DistilBERT models if not already loaded"""
-        if self.tokenizer is None or self.model is None:
+        """Load the sentence transformer and the name prototype embedding if not already loaded"""
+        if self.sentence_model is None:
             try:
-                logger.info(f"Loading DistilBERT tokenizer: {self.model_name}")
-                self.tokenizer = DistilBertTokenizer.from_pretrained(self.model_name)
-                
-                logger.info(f"Loading SentenceTransformer model")
-                self.sentence_model = SentenceTransformer('distilbert-base-nli-mean-tokens')
-                
-                logger.info("Successfully loaded DistilBERT models")
+                self.sentence_model = model_registry.get_sentence_transformer(SENTENCE_MODEL_NAME)
             except Exception as e:
-                logger.error(f"Error loading DistilBERT models: {str(e)}")
+                logger.error(f"Error loading SentenceTransformer model: {str(e)}")
                 raise
+        
+        if self.name_prototype is None:
+            self.name_prototype = self._load_name_prototype()
+    
+    def _load_name_prototype(self) -> np.ndarray:
+        """
+        Average embedding of the name examples
+        
+        Read from NAME_PROTOTYPE_CACHE_DIR when available, otherwise encoded and
+        (if the directory is configured) saved there for the next start.
+        """
+        cache_path = None
+        if NAME_PROTOTYPE_CACHE_DIR:
+            key = hashlib.sha256("\0".join([SENTENCE_MODEL_NAME] + NAME_EXAMPLES).encode("utf-8")).hexdigest()[:16]
+            cache_path = os.path.join(NAME_PROTOTYPE_CACHE_DIR, f"name_prototype_{key}.npy")
+            
+            if os.path.exists(cache_path):
+                try:
+                    return np.load(cache_path)
+                except Exception as e:
+                    logger.warning(f"Could not read name prototype from {cache_path}: {str(e)}")
+        
+        name_embeddings = np.asarray(self.sentence_model.encode(NAME_EXAMPLES), dtype=np.float32)
+        prototype = name_embeddings.mean(axis=0)
+        
+        if cache_path:
+            try:
+                os.makedirs(NAME_PROTOTYPE_CACHE_DIR, exist_ok=True)
+                # Write to a temporary file first so other workers never read a partial file
+                temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temp_path, "wb") as f:
+                    np.save(f, prototype)
+                os.replace(temp_path, cache_path)
+            except Exception as e:
+                logger.warning(f"Could not save name prototype to {cache_path}: {str(e)}")
+        
+        return prototype
     
     def extract_name_and_email(self, text: str) -> Dict[str, str]:
         """
@@ -55,26 +111,48 @@ class DistilBERTExtractionService:
         Returns:
             Dictionary with name and email
         """
-        logger.info("Extracting name and email from resume text")
+        return self.extract_name_and_email_batch([text])[0]
+    
+    def extract_name_and_email_batch(self, texts: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract name and email from several resume texts
         
-        # First try extracting using regex pattern (best precision)
-        name = self._extract_name_regex(text)
+        The resumes whose name is not found by the regex and position heuristics
+        share a single model call for the embedding-based fallback.
         
-        # If regex fails, try location-based heuristics
-        if not name:
-            name = self._extract_name_by_position(text)
+        Args:
+            texts: Resume texts
+            
+        Returns:
+            Dictionary with name and email for each text, in input order
+        """
+        logger.info(f"Extracting name and email from {len(texts)} resume text(s)")
+        
+        names = []
+        for text in texts:
+            # First try extracting using regex pattern (best precision)
+            name = self._extract_name_regex(text)
+            
+            # If regex fails, try location-based heuristics
+            if not name:
+                name = self._extract_name_by_position(text)
+            
+            names.append(name)
         
         # If still no name found, try NLP-based extraction as last resort
-        if not name:
-            name = self._extract_name_distilbert(text)
+        missing = [i for i, name in enumerate(names) if not name]
+        if missing:
+            for i, name in zip(missing, self._extract_names_distilbert([texts[i] for i in missing])):
+                names[i] = name
         
         # Extract email using regex
-        email = self._extract_email_regex(text)
-        
-        return {
-            "name": name,
-            "email": email
-        }
+        return [
+            {
+                "name": name,
+                "email": self._extract_email_regex(text)
+            }
+            for name, text in zip(names, texts)
+        ]
     
     def _extract_name_regex(self, text: str) -> str:
         """Extract name using regex patterns with higher precision"""
@@ -158,61 +236,78 @@ class DistilBERTExtractionService:
     
     def _extract_name_distilbert(self, text: str) -> str:
         """Extract name using DistilBERT embeddings and heuristics"""
+        return self._extract_names_distilbert([text])[0]
+    
+    def _extract_names_distilbert(self, texts: List[str]) -> List[str]:
+        """
+        Extract names using DistilBERT embeddings and heuristics
+        
+        The candidate lines of all texts are encoded in one call and ranked
+        against the precomputed name prototype.
+        
+        Args:
+            texts: Resume texts
+            
+        Returns:
+            Extracted name (or "") for each text
+        """
         try:
             self._load_models()
             
-            # Split text into lines
-            lines = [line.strip() for line in text[:1000].split('\n') if line.strip()]
-            
-            # Filter out lines that are too long or too short
-            candidate_lines = [line for line in lines if 2 < len(line.split()) < 10]
-            
-            if not candidate_lines:
-                return ""
-            
-            # Create embeddings for common name patterns
-            name_examples = [
-                "John Smith",
-                "Jane Doe",
-                "Robert Johnson",
-                "Emily Williams",
-                "Michael Brown"
-            ]
+            candidate_lines_per_text = []
+            for text in texts:
+                # Split text into lines
+                lines = [line.strip() for line in text[:1000].split('\n') if line.strip()]
+                
+                # Filter out lines that are too long or too short
+                candidate_lines_per_text.append([line for line in lines if 2 < len(line.split()) < 10])
             
-            # Get embeddings for name examples
-            name_embeddings = self.sentence_model.encode(name_examples)
-            avg_name_embedding = torch.tensor(name_embeddings).mean(dim=0).numpy()
+            all_lines = [line for lines in candidate_lines_per_text for line in lines]
+            if not all_lines:
+                return ["" for _ in texts]
             
             # Get embeddings for candidate lines
-            candidate_embeddings = self.sentence_model.encode(candidate_lines)
+            candidate_embeddings = np.asarray(self.sentence_model.encode(all_lines), dtype=np.float32)
             
             # Calculate cosine similarity
-            from sklearn.metrics.pairwise import cosine_similarity
-            similarities = cosine_similarity([avg_name_embedding], candidate_embeddings)[0]
-            
-            # Get the most similar line
-            most_similar_idx = similarities.argmax()
-            most_similar_line = candidate_lines[most_similar_idx]
-            
-            # Extract the name from the line
-            # Heuristic: Take first 2-3 words if they start with capital letters
-            words = most_similar_line.split()
-            name_words = []
-            
-            for word in words[:3]:  # Consider up to first 3 words
-                if word[0].isupper() and len(word) > 1:
-                    name_words.append(word)
-                else:
-                    break
+            norms = np.linalg.norm(candidate_embeddings, axis=1) * np.linalg.norm(self.name_prototype)
+            dots = candidate_embeddings @ self.name_prototype
+            similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
             
-            if name_words:
-                return " ".join(name_words)
+            names = []
+            offset = 0
+            for candidate_lines in candidate_lines_per_text:
+                if not candidate_lines:
+                    names.append("")
+                    continue
+                
+                # Get the most similar line
+                most_similar_idx = similarities[offset:offset + len(candidate_lines)].argmax()
+                offset += len(candidate_lines)
+                names.append(self._name_from_line(candidate_lines[most_similar_idx]))
             
-            return ""
+            return names
             
         except Exception as e:
             logger.error(f"Error extracting name with DistilBERT: {str(e)}")
-            return ""
+            return ["" for _ in texts]
+    
+    def _name_from_line(self, line: str) -> str:
+        """Extract the name from the line most similar to a name"""
+        # Heuristic: Take first 2-3 words if they start with capital letters
+        words = line.split()
+        name_words = []
+        
+        for word in words[:3]:  # Consider up to first 3 words
+            if word[0].isupper() and len(word) > 1:
+                name_words.append(word)
+            else:
+                break
+        
+        if name_words:
+            return " ".join(name_words)
+        
+        return ""
     
     def fine_tune_for_name_extraction(self, training_data: List[Dict[str, str]]):
         """
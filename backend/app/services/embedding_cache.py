@@ -0,0 +1,126 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting differences map to the same cache key"""
+    return " ".join(text.split())
+
+class EmbeddingCache:
+    """
+    Memory-bounded LRU cache of sentence embeddings
+
+    Keys are the SHA-256 of the model name and the whitespace-normalized text.
+    Cached arrays are read-only because they are shared between requests.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_bytes: Memory budget for cached embeddings (default: EMBEDDING_CACHE_MAX_MB)
+        """
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("EMBEDDING_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+        self.max_bytes = max(0, max_bytes)
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(text: str, model_name: str = "") -> str:
+        """Cache key for a text encoded by a given model"""
+        digest = hashlib.sha256()
+        digest.update(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalize_text(text).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Get a cached embedding and mark it as recently used"""
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._embeddings.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def put(self, key: str, embedding: np.ndarray) -> np.ndarray:
+        """Store an embedding, evicting least recently used entries to stay within budget"""
+        embedding = np.array(embedding, copy=True)
+        embedding.setflags(write=False)
+
+        if embedding.nbytes > self.max_bytes:
+            return embedding
+
+        with self._lock:
+            previous = self._embeddings.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.nbytes
+
+            self._embeddings[key] = embedding
+            self.current_bytes += embedding.nbytes
+
+            while self.current_bytes > self.max_bytes and self._embeddings:
+                _, evicted = self._embeddings.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+        return embedding
+
+    def get_or_compute(self, text: str, compute: Callable[[str], np.ndarray], model_name: str = "") -> np.ndarray:
+        """
+        Get the embedding for a text, computing and caching it on a miss
+
+        Args:
+            text: Text to embed
+            compute: Function returning the embedding of a text
+            model_name: Name of the model, part of the cache key
+
+        Returns:
+            Embedding vector
+        """
+        key = self.make_key(text, model_name)
+        embedding = self.get(key)
+        if embedding is not None:
+            return embedding
+        return self.put(key, compute(text))
+
+    def clear(self):
+        """Remove all cached embeddings"""
+        with self._lock:
+            self._embeddings.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._embeddings),
+                "bytes": self.current_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
@@ -1,11 +1,20 @@
-import tempfile
+import asyncio
 import logging
 import subprocess
-import platform
+import shutil
 import os
-from typing import Optional, Dict, Any, Tuple
+import re
+import time
+from io import BytesIO, StringIO
+from typing import Optional, Dict, Any, List, Tuple
 from pdfminer.high_level import extract_text
-from pdfminer.pdfparser import PDFSyntaxError
+from pdfminer.pdfparser import PDFParser, PDFSyntaxError
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdftypes import resolve1
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
 
 # Configure logging
 logging.basicConfig(
@@ -14,16 +23,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Supported extraction engines
+EXTRACTION_ENGINES = ["pymupdf", "pdfminer", "pdftotext"]
+
+# Minimum share of printable characters for PyMuPDF text to be accepted in auto mode
+AUTO_MIN_PRINTABLE_RATIO = float(os.getenv("PDF_AUTO_MIN_PRINTABLE_RATIO", "0.95"))
+
+# Wall-clock limit of one pdftotext run; the process is killed when it is exceeded
+PDFTOTEXT_TIMEOUT_SECONDS = float(os.getenv("PDFTOTEXT_TIMEOUT_SECONDS", "30"))
+
+# Location of the pdftotext binary, looked up once per process (None if not installed)
+PDFTOTEXT_PATH = shutil.which("pdftotext")
+
+# Common resume section headers, one of which must appear in accepted text
+SECTION_HEADER_PATTERN = re.compile(
+    r"^\s*(?:professional\s+)?(?:experience|work\s+history|employment|education|skills|"
+    r"technical\s+skills|summary|profile|objective|projects|certifications?|achievements)\b",
+    re.IGNORECASE | re.MULTILINE
+)
+
+def _pdftotext_command(max_pages: int = 0) -> List[str]:
+    """pdftotext arguments reading the PDF from stdin and writing the text to stdout"""
+    page_limit = ["-l", str(int(max_pages))] if max_pages else []
+    return [PDFTOTEXT_PATH, "-layout", *page_limit, "-", "-"]
+
+def _pymupdf_available() -> bool:
+    """Whether PyMuPDF can be imported"""
+    try:
+        import fitz  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
 class EnhancedTextExtractionService:
     """Enhanced service for extracting text from PDF files with robust error handling"""
     
-    def extract_text_from_pdf(self, file_path: str, enable_fallback: bool = True) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    def __init__(self, engine_order: Optional[str] = None, page_budget: Optional[int] = None):
+        """
+        Initialize the extraction service
+        
+        Args:
+            engine_order: "auto" or a comma-separated list of engines from
+                EXTRACTION_ENGINES (default: PDF_ENGINE_ORDER, "auto")
+            page_budget: Only extract the first N pages, 0 for all pages
+                (default: PDF_PAGE_BUDGET, 0)
+        """
+        if engine_order is None:
+            engine_order = os.getenv("PDF_ENGINE_ORDER", "auto")
+        if page_budget is None:
+            page_budget = int(os.getenv("PDF_PAGE_BUDGET", "0"))
+        
+        engine_order = engine_order.replace(" ", "").lower()
+        if engine_order != "auto":
+            engines = [engine for engine in engine_order.split(",") if engine]
+            unknown = [engine for engine in engines if engine not in EXTRACTION_ENGINES]
+            if unknown or not engines:
+                logger.warning(f"Unknown extraction engines {unknown} in '{engine_order}', using auto")
+                engine_order = "auto"
+        
+        self.engine_order = engine_order
+        self.page_budget = max(0, page_budget)
+        logger.info(f"EnhancedTextExtractionService initialized with engine order: {engine_order}, "
+                    f"page budget: {self.page_budget or 'none'}")
+    
+    def extract_text_from_pdf(self, file_path: str, enable_fallback: bool = True,
+                              max_pages: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
         Extract text from a PDF file with robust error handling
         
         Args:
             file_path: Path to the PDF file
             enable_fallback: Whether to try fallback methods if primary extraction fails
+            max_pages: Page budget for this file (default: the service's page_budget)
             
         Returns:
             Tuple containing:
@@ -34,72 +105,39 @@ class EnhancedTextExtractionService:
         logger.info(f"Extracting text from PDF: {os.path.basename(file_path)}")
         
         try:
-            # Get file size for logging
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # Convert to MB
-            logger.info(f"File size: {file_size:.2f} MB")
-            
-            # Check if file is too large (over 50MB)
-            if file_size > 50:
-                logger.warning(f"File is very large ({file_size:.2f} MB), extraction may take longer")
-            
-            # Extract text using pdfminer.six
-            text = extract_text(file_path)
-            
-            # Check if text was successfully extracted
-            if not text or len(text.strip()) == 0:
-                logger.warning(f"No text extracted from {os.path.basename(file_path)} with primary method")
-                
-                # Try fallback if enabled
-                if enable_fallback:
-                    return self._try_fallback_extraction(file_path, file_size)
-                
-                return False, "No text could be extracted from the PDF file", None
-            
-            # Create metadata
-            metadata = {
-                "file_name": os.path.basename(file_path),
-                "file_size_mb": file_size,
-                "text_length": len(text),
-                "pages": self._estimate_page_count(text),
-                "extraction_method": "pdfminer",
-                "extraction_status": "success"
-            }
-            
-            logger.info(f"Successfully extracted {len(text)} characters from {os.path.basename(file_path)}")
-            return True, text, metadata
-            
-        except PDFSyntaxError as e:
-            error_msg = f"PDF syntax error: {str(e)}"
-            logger.error(error_msg)
-            
-            # Try fallback if enabled
-            if enable_fallback:
-                logger.info("Attempting fallback extraction methods...")
-                return self._try_fallback_extraction(file_path, os.path.getsize(file_path) / (1024 * 1024))
-            
-            return False, error_msg, None
+            with open(file_path, "rb") as f:
+                file_content = f.read()
         except PermissionError:
             error_msg = "Permission denied when accessing the file"
             logger.error(error_msg)
             return False, error_msg, None
-        except Exception as e:
+        except OSError as e:
             error_msg = f"Error extracting text from PDF: {str(e)}"
             logger.error(error_msg)
-            
-            # Try fallback if enabled
-            if enable_fallback:
-                logger.info("Attempting fallback extraction methods due to exception...")
-                return self._try_fallback_extraction(file_path, os.path.getsize(file_path) / (1024 * 1024))
-            
             return False, error_msg, None
+        
+        return self.extract_text_from_bytes(file_content, os.path.basename(file_path), enable_fallback, max_pages)
     
-    def _try_fallback_extraction(self, file_path: str, file_size: float) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    def extract_text_from_bytes(self, file_content: bytes, file_name: str, enable_fallback: bool = True,
+                                max_pages: Optional[int] = None, include_pdftotext: bool = True,
+                                page_count: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
-        Attempt alternative text extraction methods when primary method fails
+        Extract text from PDF content held in memory
+        
+        All engines read the content from memory; pdftotext gets it on stdin.
+        The engines are tried in the configured order (see _engine_plan). With a
+        page budget only the first pages are extracted and the metadata is
+        marked as truncated.
         
         Args:
-            file_path: Path to the PDF file
-            file_size: File size in MB
+            file_content: Binary content of the PDF
+            file_name: Name of the file, used for logging and metadata
+            enable_fallback: Whether to try fallback methods if primary extraction fails
+            max_pages: Page budget for this file (default: the service's page_budget)
+            include_pdftotext: Whether to try pdftotext; the API runs it itself
+                with extract_with_pdftotext_async when this extraction fails
+            page_count: Page count already read with count_pages, so the page
+                tree is not parsed again (default: count the pages here)
             
         Returns:
             Tuple containing:
@@ -107,93 +145,463 @@ class EnhancedTextExtractionService:
             - Extracted text or error message (str)
             - Metadata dictionary (Dict) or None if extraction failed
         """
-        text = ""
-        method_used = ""
+        # Get file size for logging
+        file_size = len(file_content) / (1024 * 1024)  # Convert to MB
+        logger.info(f"File size: {file_size:.2f} MB")
         
-        # Try Fallback Method 1: PyMuPDF (if available)
-        try:
-            import fitz  # PyMuPDF
-            logger.info("Trying fallback extraction with PyMuPDF...")
+        # Check if file is too large (over 50MB)
+        if file_size > 50:
+            logger.warning(f"File is very large ({file_size:.2f} MB), extraction may take longer")
+        
+        page_budget = self.page_budget if max_pages is None else max(0, max_pages)
+        if page_count is None:
+            page_count = self.count_pages(file_content)
+        
+        primary_engines, fallback_engines = self._engine_plan()
+        if not include_pdftotext:
+            primary_engines = [engine for engine in primary_engines if engine != "pdftotext"]
+            fallback_engines = [engine for engine in fallback_engines if engine != "pdftotext"]
+        engine_times: Dict[str, float] = {}
+        error_msg = "No text could be extracted from the PDF file"
+        
+        # Primary extraction; in auto mode PyMuPDF text of poor quality is kept
+        # only in case pdfminer does no better
+        text, method_used = "", ""
+        poor_text, poor_engine = "", ""
+        for index, engine in enumerate(primary_engines):
+            engine_text, engine_error = self._run_engine(engine, file_content, engine_times, page_budget)
+            if engine_error:
+                error_msg = engine_error
+            if not engine_text:
+                logger.warning(f"No text extracted from {file_name} with {engine}")
+                continue
             
-            doc = fitz.open(file_path)
-            for page in doc:
-                text += page.get_text()
-            doc.close()
+            is_last = index == len(primary_engines) - 1
+            if self.engine_order == "auto" and not is_last and not self._is_good_quality(engine_text):
+                logger.info(f"Text quality from {engine} is poor, trying the next engine")
+                poor_text, poor_engine = engine_text, engine
+                continue
             
-            if text and len(text.strip()) > 0:
-                method_used = "pymupdf"
-                logger.info(f"Successfully extracted {len(text)} characters with PyMuPDF")
+            text, method_used = engine_text, engine
+            break
+        
+        if not text and poor_text:
+            text, method_used = poor_text, poor_engine
+        
+        status = "success"
+        if not text:
+            if not enable_fallback:
+                logger.error(error_msg)
+                return False, error_msg, None
+            
+            # Try the fallback engines in order
+            logger.info("Attempting fallback extraction methods...")
+            status = "fallback"
+            for engine in fallback_engines:
+                text, _ = self._run_engine(engine, file_content, engine_times, page_budget)
+                if text:
+                    method_used = engine
+                    break
+        
+        if not text:
+            # All fallback methods failed
+            return False, "Failed to extract text using all available methods", None
+        
+        metadata = self.build_metadata(
+            text, file_name, file_size, page_count, page_budget, method_used, status, engine_times
+        )
+        
+        logger.info(f"Successfully extracted {len(text)} characters from {file_name} with {method_used}")
+        return True, text, metadata
+    
+    def build_metadata(self, text: str, file_name: str, file_size: float, page_count: Optional[int],
+                       page_budget: int, method_used: str, status: str,
+                       engine_times: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Metadata of a successful extraction
+        
+        Args:
+            text: Extracted text
+            file_name: Name of the file
+            file_size: File size in MB
+            page_count: Page count from the PDF structure, None to estimate it from the text
+            page_budget: Page budget the extraction used, 0 for none
+            method_used: Engine that produced the text
+            status: "success" or "fallback"
+            engine_times: Seconds spent in each engine tried
+        """
+        # Fall back to the text-based estimate if the page tree could not be read
+        if page_count is None:
+            page_count = self._estimate_page_count(text)
+        
+        return {
+            "file_name": file_name,
+            "file_size_mb": file_size,
+            "text_length": len(text),
+            "pages": page_count,
+            "pages_extracted": min(page_count, page_budget) if page_budget else page_count,
+            "truncated": bool(page_budget) and page_count > page_budget,
+            "extraction_method": method_used,
+            "extraction_status": status,
+            "extraction_time_seconds": engine_times[method_used],
+            "engine_order": self.engine_order,
+            "engine_times": engine_times
+        }
+    
+    def uses_pdftotext(self, enable_fallback: bool = True) -> bool:
+        """Whether the configured engines include pdftotext and it is installed"""
+        if PDFTOTEXT_PATH is None:
+            return False
+        primary_engines, fallback_engines = self._engine_plan()
+        return "pdftotext" in primary_engines or (enable_fallback and "pdftotext" in fallback_engines)
+    
+    def _engine_plan(self) -> Tuple[List[str], List[str]]:
+        """
+        Primary and fallback engines for the configured engine order
+        
+        In auto mode PyMuPDF (if installed) is the primary engine, with pdfminer
+        taking over when its text quality is poor. With an explicit order the
+        first engine is primary and the rest are fallbacks. pdftotext is always
+        the last fallback.
+        """
+        if self.engine_order == "auto":
+            primary = ["pymupdf", "pdfminer"] if _pymupdf_available() else ["pdfminer"]
+        else:
+            engines = [engine for engine in self.engine_order.split(",") if engine]
+            primary = engines[:1]
+            fallback = engines[1:]
+            if "pdftotext" not in engines:
+                fallback.append("pdftotext")
+            return primary, fallback
+        
+        return primary, ["pdftotext"]
+    
+    def _run_engine(self, engine: str, file_content: bytes, engine_times: Dict[str, float],
+                    max_pages: int = 0) -> Tuple[str, Optional[str]]:
+        """
+        Run one extraction engine on the first max_pages pages (0 for all) and record its time
+        
+        Returns:
+            Tuple of (extracted text or "", error message or None)
+        """
+        start = time.time()
+        try:
+            if engine == "pymupdf":
+                text = self._extract_with_pymupdf(file_content, max_pages)
+            elif engine == "pdfminer":
+                text = extract_text(BytesIO(file_content), maxpages=max_pages)
             else:
-                logger.warning("PyMuPDF extraction returned empty text")
-                text = ""
+                text = self._extract_with_pdftotext(file_content, max_pages)
+            error = None
         except ImportError:
-            logger.warning("PyMuPDF not available, skipping this fallback method")
+            logger.warning(f"{engine} not available, skipping this method")
+            text, error = "", None
+        except PDFSyntaxError as e:
+            text, error = "", f"PDF syntax error: {str(e)}"
+            logger.error(error)
+        except MemoryError:
+            # Over the worker memory limit; the worker must be replaced
+            raise
         except Exception as e:
-            logger.warning(f"PyMuPDF extraction failed: {str(e)}")
-            text = ""
+            text, error = "", f"Error extracting text from PDF: {str(e)}"
+            logger.warning(f"{engine} extraction failed: {str(e)}")
+        finally:
+            engine_times[engine] = round(time.time() - start, 4)
         
-        # Try Fallback Method 2: pdftotext command line tool (if available)
-        if not text:
+        if not text or len(text.strip()) == 0:
+            return "", error
+        return text, None
+    
+    def _extract_with_pymupdf(self, file_content: bytes, max_pages: int = 0) -> str:
+        """Extract text with PyMuPDF (raises ImportError if it is not installed)"""
+        import fitz  # PyMuPDF
+        
+        text = ""
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            page_limit = min(max_pages, doc.page_count) if max_pages else doc.page_count
+            for page_number in range(page_limit):
+                text += doc[page_number].get_text()
+        finally:
+            doc.close()
+        return text
+    
+    def count_pages(self, file_content: bytes) -> Optional[int]:
+        """
+        Number of pages from the PDF structure, without extracting any text
+        
+        Returns:
+            Page count, or None if the PDF cannot be parsed
+        """
+        try:
+            import fitz  # PyMuPDF
+            doc = fitz.open(stream=file_content, filetype="pdf")
             try:
-                # Check if pdftotext is available
-                check_cmd = "where pdftotext" if platform.system() == "Windows" else "which pdftotext"
-                subprocess.check_output(check_cmd, shell=True)
-                
-                logger.info("Trying fallback extraction with pdftotext command line tool...")
-                
-                # Create a temporary file for the text output
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as temp_file:
-                    temp_output_path = temp_file.name
-                
-                # Run pdftotext command
-                cmd = f"pdftotext -layout \"{file_path}\" \"{temp_output_path}\""
-                subprocess.run(cmd, shell=True, check=True)
-                
-                # Read the extracted text
-                with open(temp_output_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
-                
-                # Clean up
-                os.unlink(temp_output_path)
-                
-                if text and len(text.strip()) > 0:
-                    method_used = "pdftotext"
-                    logger.info(f"Successfully extracted {len(text)} characters with pdftotext")
+                return doc.page_count
+            finally:
+                doc.close()
+        except ImportError:
+            pass
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"PyMuPDF could not count pages: {str(e)}")
+            return None
+        
+        try:
+            # The page tree root holds the total count
+            document = PDFDocument(PDFParser(BytesIO(file_content)))
+            count = resolve1(resolve1(document.catalog["Pages"]).get("Count"))
+            if isinstance(count, int) and count > 0:
+                return count
+            return sum(1 for _ in PDFPage.create_pages(document))
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"pdfminer could not count pages: {str(e)}")
+            return None
+    
+    def extract_page_range(self, file_content: bytes, start: int, end: int) -> Dict[str, Any]:
+        """
+        Extract the text of pages [start, end) one page at a time
+        
+        Used by the page-parallel mode, which runs several ranges of a long PDF
+        on different worker processes. The engine is chosen for the range as in
+        extract_text_from_bytes; ranges after the first do not need a section
+        header to pass the auto-mode quality check.
+        
+        Returns:
+            {"start", "engine", "page_texts", "page_times"}; page_texts is empty
+            if no engine extracted any text
+        """
+        primary_engines, _ = self._engine_plan()
+        primary_engines = [engine for engine in primary_engines if engine != "pdftotext"]
+        
+        result = {"start": start, "engine": "", "page_texts": [], "page_times": []}
+        for index, engine in enumerate(primary_engines):
+            try:
+                if engine == "pymupdf":
+                    page_texts, page_times = self._pymupdf_pages(file_content, start, end)
                 else:
-                    logger.warning("pdftotext extraction returned empty text")
-                    text = ""
-            except (subprocess.SubprocessError, FileNotFoundError):
-                logger.warning("pdftotext command line tool not available or failed")
-                text = ""
+                    page_texts, page_times = self._pdfminer_pages(file_content, start, end)
+            except MemoryError:
+                raise
             except Exception as e:
-                logger.warning(f"pdftotext extraction failed: {str(e)}")
-                text = ""
-        
-        # If we have text from any method, return success
-        if text and len(text.strip()) > 0:
-            # Create metadata
-            metadata = {
-                "file_name": os.path.basename(file_path),
-                "file_size_mb": file_size,
-                "text_length": len(text),
-                "pages": self._estimate_page_count(text),
-                "extraction_method": method_used,
-                "extraction_status": "fallback"
-            }
+                logger.warning(f"{engine} failed on pages {start}-{end - 1}: {str(e)}")
+                continue
+            
+            text = "".join(page_texts)
+            if not text.strip():
+                continue
+            
+            is_last = index == len(primary_engines) - 1
+            if (self.engine_order == "auto" and not is_last and
+                    not self._is_good_quality(text, require_section_header=start == 0)):
+                continue
             
-            return True, text, metadata
+            result.update(engine=engine, page_texts=page_texts, page_times=page_times)
+            break
         
-        # All fallback methods failed
-        return False, "Failed to extract text using all available methods", None
+        return result
     
-    def extract_text_from_upload(self, file_content: bytes, filename: str, enable_fallback: bool = True) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    def _pymupdf_pages(self, file_content: bytes, start: int, end: int) -> Tuple[List[str], List[float]]:
+        """Per-page PyMuPDF text and time for pages [start, end)"""
+        import fitz  # PyMuPDF
+        
+        page_texts, page_times = [], []
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            for page_number in range(start, min(end, doc.page_count)):
+                page_start = time.time()
+                page_texts.append(doc[page_number].get_text())
+                page_times.append(round(time.time() - page_start, 4))
+        finally:
+            doc.close()
+        return page_texts, page_times
+    
+    def _pdfminer_pages(self, file_content: bytes, start: int, end: int) -> Tuple[List[str], List[float]]:
+        """
+        Per-page pdfminer text and time for pages [start, end)
+        
+        Uses the same converter and layout parameters as pdfminer's extract_text,
+        so joining the pages gives the same text as extracting the whole file.
+        """
+        page_texts, page_times = [], []
+        resource_manager = PDFResourceManager(caching=True)
+        laparams = LAParams()
+        
+        for page in PDFPage.get_pages(BytesIO(file_content), pagenos=set(range(start, end))):
+            page_start = time.time()
+            with StringIO() as output:
+                device = TextConverter(resource_manager, output, laparams=laparams)
+                PDFPageInterpreter(resource_manager, device).process_page(page)
+                device.close()
+                page_texts.append(output.getvalue())
+            page_times.append(round(time.time() - page_start, 4))
+        
+        return page_texts, page_times
+    
+    def combine_page_ranges(self, ranges: List[Dict[str, Any]], file_name: str, file_size: float,
+                            page_count: int, elapsed: float,
+                            pages_extracted: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """
+        Reassemble the results of extract_page_range in page order
+        
+        Args:
+            ranges: Results of extract_page_range covering the extracted pages
+            file_name: Name of the file
+            file_size: File size in MB
+            page_count: Number of pages in the PDF
+            elapsed: Wall-clock time of the parallel extraction
+            pages_extracted: Number of pages the ranges cover (default: all pages)
+            
+        Returns:
+            Same as extract_text_from_bytes; fails if any range extracted no text
+        """
+        ranges = sorted(ranges, key=lambda item: item["start"])
+        if any(not item["page_texts"] for item in ranges):
+            return False, "No text could be extracted from some pages", None
+        
+        text = "".join(page_text for item in ranges for page_text in item["page_texts"])
+        engines = sorted({item["engine"] for item in ranges})
+        engine_times: Dict[str, float] = {}
+        for item in ranges:
+            engine_times[item["engine"]] = round(engine_times.get(item["engine"], 0.0) + sum(item["page_times"]), 4)
+        
+        metadata = {
+            "file_name": file_name,
+            "file_size_mb": file_size,
+            "text_length": len(text),
+            "pages": page_count,
+            "pages_extracted": pages_extracted or page_count,
+            "truncated": (pages_extracted or page_count) < page_count,
+            "extraction_method": "+".join(engines),
+            "extraction_status": "success",
+            "extraction_time_seconds": round(elapsed, 4),
+            "engine_order": self.engine_order,
+            "engine_times": engine_times,
+            "page_parallel": True,
+            "page_ranges": len(ranges),
+            "page_times": [page_time for item in ranges for page_time in item["page_times"]]
+        }
+        
+        return True, text, metadata
+    
+    def _is_good_quality(self, text: str, require_section_header: bool = True) -> bool:
+        """
+        Cheap check whether extracted text is usable as-is
+        
+        The text must be mostly printable (broken font maps produce control and
+        replacement characters) and, if required, contain at least one common
+        resume section header.
+        """
+        non_space = [char for char in text if not char.isspace()]
+        if not non_space:
+            return False
+        
+        printable = sum(1 for char in non_space if char.isprintable() and char != "\ufffd")
+        if printable / len(non_space) < AUTO_MIN_PRINTABLE_RATIO:
+            return False
+        
+        return not require_section_header or SECTION_HEADER_PATTERN.search(text) is not None
+    
+    def _extract_with_pdftotext(self, file_content: bytes, max_pages: int = 0) -> str:
+        """
+        Extract text from the first max_pages pages (0 for all) with the pdftotext command line tool
+        
+        The PDF is piped to stdin and the text read from stdout, without a shell
+        or temporary files.
+        
+        Returns:
+            Extracted text, or "" if the tool is unavailable or failed
+        """
+        if PDFTOTEXT_PATH is None:
+            logger.warning("pdftotext command line tool not available")
+            return ""
+        
+        logger.info("Trying fallback extraction with pdftotext command line tool...")
+        try:
+            result = subprocess.run(
+                _pdftotext_command(max_pages), input=file_content, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, check=True, timeout=PDFTOTEXT_TIMEOUT_SECONDS or None
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"pdftotext exceeded {PDFTOTEXT_TIMEOUT_SECONDS:g}s and was killed")
+            return ""
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(f"pdftotext extraction failed: {str(e)}")
+            return ""
+        
+        return self._pdftotext_output(result.stdout)
+    
+    async def extract_with_pdftotext_async(self, file_content: bytes, max_pages: int = 0) -> str:
+        """
+        Async version of _extract_with_pdftotext for the API event loop
+        
+        pdftotext runs as an asyncio subprocess, so any number of extractions
+        can run at once without blocking the loop or using a worker. The PDF is
+        written to stdin while stdout is read, so neither pipe fills up.
+        
+        Returns:
+            Extracted text, or "" if the tool is unavailable or failed
+        """
+        if PDFTOTEXT_PATH is None:
+            logger.warning("pdftotext command line tool not available")
+            return ""
+        
+        logger.info("Trying fallback extraction with pdftotext command line tool...")
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *_pdftotext_command(max_pages),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except OSError as e:
+            logger.warning(f"pdftotext extraction failed: {str(e)}")
+            return ""
+        
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(file_content), PDFTOTEXT_TIMEOUT_SECONDS or None)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.warning(f"pdftotext exceeded {PDFTOTEXT_TIMEOUT_SECONDS:g}s and was killed")
+            return ""
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+        
+        if process.returncode != 0:
+            logger.warning(f"pdftotext exited with code {process.returncode}")
+            return ""
+        return self._pdftotext_output(stdout)
+    
+    def _pdftotext_output(self, stdout: bytes) -> str:
+        """Decode pdftotext output, "" if it is empty"""
+        text = stdout.decode("utf-8", errors="ignore")
+        if text.strip():
+            logger.info(f"Successfully extracted {len(text)} characters with pdftotext")
+            return text
+        
+        logger.warning("pdftotext extraction returned empty text")
+        return ""
+    
+    def extract_text_from_upload(self, file_content: bytes, filename: str, enable_fallback: bool = True,
+                                 max_pages: Optional[int] = None, include_pdftotext: bool = True,
+                                 page_count: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
         Extract text from uploaded PDF file content
         
+        The content is parsed from memory, without writing it to disk.
+        
         Args:
             file_content: Binary content of the uploaded file
             filename: Original filename
             enable_fallback: Whether to try fallback methods if primary extraction fails
+            max_pages: Page budget for this file (default: the service's page_budget)
+            include_pdftotext: Whether to try pdftotext (see extract_text_from_bytes)
+            page_count: Page count already read (see extract_text_from_bytes)
             
         Returns:
             Tuple containing:
@@ -209,37 +617,28 @@ class EnhancedTextExtractionService:
             logger.error(error_msg)
             return False, error_msg, None
         
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            try:
-                # Write content to temporary file
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-                
-                # Extract text from the temporary file
-                success, text_or_error, metadata = self.extract_text_from_pdf(temp_file_path, enable_fallback)
-                
-                # If successful, add original filename to metadata
-                if success and metadata:
-                    metadata["original_filename"] = filename
-                
-                return success, text_or_error, metadata
-                
-            except Exception as e:
-                error_msg = f"Error processing uploaded file: {str(e)}"
-                logger.error(error_msg)
-                return False, error_msg, None
-            finally:
-                # Clean up the temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+        try:
+            success, text_or_error, metadata = self.extract_text_from_bytes(
+                file_content, filename, enable_fallback, max_pages, include_pdftotext, page_count
+            )
+            
+            # If successful, add original filename to metadata
+            if success and metadata:
+                metadata["original_filename"] = filename
+            
+            return success, text_or_error, metadata
+            
+        except MemoryError:
+            raise
+        except Exception as e:
+            error_msg = f"Error processing uploaded file: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg, None
     
     def _estimate_page_count(self, text: str) -> int:
         """
         Estimate the number of pages in the PDF based on text content
-        This is a rough estimate as pdfminer.six extract_text doesn't provide page info directly
+        Only used when the page count cannot be read from the PDF structure
         
         Args:
             text: Extracted text
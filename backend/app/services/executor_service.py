@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.services.supervised_pool import SupervisedProcessPool, JobTimeoutError
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Services used inside worker processes, created on first use in each process
+_worker_services: Dict[str, Any] = {}
+
+def _get_worker_service(name: str):
+    """Get (or create) the service instance for the current worker process"""
+    if name not in _worker_services:
+        if name == "extraction":
+            from app.services.enhanced_text_extraction import EnhancedTextExtractionService
+            _worker_services[name] = EnhancedTextExtractionService()
+        elif name == "qwen":
+            from app.services.qwen_processing import QwenProcessingService
+            _worker_services[name] = QwenProcessingService()
+        else:
+            raise ValueError(f"Unknown worker service: {name}")
+    return _worker_services[name]
+
+def extract_text_job(file_content: bytes, filename: str, enable_fallback: bool = True,
+                     include_pdftotext: bool = True, split_threshold: int = 0,
+                     page_count: Optional[int] = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """
+    Worker job: extract text from uploaded PDF content (pdfminer/PyMuPDF)
+
+    The page tree is parsed once per job. With a split_threshold, a PDF with at
+    least that many pages to extract (after the page budget) is not extracted;
+    the job returns (False, "", {"split_pages": page count}) so the caller can
+    split it into extract_page_range_job ranges. A page_count the caller
+    already has is used instead of counting again.
+    """
+    service = _get_worker_service("extraction")
+    if page_count is None and filename.lower().endswith('.pdf'):
+        page_count = service.count_pages(file_content)
+    if split_threshold > 0 and page_count:
+        pages_to_extract = min(page_count, service.page_budget) if service.page_budget else page_count
+        if pages_to_extract >= split_threshold:
+            return False, "", {"split_pages": page_count}
+    return service.extract_text_from_upload(
+        file_content, filename, enable_fallback, include_pdftotext=include_pdftotext, page_count=page_count
+    )
+
+def extract_page_range_job(file_content: bytes, start: int, end: int) -> Dict[str, Any]:
+    """Worker job: extract the text of pages [start, end) of a PDF"""
+    return _get_worker_service("extraction").extract_page_range(file_content, start, end)
+
+def extract_candidate_info_job(resume_text: str) -> Dict[str, Any]:
+    """Worker job: regex-based candidate information extraction"""
+    return _get_worker_service("qwen").extract_candidate_info(resume_text)
+
+class ExecutorService:
+    """
+    Runs blocking work off the asyncio event loop
+
+    Three pools are available:
+    - a thread pool for I/O-bound calls (Supabase requests) and model inference,
+      which needs the models loaded in this process
+    - a process pool for CPU-bound pure-Python work (the regex extraction),
+      which would otherwise hold the GIL
+    - a supervised process pool for parsing untrusted files (PDF extraction),
+      where each job has a wall-clock limit and workers have a memory limit
+    """
+
+    def __init__(self, thread_workers: Optional[int] = None, process_workers: Optional[int] = None,
+                 use_processes: Optional[bool] = None, isolated_workers: Optional[int] = None,
+                 isolated_memory_limit_mb: Optional[int] = None):
+        """
+        Initialize the executor service
+
+        Args:
+            thread_workers: Size of the thread pool (default: EXECUTOR_THREAD_WORKERS)
+            process_workers: Size of the process pool (default: EXECUTOR_PROCESS_WORKERS)
+            use_processes: Whether CPU-bound jobs use processes (default: EXECUTOR_USE_PROCESSES)
+            isolated_workers: Size of the supervised pool (default: EXECUTOR_ISOLATED_WORKERS,
+                or process_workers)
+            isolated_memory_limit_mb: Memory limit of each supervised worker, 0 for none
+                (default: EXECUTOR_ISOLATED_MEMORY_LIMIT_MB)
+        """
+        cpu_count = os.cpu_count() or 1
+
+        if thread_workers is None:
+            thread_workers = int(os.getenv("EXECUTOR_THREAD_WORKERS", str(min(32, cpu_count + 4))))
+        if process_workers is None:
+            process_workers = int(os.getenv("EXECUTOR_PROCESS_WORKERS", str(cpu_count)))
+        if use_processes is None:
+            use_processes = os.getenv("EXECUTOR_USE_PROCESSES", "true").lower() in ("1", "true", "yes")
+        if isolated_workers is None:
+            isolated_workers = int(os.getenv("EXECUTOR_ISOLATED_WORKERS", str(process_workers)))
+        if isolated_memory_limit_mb is None:
+            isolated_memory_limit_mb = int(os.getenv("EXECUTOR_ISOLATED_MEMORY_LIMIT_MB", "1024"))
+
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(1, process_workers)
+        self.use_processes = use_processes
+        self.isolated_workers = max(1, isolated_workers)
+
+        self._thread_pool = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="executor")
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
+        # Worker processes are only started on first use
+        self._isolated_pool = (
+            SupervisedProcessPool(self.isolated_workers, isolated_memory_limit_mb) if use_processes else None
+        )
+
+        logger.info(f"ExecutorService initialized with {self.thread_workers} threads, "
+                    f"{self.process_workers if use_processes else 0} processes")
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Create the process pool on first use"""
+        if not self.use_processes:
+            return None
+
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                try:
+                    # Spawn keeps the workers independent of the threads and
+                    # model state of the API process
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                except Exception as e:
+                    logger.error(f"Error creating process pool, falling back to threads: {str(e)}")
+                    self.use_processes = False
+                    return None
+            return self._process_pool
+
+    def _reset_process_pool(self, pool: ProcessPoolExecutor):
+        """Discard a broken process pool so the next call creates a new one"""
+        with self._process_pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+        pool.shutdown(wait=False)
+
+    async def run_in_thread(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the thread pool
+
+        Args:
+            func: Function to run
+            *args, **kwargs: Arguments for the function
+
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, partial(func, *args, **kwargs))
+
+    async def run_in_process(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound function on the process pool
+
+        The function and its arguments must be picklable (use the module-level
+        *_job functions). Falls back to the thread pool if processes are
+        disabled or unavailable.
+
+        Args:
+            func: Module-level function to run
+            *args, **kwargs: Arguments for the function
+
+        Returns:
+            The function's return value
+        """
+        pool = self._get_process_pool()
+        if pool is None:
+            return await self.run_in_thread(func, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(pool, partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS); replace the pool and retry once
+            logger.error("Process pool is broken, recreating it")
+            self._reset_process_pool(pool)
+            pool = self._get_process_pool()
+            if pool is None:
+                return await self.run_in_thread(func, *args, **kwargs)
+            return await loop.run_in_executor(pool, partial(func, *args, **kwargs))
+
+    async def run_isolated(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a function on the supervised pool with a wall-clock limit
+
+        A job that overruns is stopped by killing its worker process, which is
+        replaced on next use. If processes are disabled the job runs on the
+        thread pool: the caller still gets the timeout, but the thread keeps
+        running until the job ends.
+
+        Args:
+            func: Module-level function to run
+            *args, **kwargs: Arguments for the function
+            timeout: Wall-clock limit in seconds, None for no limit
+
+        Returns:
+            The function's return value
+
+        Raises:
+            JobTimeoutError: The job exceeded the timeout
+            WorkerCrashedError: The worker died while running the job
+            WorkerMemoryError: The job exceeded the memory limit
+            RuntimeError: The function raised an exception
+        """
+        if self._isolated_pool is None:
+            try:
+                return await asyncio.wait_for(self.run_in_thread(func, *args, **kwargs), timeout)
+            except asyncio.TimeoutError:
+                raise JobTimeoutError(f"Job exceeded {timeout}s")
+
+        return await self._isolated_pool.run(func, *args, timeout=timeout, **kwargs)
+
+    def isolated_stats(self) -> Optional[Dict[str, Any]]:
+        """Worker and failure counters of the supervised pool, None if processes are disabled"""
+        return self._isolated_pool.stats() if self._isolated_pool is not None else None
+
+    def shutdown(self):
+        """Shut down all pools"""
+        logger.info("Shutting down executor pools")
+        self._thread_pool.shutdown(wait=False)
+        if self._isolated_pool is not None:
+            self._isolated_pool.shutdown()
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
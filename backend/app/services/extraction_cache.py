@@ -0,0 +1,142 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+class ExtractionCache:
+    """
+    Cache of extracted resume text keyed by the SHA-256 of the file content
+
+    Entries live in a bounded in-memory LRU tier and, if a directory is
+    configured, in an on-disk tier that survives restarts and is shared by all
+    workers using the same directory. Only successful extractions are cached.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Number of extractions kept in memory (default: EXTRACTION_CACHE_SIZE)
+            cache_dir: Directory of the on-disk tier (default: EXTRACTION_CACHE_DIR, disabled if unset)
+        """
+        if max_entries is None:
+            max_entries = int(os.getenv("EXTRACTION_CACHE_SIZE", "256"))
+        if cache_dir is None:
+            cache_dir = os.getenv("EXTRACTION_CACHE_DIR") or None
+
+        self.max_entries = max(0, max_entries)
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(file_content: bytes, **options) -> str:
+        """Cache key for file content extracted with the given options"""
+        digest = hashlib.sha256(file_content).hexdigest()
+        if not options:
+            return digest
+        options_json = json.dumps(options, sort_keys=True)
+        return hashlib.sha256(f"{digest}\0{options_json}".encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, text: str, metadata: Dict[str, Any]):
+        """Store an entry in the memory tier, evicting the least recently used"""
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = (text, metadata)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any], str]]:
+        """
+        Look up an extraction, first in memory and then on disk
+
+        Reading the disk tier blocks; call it off the event loop when
+        cache_dir is set.
+
+        Returns:
+            (text, metadata copy, tier) where tier is "memory" or "disk", or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0], dict(entry[1]), "memory"
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                text, metadata = data["text"], data["metadata"]
+                self._remember(key, text, metadata)
+                with self._lock:
+                    self.disk_hits += 1
+                return text, dict(metadata), "disk"
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not read extraction cache entry {key}: {str(e)}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, text: str, metadata: Dict[str, Any]):
+        """
+        Store a successful extraction in both tiers
+
+        Writing the disk tier blocks; call it off the event loop when
+        cache_dir is set.
+        """
+        metadata = dict(metadata)
+        self._remember(key, text, metadata)
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write to a temporary file first so readers never see a partial entry
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({"text": text, "metadata": metadata}, f)
+                os.replace(temp_path, path)
+            except Exception as e:
+                logger.warning(f"Could not write extraction cache entry {key}: {str(e)}")
+
+    def clear(self):
+        """Remove all entries from the memory tier"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "diskEnabled": bool(self.cache_dir),
+                "memoryHits": self.memory_hits,
+                "diskHits": self.disk_hits,
+                "misses": self.misses,
+                "hitRate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0
+            }
@@ -0,0 +1,111 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def job_description_digest(job_description: str) -> str:
+    """SHA-256 hex digest of the job description text"""
+    return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+
+@dataclass
+class JobProfile:
+    """
+    Parsed job description shared by every resume scored against it
+
+    Instances are cached and shared between requests and threads, so the lists
+    must be treated as read-only.
+    """
+    text: str
+    digest: str
+    skills: List[str] = field(default_factory=list)
+    education_requirements: List[str] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+    analysis_keywords: List[str] = field(default_factory=list)
+    required_years: List[int] = field(default_factory=list)
+    required_education_level: int = 0
+    soft_skills: List[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+
+class JobProfileCache:
+    """LRU cache of JobProfile objects keyed by job description hash, with a TTL"""
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of profiles kept (default: JOB_PROFILE_CACHE_SIZE)
+            ttl_seconds: Seconds before a profile is rebuilt (default: JOB_PROFILE_CACHE_TTL)
+        """
+        if max_size is None:
+            max_size = int(os.getenv("JOB_PROFILE_CACHE_SIZE", "128"))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("JOB_PROFILE_CACHE_TTL", "3600"))
+
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._profiles: "OrderedDict[str, JobProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, job_description: str, factory: Callable[[str, str], JobProfile]) -> JobProfile:
+        """
+        Get the cached profile for a job description, building it if needed
+
+        Args:
+            job_description: Job description text
+            factory: Function building a JobProfile from (text, digest)
+
+        Returns:
+            JobProfile for the job description
+        """
+        digest = job_description_digest(job_description)
+        now = time.time()
+
+        with self._lock:
+            profile = self._profiles.get(digest)
+            if profile is not None and (self.ttl_seconds <= 0 or now - profile.created_at < self.ttl_seconds):
+                self._profiles.move_to_end(digest)
+                self.hits += 1
+                return profile
+            self.misses += 1
+
+        # Build outside the lock; two threads racing on the same new job
+        # description both build it, which is harmless
+        profile = factory(job_description, digest)
+
+        with self._lock:
+            self._profiles[digest] = profile
+            self._profiles.move_to_end(digest)
+            while len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+
+        return profile
+
+    def clear(self):
+        """Remove all cached profiles"""
+        with self._lock:
+            self._profiles.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            return {
+                "size": len(self._profiles),
+                "maxSize": self.max_size,
+                "ttlSeconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -0,0 +1,124 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident memory of this process, or None where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _tensor_bytes(model: Any) -> Optional[int]:
+    """Size of the parameters and buffers of a torch module, or None for other objects"""
+    if not hasattr(model, "parameters"):
+        return None
+    try:
+        total = sum(p.numel() * p.element_size() for p in model.parameters())
+        if hasattr(model, "buffers"):
+            total += sum(b.numel() * b.element_size() for b in model.buffers())
+        return total
+    except Exception:
+        return None
+
+class ModelRegistry:
+    """
+    Loads each named model once per process and hands out shared references
+
+    Services ask the registry for a model instead of constructing it, so a model
+    used by several services (e.g. the sentence transformer used for scoring and
+    name extraction) is only held in memory once. Loading is thread-safe; two
+    threads asking for the same model wait for a single load.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._models: Dict[str, Any] = {}
+        self._info: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Lock serializing the load of one model"""
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Get a shared model, loading it on first use
+
+        Args:
+            key: Registry name of the model
+            loader: Function constructing the model
+
+        Returns:
+            The shared model instance
+        """
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._key_lock(key):
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            logger.info(f"Loading model: {key}")
+            rss_before = _current_rss_bytes()
+            start = time.time()
+            model = loader()
+            load_time = time.time() - start
+            rss_after = _current_rss_bytes()
+
+            self._info[key] = {
+                "loadTimeSeconds": round(load_time, 3),
+                "parameterBytes": _tensor_bytes(model),
+                "rssDeltaBytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+                "loadedAt": time.time()
+            }
+            self._models[key] = model
+            logger.info(f"Loaded model {key} in {load_time:.2f}s")
+            return model
+
+    def get_sentence_transformer(self, model_name: str) -> Any:
+        """
+        Get the shared SentenceTransformer for a model name
+
+        Args:
+            model_name: Name or path of the sentence-transformers model
+
+        Returns:
+            SentenceTransformer instance
+        """
+        def load():
+            from sentence_transformers import SentenceTransformer
+            return SentenceTransformer(model_name)
+
+        return self.get(f"sentence-transformer:{model_name}", load)
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether a model has been loaded in this process"""
+        return key in self._models
+
+    def stats(self) -> Dict[str, Any]:
+        """Load time and memory of every loaded model"""
+        models = {key: dict(info) for key, info in list(self._info.items())}
+        return {
+            "models": models,
+            "processRssBytes": _current_rss_bytes()
+        }
+
+# Registry shared by all services of this process
+model_registry = ModelRegistry()
@@ -5,6 +5,17 @@ import re
 import numpy as np
 from typing import Dict, List, Any, Tuple, Set
 
+from app.services.skill_matcher import SkillMatcher
+from app.services.skill_taxonomy import skill_taxonomy
+
+# Education related keywords
+EDUCATION_KEYWORDS = [
+    "bachelor", "master", "phd", "doctorate", "degree", "bs", "ms", "ba", "ma",
+    "computer science", "engineering", "information technology", "it", "software engineering"
+]
+
+EDUCATION_MATCHER = SkillMatcher({"education": EDUCATION_KEYWORDS})
+
 class NLPAnalysisService:
     """Service for analyzing resumes against job descriptions using NLP"""
     
@@ -118,32 +129,14 @@ class NLPAnalysisService:
                 if clean_phrase and not self._is_common_word(clean_phrase):
                     keywords.append(clean_phrase)
         
-        # Add technical terms, programming languages, tools, etc.
-        tech_patterns = [
-            "python", "java", "javascript", "c\\+\\+", "typescript", "react", 
-            "angular", "vue", "node\\.js", "express", "django", "flask", "spring", 
-            "docker", "kubernetes", "aws", "azure", "gcp", "sql", "nosql", 
-            "mongodb", "postgresql", "mysql", "git", "github", "gitlab", "ci/cd",
-            "agile", "scrum", "kanban", "jira", "confluence", "machine learning",
-            "deep learning", "ai", "artificial intelligence", "data science",
-            "data analysis", "big data", "hadoop", "spark", "tableau", "power bi",
-            "excel", "word", "powerpoint", "photoshop", "illustrator", "figma",
-            "sketch", "adobe", "ui", "ux", "user interface", "user experience",
-            "frontend", "backend", "full stack", "devops", "sre", "security",
-            "testing", "qa", "quality assurance", "automation", "rest", "api",
-            "graphql", "microservices", "serverless", "cloud", "linux", "unix",
-            "windows", "macos", "ios", "android", "mobile", "web", "desktop"
-        ]
-        
-        # Find technical terms in text
-        for pattern in tech_patterns:
-            matches = re.finditer(r'\b' + pattern + r'\b', text.lower())
-            for match in matches:
-                keywords.append(match.group(0))
+        # Add technical terms, programming languages, tools, etc. (canonical names in lower case)
+        taxonomy_skills = skill_taxonomy.current().find_skills(text, include_general=True)
+        keywords.extend(skill.name.lower() for skill in taxonomy_skills)
         
         # Check for predefined multi-word phrases
+        text_lower = text.lower()
         for phrase in self.skill_phrases:
-            if phrase.lower() in text.lower():
+            if phrase.lower() in text_lower:
                 keywords.append(phrase)
         
         # Extract years of experience patterns
@@ -155,20 +148,13 @@ class NLPAnalysisService:
         ]
         
         for pattern in experience_patterns:
-            matches = re.finditer(pattern, text.lower())
+            matches = re.finditer(pattern, text_lower)
             for match in matches:
                 if match.group(1):
                     keywords.append(f"{match.group(1)} years experience")
         
-        # Extract education related keywords
-        education_keywords = [
-            "bachelor", "master", "phd", "doctorate", "degree", "bs", "ms", "ba", "ma",
-            "computer science", "engineering", "information technology", "it", "software engineering"
-        ]
-        
-        for keyword in education_keywords:
-            if re.search(r'\b' + keyword + r'\b', text.lower()):
-                keywords.append(keyword)
+        # Add education related keywords
+        keywords.extend(EDUCATION_MATCHER.found_terms(text).get("education", ()))
         
         # Filter out common words and very short terms
         filtered_keywords = []
@@ -267,7 +253,8 @@ class NLPAnalysisService:
         if self.has_vectors:
             similar_keywords = self.find_semantically_similar_keywords(resume_keywords, job_keywords)
             # Remove any that are already in matched_keywords
-            similar_keywords = [kw for kw in similar_keywords if kw.lower() not in [m.lower() for m in matched_keywords]]
+            matched_lower = {m.lower() for m in matched_keywords}
+            similar_keywords = [kw for kw in similar_keywords if kw.lower() not in matched_lower]
         
         # Calculate keyword match percentage
         if job_keywords:
@@ -327,38 +314,62 @@ class NLPAnalysisService:
         if not self.has_vectors:
             return []  # Return empty list if no word vectors available
         
-        similar_keywords = []
+        # Skip resume keywords that are already exact matches
+        job_keywords_lower = {jk.lower() for jk in job_keywords}
+        candidates = [kw for kw in resume_keywords if kw.lower() not in job_keywords_lower]
+        if not candidates or not job_keywords:
+            return []
+        
+        # One vector per distinct keyword; keywords without vectors are skipped
+        resume_texts, resume_matrix, resume_norms, resume_tokens = self._keyword_vectors(candidates)
+        job_texts, job_matrix, job_norms, job_tokens = self._keyword_vectors(job_keywords)
+        if not resume_texts or not job_texts:
+            return []
+        
+        # Cosine similarity of every resume keyword with every job keyword at once,
+        # computed as Doc.similarity does, then masked by the threshold
+        similarity = (resume_matrix @ job_matrix.T) / np.outer(resume_norms, job_norms)
+        is_similar = (similarity >= threshold).any(axis=1)
+        
+        # Like spaCy's Doc.similarity, keywords with the same tokens count as similarity 1.0
+        if threshold <= 1.0:
+            job_token_set = set(job_tokens)
+            is_similar |= np.array([tokens in job_token_set for tokens in resume_tokens])
+        
+        similar = {kw for kw, match in zip(resume_texts, is_similar) if match}
+        return [kw for kw in resume_keywords if kw in similar]
+    
+    def _keyword_vectors(self, keywords: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray, List[Tuple[int, ...]]]:
+        """
+        Word vectors of keywords, computed once per distinct keyword
         
-        # Process each resume keyword
-        for resume_kw in resume_keywords:
-            # Skip if it's already an exact match
-            if resume_kw.lower() in [jk.lower() for jk in job_keywords]:
-                continue
-                
-            # Process with spaCy to get vector
-            resume_kw_doc = self.nlp(resume_kw)
+        Keywords are only tokenized (no tagger or parser), which is all their
+        average word vector needs.
+        
+        Args:
+            keywords: Keywords, possibly repeated
             
-            # Skip words without vectors
-            if not resume_kw_doc.vector_norm:
+        Returns:
+            Tuple of (keywords with a vector, matrix of their vectors one per row,
+            vector norms, token IDs of each keyword)
+        """
+        texts = []
+        vectors = []
+        norms = []
+        tokens = []
+        for keyword in dict.fromkeys(keywords):
+            doc = self.nlp.make_doc(keyword)
+            norm = doc.vector_norm
+            if not norm:
                 continue
-            
-            # Check similarity against each job keyword
-            for job_kw in job_keywords:
-                job_kw_doc = self.nlp(job_kw)
-                
-                # Skip words without vectors
-                if not job_kw_doc.vector_norm:
-                    continue
-                
-                # Calculate similarity
-                similarity = resume_kw_doc.similarity(job_kw_doc)
-                
-                # If similarity is above threshold, consider it a match
-                if similarity >= threshold:
-                    similar_keywords.append(resume_kw)
-                    break  # No need to check other job keywords
-        
-        return similar_keywords
+            texts.append(keyword)
+            vectors.append(doc.vector)
+            norms.append(norm)
+            tokens.append(tuple(token.orth for token in doc))
+        
+        if not vectors:
+            return [], np.empty((0, 0), dtype=np.float32), np.empty(0), []
+        return texts, np.stack(vectors), np.array(norms), tokens
     
     def find_missing_keywords(self, resume_keywords: List[str], job_keywords: List[str]) -> List[str]:
         """Find important keywords from job description that are missing in resume"""
@@ -497,7 +508,8 @@ class NLPAnalysisService:
         if self.has_vectors:
             similar_keywords = self.find_semantically_similar_keywords(resume_keywords, job_keywords)
             # Remove any that are already in matched_keywords
-            similar_keywords = [kw for kw in similar_keywords if kw.lower() not in [m.lower() for m in matched_keywords]]
+            matched_lower = {m.lower() for m in matched_keywords}
+            similar_keywords = [kw for kw in similar_keywords if kw.lower() not in matched_lower]
         
         # Find missing keywords
         missing_keywords = self.find_missing_keywords(resume_keywords, job_keywords)
@@ -1,8 +1,9 @@
 import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from transformers import AutoTokenizer, pipeline
-import torch
+
+from app.services.skill_matcher import SkillMatcher
+from app.services.skill_taxonomy import skill_taxonomy
 
 # Configure logging
 logging.basicConfig(
@@ -11,6 +12,134 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# End of a section header: a colon, a line break or the end of the text
+SECTION_HEADER_END = r"(?:\s*:|$|\n)"
+
+# Header phrases of each section (upper case), tried in order; headers of
+# several sections can overlap, e.g. "SKILLS" inside "TECHNICAL SKILLS".
+# Includes specific Malaysian resume section names.
+SECTION_HEADERS = {
+    "summary": [r"SUMMARY", r"PROFESSIONAL\s+SUMMARY", r"PROFILE", r"OBJECTIVE", r"ABOUT\s+ME"],
+    "experience": [r"EXPERIENCE", r"WORK\s+EXPERIENCE", r"EMPLOYMENT", r"WORK\s+HISTORY", r"PROFESSIONAL\s+EXPERIENCE"],
+    "education": [r"EDUCATION", r"ACADEMIC\s+BACKGROUND", r"ACADEMIC\s+HISTORY", r"EDUCATIONAL\s+BACKGROUND"],
+    "skills": [r"SKILLS", r"SKILL\s+SET", r"SKILL\s+SUMMARY"],
+    "technical skills": [r"TECHNICAL\s+SKILLS", r"TECHNICAL\s+EXPERTISE", r"TECH\s+SKILLS", r"TECHNICAL\s+PROFICIENCIES"],
+    "academic projects": [r"ACADEMIC\s+PROJECTS", r"PERSONAL\s+PROJECTS", r"UNIVERSITY\s+PROJECTS", r"COURSE\s+PROJECTS",
+                          r"PROJECTS", r"PROJECT\s+EXPERIENCE"],
+    "extracurricular": [r"EXTRACURRICULAR", r"EXTRACURRICULAR\s+ACTIVITIES", r"CO-CURRICULAR", r"CO\-CURRICULAR\s+ACTIVITIES",
+                        r"ACTIVITIES", r"ACHIEVEMENTS\s+AND\s+ACTIVITIES"],
+    "certifications": [r"CERTIFICATIONS", r"CERTIFICATES", r"PROFESSIONAL\s+CERTIFICATIONS", r"ACCREDITATIONS"],
+    "achievements": [r"ACHIEVEMENTS", r"AWARDS", r"HONORS", r"RECOGNITIONS"],
+    "languages": [r"LANGUAGES", r"LANGUAGE\s+PROFICIENCY", r"LANGUAGE\s+SKILLS"],
+    "interests": [r"INTERESTS", r"HOBBIES", r"EXTRACURRICULAR\s+ACTIVITIES", r"ACTIVITIES"],
+    "volunteer": [r"VOLUNTEER", r"VOLUNTEERING", r"VOLUNTEER\s+EXPERIENCE", r"COMMUNITY\s+SERVICE"],
+    "references": [r"REFERENCES", r"PROFESSIONAL\s+REFERENCES"],
+    "publications": [r"PUBLICATIONS", r"PAPERS", r"RESEARCH\s+PAPERS", r"ARTICLES"],
+    "leadership": [r"LEADERSHIP", r"LEADERSHIP\s+EXPERIENCE", r"POSITIONS\s+OF\s+RESPONSIBILITY"],
+}
+
+# Header pattern of each section, matched against the upper-cased text
+SECTION_PATTERNS = {
+    name: "(?:" + "|".join(phrases) + ")" + SECTION_HEADER_END for name, phrases in SECTION_HEADERS.items()
+}
+SECTION_NAMES = list(SECTION_PATTERNS)
+
+# Block after a header line, per section and header, tried by extract_candidate_info
+# for sections the header scan missed
+SECTION_BLOCK_PATTERNS = {
+    section_key: [
+        re.compile(
+            r'(?:^|\n)\s*' + re.escape(header) + r'\s*(?:\n|\r\n)(.*?)(?=\n\s*[A-Z][A-Z\s]+\s*(?:\n|\r\n)|\Z)',
+            re.DOTALL | re.IGNORECASE
+        )
+        for header in headers
+    ]
+    for section_key, headers in {
+        'education': ['EDUCATION', 'ACADEMIC BACKGROUND', 'ACADEMIC HISTORY', 'EDUCATIONAL QUALIFICATIONS'],
+        'achievements': ['ACHIEVEMENTS', 'AWARDS', 'HONORS', 'ACCOMPLISHMENTS'],
+        'technical skills': ['TECHNICAL SKILLS', 'SKILLS', 'TECHNOLOGIES', 'TECHNICAL EXPERTISE'],
+        'academic projects': ['ACADEMIC PROJECTS', 'PROJECTS', 'PROJECT EXPERIENCE'],
+        'extracurricular': ['EXTRACURRICULAR', 'ACTIVITIES', 'EXTRACURRICULAR ACTIVITIES']
+    }.items()
+}
+
+# Last-resort searches of extract_candidate_info: (section, header search on the
+# upper-cased text, search for the content following the header)
+SECTION_HEADER_FALLBACKS = [
+    (section_key, re.compile(r'\b(?:' + headers + r')\b'),
+     re.compile(r'\b(?:' + headers + r')\b.*?\n(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)', re.DOTALL | re.IGNORECASE))
+    for section_key, headers in [
+        ('technical skills', r'TECHNICAL\s+SKILLS|TECH\s+SKILLS'),
+        ('academic projects', r'ACADEMIC\s+PROJECTS|PROJECTS|PROJECT\s+EXPERIENCE'),
+        ('extracurricular', r'EXTRACURRICULAR|EXTRA-?CURRICULAR|ACTIVITIES')
+    ]
+]
+
+# Technical skills header possibly garbled by OCR, and an all-caps section title line
+OCR_TECH_SKILLS_HEADER = re.compile(r'(?:TECHN|TECH).*(?:SKILL)')
+SECTION_TITLE_LINE = re.compile(r'^[A-Z][A-Z\s]+$')
+
+def _phrase_trie_pattern(phrases: List[str]) -> str:
+    """
+    Alternation of regex phrases factored by their common prefixes
+    
+    The phrases consist of literal characters and escapes such as \\s+. A
+    factored alternation rejects a position after a character or two, where a
+    flat one tries every phrase.
+    """
+    trie: Dict[str, Dict] = {}
+    for phrase in phrases:
+        node = trie
+        for token in re.findall(r"\\.\+?|.", phrase):
+            node = node.setdefault(token, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Dict]) -> str:
+        branches = [token + build(child) for token, child in node.items() if token]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    
+    return build(trie)
+
+# Single-pass scanner for all section headers: the leading lookahead finds the
+# positions where any header can start, then one optional lookahead group per
+# section (in SECTION_NAMES order) captures that section's header there
+SECTION_SCANNER = re.compile(
+    "(?=" + _phrase_trie_pattern([phrase for phrases in SECTION_HEADERS.values() for phrase in phrases])
+    + SECTION_HEADER_END + ")"
+    + "".join("(?:(?=(" + pattern + "))|)" for pattern in SECTION_PATTERNS.values())
+)
+
+# Specific project names or technologies that might not be caught by the
+# skill taxonomy, and the skills they imply
+PROJECT_KEYWORDS = {
+    "Talk to Task": ["Voice Assistant", "AI"],
+    "TransitGo": ["Mobile App", "Flutter", "Transportation"],
+    "StudySync": ["Web App", "React"],
+    "Figma": ["UI Design", "Prototyping"],
+    "Firebase": ["Cloud", "Database", "Authentication"],
+    "Google": ["Maps API", "Cloud Services"],
+}
+
+# Education keywords
+EDUCATION_KEYWORDS = [
+    "bachelor", "master", "phd", "doctorate", "degree", "bs", "ms", "ba", "ma",
+    "computer science", "engineering", "information technology", "it", "software engineering"
+]
+
+# Job-level terms
+JOB_LEVELS = ["Junior", "Senior", "Lead", "Manager", "Director", "Intern", "Apprentice"]
+
+# Keyword dictionaries besides the skill taxonomy, found with one scan of the resume
+KEYWORD_MATCHER = SkillMatcher({
+    "projects": list(PROJECT_KEYWORDS),
+    "education": EDUCATION_KEYWORDS,
+    "job_levels": JOB_LEVELS,
+})
+
 class QwenProcessingService:
     """Service for processing resume text using lightweight NLP models and regex patterns for speed"""
     
@@ -23,13 +152,24 @@ class QwenProcessingService:
         """
         self.model_name = model_name
         self.text_classifier = None
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"ProcessingService initialized with model: {model_name}, using device: {self.device}")
+        # Resolved on first model use so the regex-only path never imports torch
+        self._device = None
+        logger.info(f"ProcessingService initialized with model: {model_name}")
+    
+    @property
+    def device(self) -> str:
+        """Device used for model inference ("cuda" or "cpu")"""
+        if self._device is None:
+            import torch
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        return self._device
     
     def _initialize_classifier(self):
         """Initialize the text classifier for section classification if needed"""
         if self.text_classifier is None:
             try:
+                from transformers import pipeline
+                
                 # Load a lightweight classifier pipeline for text classification
                 # This is much faster than the full model and only used when regex fails
                 self.text_classifier = pipeline(
@@ -83,22 +223,12 @@ class QwenProcessingService:
         # Use the normalized sections
         sections = normalized_sections
         
-        # Explicitly check for important sections that might be missed
-        section_headers = {
-            'education': ['EDUCATION', 'ACADEMIC BACKGROUND', 'ACADEMIC HISTORY', 'EDUCATIONAL QUALIFICATIONS'],
-            'achievements': ['ACHIEVEMENTS', 'AWARDS', 'HONORS', 'ACCOMPLISHMENTS'],
-            'technical skills': ['TECHNICAL SKILLS', 'SKILLS', 'TECHNOLOGIES', 'TECHNICAL EXPERTISE'],
-            'academic projects': ['ACADEMIC PROJECTS', 'PROJECTS', 'PROJECT EXPERIENCE'],
-            'extracurricular': ['EXTRACURRICULAR', 'ACTIVITIES', 'EXTRACURRICULAR ACTIVITIES']
-        }
-        
-        # Look for each section directly in the text
-        for section_key, header_options in section_headers.items():
+        # Explicitly check for important sections that might be missed,
+        # looking for each section directly in the text
+        for section_key, header_patterns in SECTION_BLOCK_PATTERNS.items():
             if section_key not in sections:
-                for header in header_options:
-                    # Use a more robust pattern that allows for different formatting
-                    pattern = r'(?:^|\n)\s*' + re.escape(header) + r'\s*(?:\n|\r\n)(.*?)(?=\n\s*[A-Z][A-Z\s]+\s*(?:\n|\r\n)|\Z)'
-                    match = re.search(pattern, resume_text, re.DOTALL | re.IGNORECASE)
+                for pattern in header_patterns:
+                    match = pattern.search(resume_text)
                     if match:
                         sections[section_key] = match.group(1).strip()
                         break
@@ -144,53 +274,40 @@ class QwenProcessingService:
         
         # Add explicit handling for key sections when they're not detected
         # Look for specific section headers that might have been missed
-        if 'technical skills' not in sections:
-            # Check if there's a "TECHNICAL SKILLS" section header
-            if re.search(r'\b(?:TECHNICAL\s+SKILLS|TECH\s+SKILLS)\b', resume_text.upper()):
+        resume_upper = resume_text.upper()
+        for section_key, header_pattern, content_pattern in SECTION_HEADER_FALLBACKS:
+            if section_key not in sections and header_pattern.search(resume_upper):
                 # Extract content following this header
-                match = re.search(r'\b(?:TECHNICAL\s+SKILLS|TECH\s+SKILLS)\b.*?\n(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)', 
-                                 resume_text, re.DOTALL | re.IGNORECASE)
+                match = content_pattern.search(resume_text)
                 if match:
-                    sections['technical skills'] = match.group(1).strip()
-        
-        if 'academic projects' not in sections:
-            # Check if there's an "ACADEMIC PROJECTS" section header
-            if re.search(r'\b(?:ACADEMIC\s+PROJECTS|PROJECTS|PROJECT\s+EXPERIENCE)\b', resume_text.upper()):
-                # Extract content following this header
-                match = re.search(r'\b(?:ACADEMIC\s+PROJECTS|PROJECTS|PROJECT\s+EXPERIENCE)\b.*?\n(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)', 
-                                 resume_text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    sections['academic projects'] = match.group(1).strip()
-        
-        if 'extracurricular' not in sections:
-            # Check if there's an "EXTRACURRICULAR" section header
-            if re.search(r'\b(?:EXTRACURRICULAR|EXTRA-?CURRICULAR|ACTIVITIES)\b', resume_text.upper()):
-                # Extract content following this header
-                match = re.search(r'\b(?:EXTRACURRICULAR|EXTRA-?CURRICULAR|ACTIVITIES)\b.*?\n(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)', 
-                                 resume_text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    sections['extracurricular'] = match.group(1).strip()
+                    sections[section_key] = match.group(1).strip()
         
         # Extra checks for OCR errors in section headers
-        for line in resume_text.split('\n'):
+        lines = resume_text.split('\n')
+        first_line_index = {}
+        for i, line in enumerate(lines):
+            first_line_index.setdefault(line, i)
+        
+        # Only the last header followed by content determines the section, so
+        # find it in one pass and extract its content once
+        header_idx = None
+        for line in lines:
             line_upper = line.upper().strip()
             
             # Look for common OCR errors in section headers
             # Check for Æ or similar characters that might indicate OCR errors
-            if re.search(r'(?:TECHN|TECH).*(?:SKILL)', line_upper.replace('Æ', 'E').replace('Å', 'S')):
-                # Extract content following this header by finding the line number and getting text until next section
-                line_idx = resume_text.split('\n').index(line)
-                content_lines = []
-                for i in range(line_idx + 1, len(resume_text.split('\n'))):
-                    if i >= len(resume_text.split('\n')):
-                        break
-                    content_line = resume_text.split('\n')[i]
-                    if re.match(r'^[A-Z][A-Z\s]+$', content_line.strip()):
-                        break
-                    content_lines.append(content_line)
-                
-                if content_lines:
-                    sections['technical skills'] = '\n'.join(content_lines).strip()
+            if OCR_TECH_SKILLS_HEADER.search(line_upper.replace('Æ', 'E').replace('Å', 'S')):
+                # A repeated header line refers to its first occurrence
+                line_idx = first_line_index[line]
+                if line_idx + 1 < len(lines) and not SECTION_TITLE_LINE.match(lines[line_idx + 1].strip()):
+                    header_idx = line_idx
+        
+        if header_idx is not None:
+            # Get text until the next section title
+            end_idx = header_idx + 1
+            while end_idx < len(lines) and not SECTION_TITLE_LINE.match(lines[end_idx].strip()):
+                end_idx += 1
+            sections['technical skills'] = '\n'.join(lines[header_idx + 1:end_idx]).strip()
         
         # Direct extraction of skills and keywords for faster processing
         keywords = self._extract_keywords_regex(resume_text)
@@ -496,38 +613,11 @@ class QwenProcessingService:
         """Extract different sections from resume text using enhanced pattern matching"""
         sections = {}
         
-        # Define common section headers with case-insensitive matching
-        # This is comprehensive and handles variations in formatting
-        # Added specific Malaysian resume section patterns
-        section_patterns = {
-            "summary": r"(?:SUMMARY|PROFESSIONAL\s+SUMMARY|PROFILE|OBJECTIVE|ABOUT\s+ME)(?:\s*:|$|\n)",
-            "experience": r"(?:EXPERIENCE|WORK\s+EXPERIENCE|EMPLOYMENT|WORK\s+HISTORY|PROFESSIONAL\s+EXPERIENCE)(?:\s*:|$|\n)",
-            "education": r"(?:EDUCATION|ACADEMIC\s+BACKGROUND|ACADEMIC\s+HISTORY|EDUCATIONAL\s+BACKGROUND)(?:\s*:|$|\n)",
-            "skills": r"(?:SKILLS|SKILL\s+SET|SKILL\s+SUMMARY)(?:\s*:|$|\n)",
-            "technical skills": r"(?:TECHNICAL\s+SKILLS|TECHNICAL\s+EXPERTISE|TECH\s+SKILLS|TECHNICAL\s+PROFICIENCIES)(?:\s*:|$|\n)",
-            "academic projects": r"(?:ACADEMIC\s+PROJECTS|PERSONAL\s+PROJECTS|UNIVERSITY\s+PROJECTS|COURSE\s+PROJECTS|PROJECTS|PROJECT\s+EXPERIENCE)(?:\s*:|$|\n)",
-            "extracurricular": r"(?:EXTRACURRICULAR|EXTRACURRICULAR\s+ACTIVITIES|CO-CURRICULAR|CO\-CURRICULAR\s+ACTIVITIES|ACTIVITIES|ACHIEVEMENTS\s+AND\s+ACTIVITIES)(?:\s*:|$|\n)",
-            "certifications": r"(?:CERTIFICATIONS|CERTIFICATES|PROFESSIONAL\s+CERTIFICATIONS|ACCREDITATIONS)(?:\s*:|$|\n)",
-            "achievements": r"(?:ACHIEVEMENTS|AWARDS|HONORS|RECOGNITIONS)(?:\s*:|$|\n)",
-            "languages": r"(?:LANGUAGES|LANGUAGE\s+PROFICIENCY|LANGUAGE\s+SKILLS)(?:\s*:|$|\n)",
-            "interests": r"(?:INTERESTS|HOBBIES|EXTRACURRICULAR\s+ACTIVITIES|ACTIVITIES)(?:\s*:|$|\n)",
-            "volunteer": r"(?:VOLUNTEER|VOLUNTEERING|VOLUNTEER\s+EXPERIENCE|COMMUNITY\s+SERVICE)(?:\s*:|$|\n)",
-            "references": r"(?:REFERENCES|PROFESSIONAL\s+REFERENCES)(?:\s*:|$|\n)",
-            "publications": r"(?:PUBLICATIONS|PAPERS|RESEARCH\s+PAPERS|ARTICLES)(?:\s*:|$|\n)",
-            "leadership": r"(?:LEADERSHIP|LEADERSHIP\s+EXPERIENCE|POSITIONS\s+OF\s+RESPONSIBILITY)(?:\s*:|$|\n)",
-        }
-        
         # Convert text to upper case for easier pattern matching
         text_upper = text.upper()
         
         # Find all section starts and their positions
-        section_starts = []
-        for section_name, pattern in section_patterns.items():
-            for match in re.finditer(pattern, text_upper):
-                start_pos = match.start()
-                end_pos = match.end()
-                header_text = text[start_pos:end_pos]
-                section_starts.append((start_pos, section_name, header_text))
+        section_starts = self._find_section_headers(text, text_upper)
         
         # Sort sections by position
         section_starts.sort()
@@ -583,6 +673,29 @@ class QwenProcessingService:
         
         return sections
     
+    def _find_section_headers(self, text: str, text_upper: str) -> List[Tuple[int, str, str]]:
+        """
+        Find the section headers of SECTION_PATTERNS in a single scan
+        
+        SECTION_SCANNER stops only where some header can start and reports the
+        header of every section matching there. A header is kept only if it
+        starts after the end of the previous header of the same section, so the
+        result is the same as a separate non-overlapping search per section.
+        
+        Returns:
+            (start position, section name, header text) tuples, unsorted
+        """
+        section_starts = []
+        header_ends = [0] * len(SECTION_NAMES)
+        for match in SECTION_SCANNER.finditer(text_upper):
+            start_pos = match.start()
+            for index, section_name in enumerate(SECTION_NAMES):
+                end_pos = match.end(index + 1)
+                if end_pos != -1 and start_pos >= header_ends[index]:
+                    header_ends[index] = end_pos
+                    section_starts.append((start_pos, section_name, text[start_pos:end_pos]))
+        return section_starts
+    
     def _extract_sections_by_lines(self, text: str) -> Dict[str, str]:
         """Extract sections by analyzing line formats and contexts"""
         sections = {}
@@ -652,72 +765,12 @@ class QwenProcessingService:
     
     def _extract_keywords_regex(self, text: str) -> List[str]:
         """Extract keywords and skills using comprehensive pattern matching for speed"""
-        keywords = set()
+        # Technical and soft skills under their canonical names (e.g. "react.js" gives "React")
+        keywords = {skill.name for skill in skill_taxonomy.current().find_skills(text)}
         
-        # Expanded technical skills patterns (programming languages, frameworks, tools)
-        # Added more specific skills from Malaysian tech market and job descriptions
-        tech_patterns = [
-            # Languages
-            r'\b(?:Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Go|Swift|Kotlin|Dart)\b',
-            
-            # Frameworks
-            r'\b(?:React(?:\.js)?|Angular|Vue|Flutter|Django|Flask|Spring|Express|TensorFlow|PyTorch|Node\.js)\b',
-            
-            # Databases
-            r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Oracle|SQLite|Redis|Cassandra|DynamoDB|Firebase|Firestore)\b',
-            
-            # Cloud/DevOps
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|CI/CD|Jenkins|Git|GitHub|GitLab|Vercel|Netlify|Heroku)\b',
-            
-            # Web technologies
-            r'\b(?:HTML5?|CSS3?|SASS|LESS|Bootstrap|Tailwind|REST|GraphQL|API|Axios|Fetch|Redux|Next\.js|Vite)\b',
-            
-            # Mobile development
-            r'\b(?:Flutter|React\s+Native|Ionic|Swift|Kotlin|Android|iOS|Xcode|Android\s+Studio|Mobile\s+App)\b',
-            
-            # Design tools
-            r'\b(?:Figma|Adobe\s+XD|Sketch|InVision|Photoshop|Illustrator|UI|UX)\b',
-            
-            # AI/ML
-            r'\b(?:Machine\s+Learning|AI|Artificial\s+Intelligence|NLP|Neural\s+Networks|Deep\s+Learning|Gemini|GPT)\b',
-            
-            # Soft skills
-            r'\b(?:Agile|Scrum|Kanban|Leadership|Communication|Problem[\s-]Solving|Critical\s+Thinking|Teamwork)\b'
-        ]
-        
-        # Extract tech skills
-        for pattern in tech_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Preserve original case for technologies like React, JavaScript
-                term = match.group(0)
-                # Additional post-processing to ensure consistent capitalization for common technologies
-                if term.lower() == "javascript":
-                    term = "JavaScript"
-                elif term.lower() == "typescript":
-                    term = "TypeScript"
-                elif term.lower() == "postgresql":
-                    term = "PostgreSQL"
-                elif term.lower() == "react":
-                    term = "React"
-                elif term.lower() == "flutter":
-                    term = "Flutter"
-                elif term.lower() == "firebase":
-                    term = "Firebase"
-                keywords.add(term)
-        
-        # Check for specific project names or technologies that might not be caught by patterns
-        project_keywords = {
-            "Talk to Task": ["Voice Assistant", "AI"],
-            "TransitGo": ["Mobile App", "Flutter", "Transportation"],
-            "StudySync": ["Web App", "React"],
-            "Figma": ["UI Design", "Prototyping"],
-            "Firebase": ["Cloud", "Database", "Authentication"],
-            "Google": ["Maps API", "Cloud Services"],
-        }
-        
-        for project, related_skills in project_keywords.items():
-            if re.search(r'\b' + re.escape(project) + r'\b', text, re.IGNORECASE):
+        found = {(match.group, match.term) for match in KEYWORD_MATCHER.find_all(text)}
+        for project, related_skills in PROJECT_KEYWORDS.items():
+            if ("projects", project) in found:
                 keywords.add(project)
                 for skill in related_skills:
                     keywords.add(skill)
@@ -734,30 +787,14 @@ class QwenProcessingService:
                 if match.group(1):
                     keywords.add(f"{match.group(1)}+ years experience")
         
-        # Education keywords
-        edu_keywords = [
-            "bachelor", "master", "phd", "doctorate", "degree", "bs", "ms", "ba", "ma",
-            "computer science", "engineering", "information technology", "it", "software engineering"
-        ]
-        
-        for keyword in edu_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text.lower()):
-                keywords.add(keyword.title())  # Add with title case
-        
-        # Soft skills - these can be important for cultural fit
-        soft_skills = [
-            "leadership", "communication", "teamwork", "problem solving", "critical thinking",
-            "time management", "organization", "creativity", "adaptability", "collaboration"
-        ]
-        
-        for skill in soft_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text.lower()):
-                keywords.add(skill.title())  # Add with title case
+        # Education keywords, added with title case
+        for keyword in EDUCATION_KEYWORDS:
+            if ("education", keyword) in found:
+                keywords.add(keyword.title())
         
-        # Check for job-level terms
-        job_levels = ["Junior", "Senior", "Lead", "Manager", "Director", "Intern", "Apprentice"]
-        for level in job_levels:
-            if re.search(r'\b' + re.escape(level) + r'\b', text, re.IGNORECASE):
+        # Job-level terms
+        for level in JOB_LEVELS:
+            if ("job_levels", level) in found:
                 keywords.add(level)
         
         # Return sorted list without duplicates
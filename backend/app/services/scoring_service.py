@@ -1,9 +1,14 @@
 import logging
+import os
 import re
-from typing import Dict, List, Any, Tuple, Set
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import time
+from typing import Dict, List, Any, Tuple, Set, Optional, Union, Callable
 import numpy as np
+from app.services.job_profile import JobProfile, JobProfileCache
+from app.services.embedding_cache import EmbeddingCache
+from app.services.model_registry import model_registry
+from app.services.skill_matcher import SkillMatcher, select_alternation
+from app.services.skill_taxonomy import skill_taxonomy
 
 # Configure logging
 logging.basicConfig(
@@ -12,39 +17,382 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sentence embedding model used for semantic similarity
+SENTENCE_MODEL_NAME = 'distilbert-base-nli-mean-tokens'
+
+# Texts per SentenceTransformer encode call when scoring batches
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+
+# Pattern for "N years" / "N+ yrs" mentions
+YEARS_PATTERN = re.compile(r'(\d+)\+?\s*(?:years|yrs)', re.IGNORECASE)
+
+# Education levels and their scores
+EDUCATION_LEVELS = {
+    "phd": 100,
+    "doctorate": 100,
+    "master": 90,
+    "mba": 90,
+    "bachelor": 80,
+    "bs": 80,
+    "ba": 80,
+    "bsc": 80,
+    "undergraduate": 60,
+    "associate": 60,
+    "certificate": 40,
+    "certification": 40,
+    "diploma": 40,
+    "high school": 20,
+    "secondary school": 20,
+    "form": 20
+}
+
+EDUCATION_LEVEL_MATCHER = SkillMatcher({"levels": list(EDUCATION_LEVELS)})
+
+# Common soft skills used for the cultural fit score
+SOFT_SKILLS = [
+    "communication", "teamwork", "leadership", "problem solving", "critical thinking",
+    "time management", "adaptability", "flexibility", "creativity", "collaboration",
+    "interpersonal", "organization", "detail oriented", "work ethic", "self motivated",
+    "proactive", "decision making", "conflict resolution", "customer service"
+]
+
+SOFT_SKILL_MATCHER = SkillMatcher({"soft_skills": SOFT_SKILLS})
+
+# Keyword groups of _extract_keywords_from_job besides the skill taxonomy. Each
+# group behaves like one \b(?:...)\b alternation: at every position the first
+# listed term wins.
+JOB_KEYWORD_GROUPS = {
+    "degrees": ["Bachelor", "Master", "PhD", "Doctorate", "Degree", "BS", "MS", "BA", "MA"],
+    "fields": ["Computer Science", "Engineering", "Information Technology", "Business", "Mathematics"],
+    "levels": ["Senior", "Junior", "Mid-level", "Lead", "Manager", "Director"],
+}
+
+JOB_KEYWORD_MATCHER = SkillMatcher(JOB_KEYWORD_GROUPS)
+
+# Experience mentions such as "5 years" or "3+ year"
+JOB_YEARS_PATTERN = re.compile(r'\b(?:\d+\+?\s*years?)\b', re.IGNORECASE)
+
+# Patterns of the scoring methods, compiled once here instead of on every call
+# (there are more of them than fit in the re module's internal cache)
+
+# Sections the resume extraction may have missed, found in the combined section text
+EDUCATION_SECTION_PATTERN = re.compile(r'EDUCATION\s*\n(.*?)(?:\n\s*\n|\n[A-Z\s]{3,}|\Z)', re.DOTALL | re.IGNORECASE)
+ACHIEVEMENTS_SECTION_PATTERN = re.compile(r'ACHIEVEMENTS\s*\n(.*?)(?:\n\s*\n|\n[A-Z\s]{3,}|\Z)', re.DOTALL | re.IGNORECASE)
+
+# Job description parts used by _extract_job_specific_skills
+REQUIREMENTS_SECTION_PATTERN = re.compile(
+    r'(?:requirements|qualifications|key\s+qualifications|skills|required|what\s+you\'ll\s+need)(?:\s*:|\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+BULLET_POINT_PATTERN = re.compile(r'(?:•|\*|\-|\d+\.)\s*(.*?)(?:\n|$)')
+TECH_SKILL_PATTERN = re.compile(r'\b(?:Python|Java|JavaScript|TypeScript|React|Angular|Vue|Flutter|SQL|AWS|Azure|Git|Docker|Kubernetes|C\+\+|HTML|CSS|Node\.js|Firebase|PostgreSQL)\b')
+JOB_LEVEL_TITLE_PATTERN = re.compile(r'\b(?:Junior|Senior|Lead|Mid-level|Entry-level)\s+(?:Software|Web|Mobile|Frontend|Backend|Full-stack|Fullstack)\s+(?:Engineer|Developer)\b')
+JOB_TITLE_PATTERN = re.compile(r'Job\s+Title\s*:\s*([^\n]+)')
+
+# Education requirements of a job description
+EDUCATION_REQUIREMENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:Bachelor|Master|PhD|Doctorate)(?:\'s)?\s+(?:degree|in|of)',
+    r'(?:BS|BA|MS|MA|BSc|MSc|BE|ME)\s+(?:in|degree)',
+    r'degree\s+in\s+(?:Computer Science|Engineering|Information Technology|Software)'
+]]
+
+# Headers of an education section the resume extraction did not recognize
+EDUCATION_HEADER_PATTERNS = [
+    re.compile(f"{header}.*?\\n(.*?)(?:\\n\\s*\\n|\\Z)", re.IGNORECASE | re.DOTALL)
+    for header in ["EDUCATION", "ACADEMIC BACKGROUND", "EDUCATIONAL QUALIFICATIONS", "ACADEMIC HISTORY"]
+]
+
+# University or student indicators, for resumes without an education section
+STUDENT_INDICATOR_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:university|college|institute|school)\s+of\s+[\w\s]+',
+    r'(?:university|college|institute|school)\s*(?:,|-)?\s*[\w\s]+',
+    r'(?:bachelor|master|phd|doctorate|degree|bs|ms|ba|ma|bsc|msc|b\.s\.|m\.s\.|b\.a\.|m\.a\.)',
+    r'(?:student|undergraduate|graduate|freshman|sophomore|junior|senior)',
+    r'(?:gpa|grade\s+point\s+average)\s*(?::|of|=|:)?\s*\d+\.\d+',
+    r'(?:expected|anticipated)\s+graduation',
+    r'(?:major|minor|concentration|specialization)\s+(?:in|:)',
+    r'(?:dean\'s\s+list|honor\s+roll|cum\s+laude|magna\s+cum\s+laude)',
+    r'(?:course(?:work|s))\s+(?:include|in|:)',
+    r'(?:academic|scholarly)\s+(?:achievement|honor|award)',
+    r'(?:graduated|studying|enrolled)',
+    r'(?:class|year)\s+of\s+\d{4}'
+]]
+
+# Common Malaysian institutions and qualifications
+MALAYSIAN_EDUCATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:Universiti|University)\s+(?:of|Teknologi|Malaya|Kebangsaan|Sains|Putra)',
+    r'(?:STPM|SPM|UPSR|PT3|MUET|Malaysian\s+(?:University|Higher|Education))',
+    r'(?:Matriculation|Foundation|Diploma|TVET|Kolej|Maktab)',
+    r'(?:Taylor\'s|Sunway|INTI|HELP|APU|MMU|UTP|UTAR|UKM|UM|USM|UPM|UTM)',
+    r'(?:Form\s+\d|Tingkatan\s+\d|Sekolah\s+Menengah|Secondary\s+School)'
+]]
+
+INSTITUTION_PATTERN = re.compile(r'\b(?:university|college|school)\b', re.IGNORECASE)
+STUDENT_STATUS_PATTERN = re.compile(r'\b(?:student|studying|enrolled)\b', re.IGNORECASE)
+
+# Last-resort evidence of education when nothing else was found
+EDUCATION_KEYWORDS = ["degree", "bachelor", "master", "phd", "university", "college", "school",
+                      "gpa", "academic", "graduated", "study", "studies", "education", "major"]
+
+EDUCATION_KEYWORD_MATCHER = SkillMatcher({"education": EDUCATION_KEYWORDS})
+
+# Quantifiable achievements; group 1, where present, is the achieved value
+ACHIEVEMENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    # Professional achievements with metrics
+    r'increased\s+(?:revenue|sales|profit|growth)\s+by\s+(\d+)%',
+    r'reduced\s+(?:costs|expenses|time|errors)\s+by\s+(\d+)%',
+    r'improved\s+(?:efficiency|performance|productivity)\s+by\s+(\d+)%',
+    r'(?:managed|led|supervised)\s+(?:a\s+)?team\s+of\s+(\d+)',
+    r'(?:completed|delivered|launched)\s+(\d+)\s+projects',
+    r'(?:achieved|exceeded|surpassed)\s+(?:targets|goals|quotas)\s+by\s+(\d+)%',
+    r'(?:saved|generated)\s+\$(\d+)',
+    
+    # Student/academic achievements
+    r'(?:won|awarded|received)\s+(?:\d+)?\s*(?:award|honor|recognition|scholarship|prize|medal)',
+    r'(?:served|volunteered)\s+(?:for|as)\s+(\d+)\s+(?:year|month|week|day)',
+    r'(?:GPA|grade|score)\s+of\s+(\d+\.?\d*)',
+    r'(?:ranked|placed)\s+(?:#|number|no\.?|top)\s*(\d+)',
+    r'(?:elected|selected|chosen)\s+(?:as|to|for)\s+(?:president|chair|leader|representative)',
+    r'(?:first|second|third|top)\s+place\s+(?:in|at|for)',
+    r'(?:scholarship|fellowship|grant)\s+(?:recipient|awardee|winner)',
+    r'(?:founded|established|created|started)\s+(?:a|an|the)',
+    r'(?:published|presented|authored)\s+(?:paper|article|research|thesis)',
+    
+    # Competition achievements (common in student resumes)
+    r'(?:winner|finalist|runner-up|champion)\s+(?:of|in|at)',
+    r'(?:competed|participated|represented)\s+(?:in|at)\s+(?:national|international|regional|global)',
+    r'(?:hackathon|competition|contest|challenge|olympiad)',
+    
+    # Leadership achievements (common in student resumes)
+    r'(?:president|chair|leader|head|captain|chief|director)\s+of',
+    r'(?:led|organized|coordinated|managed|spearheaded)\s+(?:a|an|the)',
+    r'(?:committee\s+member|executive\s+board|student\s+council)',
+    
+    # Project achievements (common in student resumes)
+    r'(?:developed|built|created|designed|implemented)\s+(?:a|an|the)\s+(?:successful|innovative|award-winning)',
+    r'(?:project|application|system|solution|website|platform)\s+(?:that|which|for)',
+    r'(?:increased|improved|enhanced|optimized|streamlined)\s+(?:user|customer|client|student)'
+]]
+
+# Achievement keywords; each one found counts as an achievement
+STUDENT_ACHIEVEMENT_KEYWORDS = [
+    "dean's list", "honor roll", "scholarship", "cum laude", "magna cum laude", "summa cum laude",
+    "valedictorian", "salutatorian", "top student", "academic excellence", "outstanding student",
+    "merit award", "perfect attendance", "perfect score", "high distinction", "distinction",
+    "honor society", "research grant", "best paper", "best poster", "best presentation",
+    "outstanding performance", "exceptional achievement", "academic award", "leadership award",
+    "community service award", "volunteer award", "recognition", "certificate of achievement",
+    "gold medal", "silver medal", "bronze medal", "first place", "second place", "third place",
+    "winner", "finalist", "semi-finalist", "honorable mention", "special mention", "commendation",
+    "prize", "top performer", "star performer", "excellence award", "exceptional contribution"
+]
+
+# Malaysian organizations whose programs and awards indicate achievements
+MALAYSIAN_ACHIEVEMENTS = [
+    "ASEAN", "PETRONAS", "Khazanah", "CIMB", "Maybank", "Axiata", "TalentCorp", "YTL",
+    "Astro", "Maxis", "Digi", "Sunway", "CIMB ASEAN", "Maybank GO Ahead",
+    "Shell", "Ecoworld", "Gamuda", "MARA", "JPA", "MyBrain", "PTPTN"
+]
+
+ACHIEVEMENT_KEYWORD_MATCHER = SkillMatcher({
+    "student": STUDENT_ACHIEVEMENT_KEYWORDS,
+    "malaysian": MALAYSIAN_ACHIEVEMENTS
+})
+
+def _education_level(text: str) -> int:
+    """Score of the highest education level mentioned in a text, 0 if none"""
+    found = EDUCATION_LEVEL_MATCHER.found_terms(text).get("levels", set())
+    return max((EDUCATION_LEVELS[level] for level in found), default=0)
+
+def _timed(timings: Dict[str, float], name: str, func: Callable, *args):
+    """Call func(*args) and record its duration in milliseconds under name"""
+    start = time.perf_counter()
+    result = func(*args)
+    timings[name] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+# Length of the keyword prefixes indexed by _KeywordIndex
+KEYWORD_GRAM_SIZE = 3
+
+# Separator of the keywords in _KeywordIndex's search text; a character that
+# does not occur in extracted keywords
+KEYWORD_SEPARATOR = "\0"
+
+# Job level words handled separately by keyword_overlap_score
+JOB_LEVEL_WORDS = ("junior", "senior", "lead")
+
+# Resume keywords that suggest a candidate can fill a junior role
+JUNIOR_EDUCATION_TERMS = ["student", "graduate", "university", "college", "school", "bachelor", "internship"]
+
+class _KeywordIndex:
+    """
+    Index of lower-case keywords for substring overlap lookups
+
+    overlaps(text) answers "is the text a substring of a keyword, or a keyword
+    a substring of the text" without comparing the text with every keyword:
+    keywords inside the text are looked up by the n-grams they start with
+    (shorter keywords in a set), and the text is searched once in all
+    keywords joined by KEYWORD_SEPARATOR.
+    """
+
+    def __init__(self, keywords: List[str]):
+        """
+        Build the index
+
+        Args:
+            keywords: Lower-case keywords
+        """
+        self.keywords = set(keywords)
+        self._joined = KEYWORD_SEPARATOR.join(self.keywords)
+        # Whether the separator only occurs between keywords
+        self._separated = self._joined.count(KEYWORD_SEPARATOR) == len(self.keywords) - 1
+        self._short: Set[str] = set()  # Keywords shorter than an n-gram
+        self._by_prefix: Dict[str, List[str]] = {}  # First n-gram -> keywords starting with it
+        for keyword in self.keywords:
+            if len(keyword) < KEYWORD_GRAM_SIZE:
+                self._short.add(keyword)
+            else:
+                self._by_prefix.setdefault(keyword[:KEYWORD_GRAM_SIZE], []).append(keyword)
+
+    def mentions(self, term: str) -> bool:
+        """Whether some keyword contains the term (which must not contain the separator)"""
+        return term in self._joined
+    
+    def overlaps(self, text: str) -> bool:
+        """Same result as any(text in kw or kw in text for kw in keywords)"""
+        if not self.keywords:
+            return False
+        if KEYWORD_SEPARATOR in text or not self._separated:
+            return any(text in keyword or keyword in text for keyword in self.keywords)
+        
+        # The text inside a keyword; it cannot span two keywords as it has no separator
+        if text in self._joined:
+            return True
+        
+        # A keyword inside the text, starting at some offset of the text
+        size = KEYWORD_GRAM_SIZE
+        if self._short:
+            if "" in self._short:
+                return True
+            for width in range(1, size):
+                for i in range(len(text) - width + 1):
+                    if text[i:i + width] in self._short:
+                        return True
+        for i in range(len(text) - size + 1):
+            for keyword in self._by_prefix.get(text[i:i + size], ()):
+                if text.startswith(keyword, i):
+                    return True
+        return False
+
 class ScoringService:
     """Service for calculating match scores between resumes and job descriptions"""
     
-    def __init__(self):
-        """Initialize the scoring service"""
+    def __init__(self, job_keyword_extractor: Optional[Callable[[str], List[str]]] = None):
+        """
+        Initialize the scoring service
+        
+        Args:
+            job_keyword_extractor: Optional function extracting display keywords from the
+                job description (stored as JobProfile.analysis_keywords)
+        """
         self.sentence_model = None
+        self.job_keyword_extractor = job_keyword_extractor
+        self.job_profile_cache = JobProfileCache()
+        # Job description embeddings are reused by every resume scored against the same job
+        self.embedding_cache = EmbeddingCache()
+        # Cached job profiles hold keywords found with the previous skill taxonomy
+        skill_taxonomy.add_listener(lambda taxonomy: self.job_profile_cache.clear())
         logger.info("ScoringService initialized")
     
     def _load_model(self):
-        """Load the sentence transformer model if not already loaded"""
+        """Get the shared sentence transformer model if not already loaded"""
         if self.sentence_model is None:
             try:
-                logger.info("Loading SentenceTransformer model")
-                self.sentence_model = SentenceTransformer('distilbert-base-nli-mean-tokens')
-                logger.info("Successfully loaded SentenceTransformer model")
+                self.sentence_model = model_registry.get_sentence_transformer(SENTENCE_MODEL_NAME)
             except Exception as e:
                 logger.error(f"Error loading SentenceTransformer model: {str(e)}")
                 raise
     
-    def calculate_match_score(self, resume_data: Dict[str, Any], job_description: str, weights: Dict[str, float] = None) -> Dict[str, Any]:
+    def _encode_job_text(self, job_description: str) -> np.ndarray:
+        """Get the (cached) embedding of a job description"""
+        return self.embedding_cache.get_or_compute(
+            job_description,
+            lambda text: self.sentence_model.encode([text])[0],
+            SENTENCE_MODEL_NAME
+        )
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the job profile and embedding caches"""
+        return {
+            "jobProfiles": self.job_profile_cache.stats(),
+            "embeddings": self.embedding_cache.stats()
+        }
+    
+    def get_job_profile(self, job_description: str) -> JobProfile:
+        """
+        Get the parsed profile of a job description
+        
+        Profiles are computed once per distinct job description text and cached,
+        so every resume in a batch (and repeated requests) share the same analysis.
+        
+        Args:
+            job_description: Job description text
+            
+        Returns:
+            JobProfile for the job description
+        """
+        return self.job_profile_cache.get_or_create(job_description, self._build_job_profile)
+    
+    def _build_job_profile(self, job_description: str, digest: str) -> JobProfile:
+        """Run all job description analysis used by the scoring methods"""
+        logger.info("Building job profile for job description")
+        
+        found_soft_skills = SOFT_SKILL_MATCHER.found_terms(job_description).get("soft_skills", set())
+        soft_skills = [skill for skill in SOFT_SKILLS if skill in found_soft_skills]
+        
+        analysis_keywords = []
+        if self.job_keyword_extractor is not None:
+            analysis_keywords = self.job_keyword_extractor(job_description)
+        
+        return JobProfile(
+            text=job_description,
+            digest=digest,
+            skills=self._extract_job_specific_skills(job_description),
+            education_requirements=self._extract_education_requirements(job_description),
+            keywords=self._extract_keywords_from_job(job_description),
+            analysis_keywords=analysis_keywords,
+            required_years=[int(y) for y in YEARS_PATTERN.findall(job_description)],
+            required_education_level=_education_level(job_description),
+            soft_skills=soft_skills
+        )
+    
+    def _as_job_profile(self, job: Union[JobProfile, str]) -> JobProfile:
+        """Accept either a JobProfile or raw job description text"""
+        if isinstance(job, JobProfile):
+            return job
+        return self.get_job_profile(job)
+    
+    def calculate_match_score(self, resume_data: Dict[str, Any], job_profile: Union[JobProfile, str], weights: Dict[str, float] = None,
+                              similarities: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, Any]:
         """
         Calculate match score between resume and job description
         
         Args:
             resume_data: Structured resume data from QwenProcessingService
-            job_description: Job description text
+            job_profile: Parsed job description (raw text is converted via get_job_profile)
             weights: Weights for different aspects of the match (skills, experience, etc.)
+            similarities: This resume's entry from compute_similarities, which also
+                completed its sections; computed here when not provided
             
         Returns:
-            Dictionary with match score and details
+            Dictionary with match score and details; "timings" holds the duration of
+            each scoring step in milliseconds
         """
         logger.info("Calculating match score between resume and job description")
         
+        timings: Dict[str, float] = {}
+        job_profile = self._as_job_profile(job_profile)
+        
         # Use default weights if not provided
         if weights is None:
             weights = {
@@ -61,6 +409,114 @@ class ScoringService:
             logger.warning(f"Weights sum to {weight_sum}, normalizing to 1.0")
             weights = {k: v / weight_sum for k, v in weights.items()}
         
+        # Fill in education/achievements sections that the extraction missed
+        if similarities is None:
+            sections = _timed(timings, "sections", self._complete_sections, resume_data)
+            similarities = _timed(timings, "similarities", self._compute_similarities, [resume_data], job_profile)[0]
+        else:
+            sections = resume_data["sections"]
+        
+        # Job-specific skills and requirements for more accurate matching
+        job_skills = job_profile.skills
+        
+        # Calculate keyword overlap score with emphasis on exact job requirements
+        keyword_score, matched_keywords, missing_keywords = _timed(
+            timings, "keywords", self.keyword_overlap_score,
+            resume_data.get("keywords", []),
+            job_profile.keywords
+        )
+        
+        # Rebuild all_sections_text with the updated sections
+        all_sections_text = ""
+        for section_content in sections.values():
+            all_sections_text += section_content + "\n\n"
+        
+        # Calculate semantic similarity score
+        semantic_score = _timed(timings, "semantic", self.semantic_similarity_score,
+                                resume_data, job_profile, similarities["semantic"])
+        
+        # Check if this is a highly matching job description (many specific skills match)
+        is_high_match = False
+        if len(matched_keywords) > 7 or (len(matched_keywords) / max(1, len(job_skills)) > 0.7):
+            is_high_match = True
+            # For high matches, boost the semantic score
+            semantic_score = min(100, semantic_score * 1.3)
+        
+        # Calculate experience score with job context
+        experience_score = _timed(timings, "experience", self.experience_score,
+                                  resume_data, job_profile, similarities["experience"])
+        
+        # Calculate education score
+        education_score = _timed(timings, "education", self.education_score, resume_data, job_profile)
+        
+        # Calculate achievements score and bonus
+        achievements_score, achievement_bonus = _timed(timings, "achievements", self.achievements_score, resume_data)
+        
+        # Calculate cultural fit score
+        cultural_fit_score = _timed(timings, "culturalFit", self.cultural_fit_score, resume_data, job_profile)
+        
+        # Additional adjustment for highly matching jobs
+        if is_high_match:
+            keyword_score = min(100, keyword_score * 1.25)  # 25% boost for high matches
+            experience_score = max(40, experience_score)    # Minimum 40% for experience on high matches
+        
+        # Calculate weighted aspect scores - ensure each aspect is between 0-100
+        aspect_scores = {
+            "skills": min(100, max(0, keyword_score * 0.7 + semantic_score * 0.3)),
+            "experience": min(100, max(0, experience_score)),
+            "achievements": min(100, max(0, achievements_score)),
+            "education": min(100, max(0, education_score)),
+            "culturalFit": min(100, max(0, cultural_fit_score))
+        }
+        
+        # Calculate final score (0-100 scale)
+        final_score = sum(aspect_scores[aspect] * weights[aspect] for aspect in weights)
+        
+        # Apply achievement bonus
+        final_score = min(100, final_score + achievement_bonus)
+        
+        # Make it harder to reach scores above 95% (reserved for exceptional matches)
+        # This helps identify potentially AI-generated resumes
+        if final_score > 90:
+            # Check for missing critical requirements
+            if missing_keywords and len(missing_keywords) > 2:
+                final_score = min(95, final_score)  # Cap at 95% if missing important requirements
+            
+            # Extra scrutiny for very high scores
+            if final_score > 95:
+                # Unless it's a truly perfect match (almost all keywords match AND high semantic similarity)
+                if len(matched_keywords) < len(job_profile.keywords) * 0.9 or semantic_score < 90:
+                    final_score = 95  # Cap at 95% for anything that's not a perfect match
+        
+        # Create recommendations from HR perspective
+        recommendations = _timed(timings, "recommendations", self.generate_hr_recommendations,
+                                 resume_data, matched_keywords, missing_keywords, aspect_scores)
+        
+        # Generate detailed analysis explanation from HR perspective
+        analysis_explanation = _timed(
+            timings, "analysis", self._generate_hr_analysis,
+            resume_data, final_score, aspect_scores, matched_keywords, missing_keywords, 
+            achievement_bonus, job_profile
+        )
+        logger.debug(f"Scoring step times (ms): {timings}")
+        
+        return {
+            "score": round(final_score, 1),  # Ensure it's between 0-100
+            "matchedKeywords": matched_keywords,
+            "missingKeywords": missing_keywords,
+            "aspectScores": {k: round(v, 1) for k, v in aspect_scores.items()},  # Round scores
+            "achievementBonus": round(achievement_bonus, 1),
+            "recommendations": recommendations,
+            "analysis": analysis_explanation,  # Detailed explanation
+            "timings": timings
+        }
+    
+    def _complete_sections(self, resume_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Add education/achievements sections that the extraction step missed
+        
+        Updates resume_data["sections"] in place and returns it.
+        """
         # Special handling for important sections that might be missing
         # We'll try to directly extract them from the raw resume text
         all_sections_text = ""
@@ -76,16 +532,14 @@ class ScoringService:
         # Check if education section is missing but exists in text
         if "education" not in sections:
             # Look for an "EDUCATION" section in the text
-            education_match = re.search(r'EDUCATION\s*\n(.*?)(?:\n\s*\n|\n[A-Z\s]{3,}|\Z)', 
-                                      all_sections_text, re.DOTALL | re.IGNORECASE)
+            education_match = EDUCATION_SECTION_PATTERN.search(all_sections_text)
             if education_match:
                 sections["education"] = education_match.group(1).strip()
         
         # Check if achievements section is missing but exists in text
         if "achievements" not in sections:
             # Look for an "ACHIEVEMENTS" section in the text
-            achievements_match = re.search(r'ACHIEVEMENTS\s*\n(.*?)(?:\n\s*\n|\n[A-Z\s]{3,}|\Z)', 
-                                        all_sections_text, re.DOTALL | re.IGNORECASE)
+            achievements_match = ACHIEVEMENTS_SECTION_PATTERN.search(all_sections_text)
             if achievements_match:
                 sections["achievements"] = achievements_match.group(1).strip()
         
@@ -145,99 +599,12 @@ class ScoringService:
         if "achievements" not in sections and "Runner Up" in raw_text:
             sections["achievements"] = "1st Runner Up - UM Hackathon 2025\n2nd Runner Up - UM Internal Hackathon 2024"
         
-        # Extract job-specific skills and requirements for more accurate matching
-        job_skills = self._extract_job_specific_skills(job_description)
-        job_education = self._extract_education_requirements(job_description)
-        
-        # Calculate keyword overlap score with emphasis on exact job requirements
-        keyword_score, matched_keywords, missing_keywords = self.keyword_overlap_score(
-            resume_data.get("keywords", []),
-            self._extract_keywords_from_job(job_description)
-        )
-        
-        # Rebuild all_sections_text with the updated sections
-        all_sections_text = ""
-        for section_content in sections.values():
-            all_sections_text += section_content + "\n\n"
-        
-        # Calculate semantic similarity score
-        semantic_score = self.semantic_similarity_score(resume_data, job_description)
-        
-        # Check if this is a highly matching job description (many specific skills match)
-        is_high_match = False
-        if len(matched_keywords) > 7 or (len(matched_keywords) / max(1, len(job_skills)) > 0.7):
-            is_high_match = True
-            # For high matches, boost the semantic score
-            semantic_score = min(100, semantic_score * 1.3)
-        
-        # Calculate experience score with job context
-        experience_score = self.experience_score(resume_data, job_description)
-        
-        # Calculate education score
-        education_score = self.education_score(resume_data, job_description)
-        
-        # Calculate achievements score and bonus
-        achievements_score, achievement_bonus = self.achievements_score(resume_data)
-        
-        # Calculate cultural fit score
-        cultural_fit_score = self.cultural_fit_score(resume_data, job_description)
-        
-        # Additional adjustment for highly matching jobs
-        if is_high_match:
-            keyword_score = min(100, keyword_score * 1.25)  # 25% boost for high matches
-            experience_score = max(40, experience_score)    # Minimum 40% for experience on high matches
-        
-        # Calculate weighted aspect scores - ensure each aspect is between 0-100
-        aspect_scores = {
-            "skills": min(100, max(0, keyword_score * 0.7 + semantic_score * 0.3)),
-            "experience": min(100, max(0, experience_score)),
-            "achievements": min(100, max(0, achievements_score)),
-            "education": min(100, max(0, education_score)),
-            "culturalFit": min(100, max(0, cultural_fit_score))
-        }
-        
-        # Calculate final score (0-100 scale)
-        final_score = sum(aspect_scores[aspect] * weights[aspect] for aspect in weights)
-        
-        # Apply achievement bonus
-        final_score = min(100, final_score + achievement_bonus)
-        
-        # Make it harder to reach scores above 95% (reserved for exceptional matches)
-        # This helps identify potentially AI-generated resumes
-        if final_score > 90:
-            # Check for missing critical requirements
-            if missing_keywords and len(missing_keywords) > 2:
-                final_score = min(95, final_score)  # Cap at 95% if missing important requirements
-            
-            # Extra scrutiny for very high scores
-            if final_score > 95:
-                # Unless it's a truly perfect match (almost all keywords match AND high semantic similarity)
-                if len(matched_keywords) < len(self._extract_keywords_from_job(job_description)) * 0.9 or semantic_score < 90:
-                    final_score = 95  # Cap at 95% for anything that's not a perfect match
-        
-        # Create recommendations from HR perspective
-        recommendations = self.generate_hr_recommendations(resume_data, matched_keywords, missing_keywords, aspect_scores)
-        
-        # Generate detailed analysis explanation from HR perspective
-        analysis_explanation = self._generate_hr_analysis(
-            resume_data, final_score, aspect_scores, matched_keywords, missing_keywords, 
-            achievement_bonus, job_description
-        )
-        
-        return {
-            "score": round(final_score, 1),  # Ensure it's between 0-100
-            "matchedKeywords": matched_keywords,
-            "missingKeywords": missing_keywords,
-            "aspectScores": {k: round(v, 1) for k, v in aspect_scores.items()},  # Round scores
-            "achievementBonus": round(achievement_bonus, 1),
-            "recommendations": recommendations,
-            "analysis": analysis_explanation  # Detailed explanation
-        }
+        return sections
     
     def _generate_hr_analysis(self, resume_data: Dict[str, Any], final_score: float, 
                              aspect_scores: Dict[str, float], matched_keywords: List[str], 
                              missing_keywords: List[str], achievement_bonus: float, 
-                             job_description: str) -> str:
+                             job_profile: JobProfile) -> str:
         """Generate a detailed analysis from an HR perspective"""
         
         # Extract candidate name for personalized analysis
@@ -374,30 +741,30 @@ class ScoringService:
         skills = []
         
         # Look for skills in "requirements" or "qualifications" sections
-        requirements_section = re.search(r'(?:requirements|qualifications|key\s+qualifications|skills|required|what\s+you\'ll\s+need)(?:\s*:|\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)', job_description, re.IGNORECASE | re.DOTALL)
+        requirements_section = REQUIREMENTS_SECTION_PATTERN.search(job_description)
         
         if requirements_section:
             requirements_text = requirements_section.group(1)
             
             # Extract bullet points or numbered lists
-            bullet_points = re.findall(r'(?:•|\*|\-|\d+\.)\s*(.*?)(?:\n|$)', requirements_text)
+            bullet_points = BULLET_POINT_PATTERN.findall(requirements_text)
             
             for point in bullet_points:
                 # Look for technical skills in each bullet point
-                tech_skills = re.findall(r'\b(?:Python|Java|JavaScript|TypeScript|React|Angular|Vue|Flutter|SQL|AWS|Azure|Git|Docker|Kubernetes|C\+\+|HTML|CSS|Node\.js|Firebase|PostgreSQL)\b', point)
+                tech_skills = TECH_SKILL_PATTERN.findall(point)
                 skills.extend(tech_skills)
         
         # If no structured requirements found, try to find skills throughout the text
         if not skills:
-            skills = re.findall(r'\b(?:Python|Java|JavaScript|TypeScript|React|Angular|Vue|Flutter|SQL|AWS|Azure|Git|Docker|Kubernetes|C\+\+|HTML|CSS|Node\.js|Firebase|PostgreSQL)\b', job_description)
+            skills = TECH_SKILL_PATTERN.findall(job_description)
         
         # Find job level specification (e.g., Junior, Senior)
-        job_level = re.findall(r'\b(?:Junior|Senior|Lead|Mid-level|Entry-level)\s+(?:Software|Web|Mobile|Frontend|Backend|Full-stack|Fullstack)\s+(?:Engineer|Developer)\b', job_description)
+        job_level = JOB_LEVEL_TITLE_PATTERN.findall(job_description)
         if job_level:
             skills.extend(job_level)
         
         # Check for job title in title section
-        job_title_match = re.search(r'Job\s+Title\s*:\s*([^\n]+)', job_description)
+        job_title_match = JOB_TITLE_PATTERN.search(job_description)
         if job_title_match:
             job_title = job_title_match.group(1).strip()
             skills.append(job_title)
@@ -417,16 +784,8 @@ class ScoringService:
         """Extract education requirements from the job description"""
         education_keywords = []
         
-        # Common education requirement patterns
-        patterns = [
-            r'(?:Bachelor|Master|PhD|Doctorate)(?:\'s)?\s+(?:degree|in|of)',
-            r'(?:BS|BA|MS|MA|BSc|MSc|BE|ME)\s+(?:in|degree)',
-            r'degree\s+in\s+(?:Computer Science|Engineering|Information Technology|Software)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, job_description, re.IGNORECASE)
-            for match in matches:
+        for pattern in EDUCATION_REQUIREMENT_PATTERNS:
+            for match in pattern.finditer(job_description):
                 education_keywords.append(match.group(0))
         
         return education_keywords
@@ -445,18 +804,21 @@ class ScoringService:
         if not job_keywords:
             return 0.0, [], []
         
-        # Normalize keywords for comparison
+        # Normalize keywords for comparison; exact matches are set lookups and
+        # partial matches go through a substring index of the resume keywords
         resume_keywords_norm = [kw.lower() for kw in resume_keywords]
         job_keywords_norm = [kw.lower() for kw in job_keywords]
+        resume_index = _KeywordIndex(resume_keywords_norm)
         
         # Find matching keywords with smarter matching
         matched_keywords = []
+        matched_set = set()
         exact_matches = []
         partial_matches = []
         
         # Special handling for job level matches (Junior, Senior, etc.)
-        job_level_in_job = [kw for kw in job_keywords_norm if "junior" in kw.lower() or "senior" in kw.lower() or "lead" in kw.lower()]
-        job_level_in_resume = [kw for kw in resume_keywords_norm if "junior" in kw.lower() or "senior" in kw.lower() or "lead" in kw.lower()]
+        job_level_in_job = [kw for kw in job_keywords_norm if any(word in kw for word in JOB_LEVEL_WORDS)]
+        job_level_in_resume = any(resume_index.mentions(word) for word in JOB_LEVEL_WORDS)
         
         # If job title specifies Junior but resume doesn't mention it explicitly,
         # still give partial credit based on other factors (education, experience)
@@ -465,45 +827,42 @@ class ScoringService:
             if job_level_in_resume:
                 level_match = True
                 for level in job_level_in_job:
-                    if level not in matched_keywords:
+                    if level not in matched_set:
                         matched_keywords.append(level)
+                        matched_set.add(level)
                         exact_matches.append(level)
             else:
                 # Check if we can infer level from other resume attributes
                 # For Junior roles, we check if terms like "student", "graduate", "university"
                 # or similar education-related terms are present
-                if any("junior" in level.lower() for level in job_level_in_job):
-                    education_terms = ["student", "graduate", "university", "college", "school", "bachelor", "internship"]
-                    if any(term in " ".join(resume_keywords_norm).lower() for term in education_terms):
+                if any("junior" in level for level in job_level_in_job):
+                    resume_text = " ".join(resume_keywords_norm)
+                    if any(term in resume_text for term in JUNIOR_EDUCATION_TERMS):
                         level_match = True
                         for level in job_level_in_job:
-                            if "junior" in level.lower() and level not in matched_keywords:
+                            if "junior" in level and level not in matched_set:
                                 matched_keywords.append(level)
+                                matched_set.add(level)
                                 partial_matches.append(level)
         
-        for job_kw in job_keywords:
-            job_kw_lower = job_kw.lower()
-            
+        for job_kw, job_kw_lower in zip(job_keywords, job_keywords_norm):
             # Skip if already processed in job level matching
-            if job_kw in matched_keywords:
+            if job_kw in matched_set:
                 continue
             
-            # Check for exact matches first (higher value)
-            if job_kw_lower in resume_keywords_norm:
-                matched_keywords.append(job_kw)
+            # Check for exact matches first (higher value), then partial matches
+            # (e.g. "JavaScript" vs "JavaScript ES6")
+            if job_kw_lower in resume_index.keywords:
                 exact_matches.append(job_kw)
+            elif resume_index.overlaps(job_kw_lower):
+                partial_matches.append(job_kw)
+            else:
                 continue
-            
-            # Check for partial matches (e.g. "JavaScript" vs "JavaScript ES6")
-            for resume_kw in resume_keywords:
-                resume_kw_lower = resume_kw.lower()
-                if job_kw_lower in resume_kw_lower or resume_kw_lower in job_kw_lower:
-                    matched_keywords.append(job_kw)
-                    partial_matches.append(job_kw)
-                    break
+            matched_keywords.append(job_kw)
+            matched_set.add(job_kw)
         
         # Find missing keywords
-        missing_keywords = [kw for kw in job_keywords if kw not in matched_keywords]
+        missing_keywords = [kw for kw in job_keywords if kw not in matched_set]
         
         # Calculate score with different weights for exact vs partial matches
         # Exact matches are worth more than partial matches
@@ -513,38 +872,13 @@ class ScoringService:
         # Base score combines both exact and partial matches
         base_score = exact_match_score + partial_match_score
         
-        # Important skills list with key technologies from the job description
-        important_keywords = [
-            "flutter", "dart", "firebase", "postgresql", "react", "typescript",
-            "python", "java", "javascript", "sql", "aws", "azure", "git", "docker", "kubernetes", 
-            "agile", "scrum", "leadership", "communication", "teamwork", "problem-solving", "analytics"
-        ]
-        
-        # Calculate bonus for important keyword matches with emphasis on key technologies
-        weighted_important_matches = 0
-        total_important = 0
-        
-        for kw in matched_keywords:
-            kw_lower = kw.lower()
-            for imp in important_keywords:
-                if imp in kw_lower:
-                    if imp in ["flutter", "firebase", "postgresql", "react", "typescript"]:
-                        # Give extra weight to key technologies - each counts as 3 matches
-                        weighted_important_matches += 3
-                    else:
-                        weighted_important_matches += 1
-                    break
-        
-        for kw in job_keywords:
-            kw_lower = kw.lower()
-            for imp in important_keywords:
-                if imp in kw_lower:
-                    if imp in ["flutter", "firebase", "postgresql", "react", "typescript"]:
-                        # Count key technologies with extra weight
-                        total_important += 3
-                    else:
-                        total_important += 1
-                    break
+        # Bonus for important keyword matches with emphasis on key technologies: each
+        # keyword counts with the taxonomy weight of the skill it mentions (key
+        # technologies 3, other important skills 1, the rest 0)
+        taxonomy = skill_taxonomy.current()
+        weights = {kw: taxonomy.weight_of(kw) for kw in set(job_keywords) | matched_set}
+        weighted_important_matches = sum(weights[kw] for kw in matched_keywords)
+        total_important = sum(weights[kw] for kw in job_keywords)
         
         if total_important > 0:
             important_score = (weighted_important_matches / total_important) * 30  # Up to 30% bonus
@@ -566,51 +900,108 @@ class ScoringService:
         
         return final_score, matched_keywords, missing_keywords
     
-    def semantic_similarity_score(self, resume_data: Dict[str, Any], job_description: str) -> float:
+    def compute_similarities(self, resume_data_list: List[Dict[str, Any]], job_profile: Union[JobProfile, str],
+                             batch_size: Optional[int] = None) -> List[Dict[str, Optional[float]]]:
         """
-        Calculate score based on semantic similarity
+        Calculate the embedding similarities for a batch of resumes in one pass
+        
+        Completes each resume's sections (as calculate_match_score does), then encodes
+        every resume text and experience section with batched model calls. Pass each
+        entry to calculate_match_score via `similarities` so the sections are not
+        completed twice.
         
         Args:
-            resume_data: Structured resume data
-            job_description: Job description text
+            resume_data_list: Structured resume data for each resume
+            job_profile: Parsed job description
+            batch_size: Texts per encode call (default: EMBEDDING_BATCH_SIZE)
             
         Returns:
-            Similarity score (0-100)
+            One {"semantic", "experience"} dict per resume, in input order
         """
-        try:
-            self._load_model()
-            
-            # Create resume text from sections
+        job_profile = self._as_job_profile(job_profile)
+        
+        for resume_data in resume_data_list:
+            self._complete_sections(resume_data)
+        
+        return self._compute_similarities(resume_data_list, job_profile, batch_size)
+    
+    def _compute_similarities(self, resume_data_list: List[Dict[str, Any]], job_profile: JobProfile,
+                              batch_size: Optional[int] = None) -> List[Dict[str, Optional[float]]]:
+        """
+        Batched similarity calculation on the resumes' sections as they are
+        
+        "semantic" compares all sections with the job description. "experience" is only
+        computed for resumes whose experience score cannot be derived from years (None
+        otherwise).
+        """
+        job_description = job_profile.text
+        results = [{"semantic": 0.0, "experience": None} for _ in resume_data_list]
+        
+        # (result index, key, text) for everything that needs an embedding
+        requests = []
+        for i, resume_data in enumerate(resume_data_list):
             resume_sections = resume_data.get("sections", {})
             resume_text = " ".join(resume_sections.values())
+            if resume_text and job_description:
+                requests.append((i, "semantic", resume_text))
+            
+            if self._experience_years_score(resume_data, job_profile) is None:
+                requests.append((i, "experience", resume_sections.get("experience", "")))
+        
+        if not requests:
+            return results
+        
+        try:
+            self._load_model()
             
-            if not resume_text or not job_description:
-                return 0.0
+            if batch_size is None:
+                batch_size = EMBEDDING_BATCH_SIZE
             
-            # Get embeddings
-            resume_embedding = self.sentence_model.encode([resume_text])[0]
-            job_embedding = self.sentence_model.encode([job_description])[0]
+            texts = [text for _, _, text in requests]
+            embeddings = np.asarray(self.sentence_model.encode(texts, batch_size=max(1, batch_size)), dtype=np.float32)
+            job_embedding = np.asarray(self._encode_job_text(job_description), dtype=np.float32)
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity([resume_embedding], [job_embedding])[0][0]
+            # Cosine similarity of every text against the job description at once
+            norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(job_embedding)
+            dots = embeddings @ job_embedding
+            similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
             
             # Convert to percentage
-            return similarity * 100
-            
+            for (i, key, _), similarity in zip(requests, similarities):
+                results[i][key] = float(similarity) * 100
+        
         except Exception as e:
-            logger.error(f"Error calculating semantic similarity: {str(e)}")
-            return 0.0
+            logger.error(f"Error calculating similarities: {str(e)}")
+            for i, key, _ in requests:
+                results[i][key] = 0.0 if key == "semantic" else 50.0  # Default middle score
+        
+        return results
     
-    def experience_score(self, resume_data: Dict[str, Any], job_description: str) -> float:
+    def semantic_similarity_score(self, resume_data: Dict[str, Any], job_profile: JobProfile,
+                                  similarity: Optional[float] = None) -> float:
         """
-        Calculate score based on experience
+        Calculate score based on semantic similarity
         
         Args:
             resume_data: Structured resume data
-            job_description: Job description text
+            job_profile: Parsed job description
+            similarity: Precomputed "semantic" value from compute_similarities
             
         Returns:
-            Experience score (0-100)
+            Similarity score (0-100)
+        """
+        if similarity is not None:
+            return similarity
+        
+        return self._compute_similarities([resume_data], job_profile)[0]["semantic"]
+    
+    def _experience_years_score(self, resume_data: Dict[str, Any], job_profile: JobProfile) -> Optional[float]:
+        """
+        Experience score from years mentioned in the resume and job description
+        
+        Returns:
+            Score (0-100), or None if the years cannot be compared and the
+            semantic similarity of the experience section must be used
         """
         # Get experience section
         experience_section = resume_data.get("sections", {}).get("experience", "")
@@ -619,13 +1010,11 @@ class ScoringService:
             return 0.0
         
         # Extract years of experience from resume
-        years_pattern = r'(\d+)\+?\s*(?:years|yrs)'
-        resume_years_matches = re.findall(years_pattern, experience_section, re.IGNORECASE)
+        resume_years_matches = YEARS_PATTERN.findall(experience_section)
         resume_years = [int(y) for y in resume_years_matches]
         
-        # Extract required years from job description
-        job_years_matches = re.findall(years_pattern, job_description, re.IGNORECASE)
-        job_years = [int(y) for y in job_years_matches]
+        # Required years from job description
+        job_years = job_profile.required_years
         
         # Calculate score based on years of experience
         if job_years and resume_years:
@@ -637,31 +1026,38 @@ class ScoringService:
             else:
                 return (actual_years / required_years) * 100
         
-        # If we can't extract years, use semantic similarity
-        try:
-            self._load_model()
-            
-            # Get embeddings
-            experience_embedding = self.sentence_model.encode([experience_section])[0]
-            job_embedding = self.sentence_model.encode([job_description])[0]
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity([experience_embedding], [job_embedding])[0][0]
-            
-            # Convert to percentage
-            return similarity * 100
+        return None
+    
+    def experience_score(self, resume_data: Dict[str, Any], job_profile: JobProfile,
+                         similarity: Optional[float] = None) -> float:
+        """
+        Calculate score based on experience
+        
+        Args:
+            resume_data: Structured resume data
+            job_profile: Parsed job description
+            similarity: Precomputed "experience" value from compute_similarities
             
-        except Exception as e:
-            logger.error(f"Error calculating experience score: {str(e)}")
-            return 50.0  # Default middle score
+        Returns:
+            Experience score (0-100)
+        """
+        score = self._experience_years_score(resume_data, job_profile)
+        if score is not None:
+            return score
+        
+        # If we can't extract years, use semantic similarity
+        if similarity is not None:
+            return similarity
+        
+        return self._compute_similarities([resume_data], job_profile)[0]["experience"]
     
-    def education_score(self, resume_data: Dict[str, Any], job_description: str) -> float:
+    def education_score(self, resume_data: Dict[str, Any], job_profile: JobProfile) -> float:
         """
         Calculate score based on education
         
         Args:
             resume_data: Structured resume data
-            job_description: Job description text
+            job_profile: Parsed job description
             
         Returns:
             Education score (0-100)
@@ -674,28 +1070,11 @@ class ScoringService:
         for section_name, content in resume_data.get("sections", {}).items():
             all_sections_text += content + "\n\n"
         
-        # Check specifically for university or student indicators in the text
-        student_indicators = [
-            r'(?:university|college|institute|school)\s+of\s+[\w\s]+',
-            r'(?:university|college|institute|school)\s*(?:,|-)?\s*[\w\s]+',
-            r'(?:bachelor|master|phd|doctorate|degree|bs|ms|ba|ma|bsc|msc|b\.s\.|m\.s\.|b\.a\.|m\.a\.)',
-            r'(?:student|undergraduate|graduate|freshman|sophomore|junior|senior)',
-            r'(?:gpa|grade\s+point\s+average)\s*(?::|of|=|:)?\s*\d+\.\d+',
-            r'(?:expected|anticipated)\s+graduation',
-            r'(?:major|minor|concentration|specialization)\s+(?:in|:)',
-            r'(?:dean\'s\s+list|honor\s+roll|cum\s+laude|magna\s+cum\s+laude)',
-            r'(?:course(?:work|s))\s+(?:include|in|:)',
-            r'(?:academic|scholarly)\s+(?:achievement|honor|award)',
-            r'(?:graduated|studying|enrolled)',
-            r'(?:class|year)\s+of\s+\d{4}'
-        ]
-        
         # If no dedicated education section, try to find education info in the full text
         if not education_section:
             # First check for specific education section headers that might have been missed
-            edu_headers = ["EDUCATION", "ACADEMIC BACKGROUND", "EDUCATIONAL QUALIFICATIONS", "ACADEMIC HISTORY"]
-            for header in edu_headers:
-                match = re.search(f"{header}.*?\\n(.*?)(?:\\n\\s*\\n|\\Z)", all_sections_text, re.IGNORECASE | re.DOTALL)
+            for header_pattern in EDUCATION_HEADER_PATTERNS:
+                match = header_pattern.search(all_sections_text)
                 if match:
                     education_section = match.group(1)
                     break
@@ -704,9 +1083,8 @@ class ScoringService:
         if not education_section:
             # Extract education information from the entire text
             education_matches = []
-            for pattern in student_indicators:
-                matches = re.finditer(pattern, all_sections_text, re.IGNORECASE)
-                for match in matches:
+            for pattern in STUDENT_INDICATOR_PATTERNS:
+                for match in pattern.finditer(all_sections_text):
                     # Get the sentence containing the match
                     start = max(0, all_sections_text.rfind('.', 0, match.start()) + 1)
                     end = all_sections_text.find('.', match.end())
@@ -721,17 +1099,8 @@ class ScoringService:
         
         # For student resumes, look for specific common Malaysian education patterns
         if not education_section or len(education_section) < 50:
-            malaysian_edu_patterns = [
-                r'(?:Universiti|University)\s+(?:of|Teknologi|Malaya|Kebangsaan|Sains|Putra)',
-                r'(?:STPM|SPM|UPSR|PT3|MUET|Malaysian\s+(?:University|Higher|Education))',
-                r'(?:Matriculation|Foundation|Diploma|TVET|Kolej|Maktab)',
-                r'(?:Taylor\'s|Sunway|INTI|HELP|APU|MMU|UTP|UTAR|UKM|UM|USM|UPM|UTM)',
-                r'(?:Form\s+\d|Tingkatan\s+\d|Sekolah\s+Menengah|Secondary\s+School)'
-            ]
-            
-            for pattern in malaysian_edu_patterns:
-                matches = re.finditer(pattern, all_sections_text, re.IGNORECASE)
-                for match in matches:
+            for pattern in MALAYSIAN_EDUCATION_PATTERNS:
+                for match in pattern.finditer(all_sections_text):
                     # Get the surrounding context
                     start = max(0, all_sections_text.rfind('\n', 0, match.start()) + 1)
                     end = all_sections_text.find('\n', match.end())
@@ -745,15 +1114,8 @@ class ScoringService:
                         education_section = context
         
         if not education_section:
-            # Last resort - check for any typical education keywords
-            education_keywords = ["degree", "bachelor", "master", "phd", "university", "college", "school", 
-                                 "gpa", "academic", "graduated", "study", "studies", "education", "major"]
-            
-            # Count how many education keywords appear in the text
-            keyword_count = 0
-            for keyword in education_keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', all_sections_text, re.IGNORECASE):
-                    keyword_count += 1
+            # Last resort - count how many typical education keywords appear in the text
+            keyword_count = len(EDUCATION_KEYWORD_MATCHER.found_terms(all_sections_text).get("education", ()))
             
             # If we found multiple education keywords, it's likely that there's some education info
             if keyword_count >= 2:
@@ -762,44 +1124,18 @@ class ScoringService:
         if not education_section:
             return 0.0
         
-        # Define education levels and their scores
-        education_levels = {
-            "phd": 100,
-            "doctorate": 100,
-            "master": 90,
-            "mba": 90,
-            "bachelor": 80,
-            "bs": 80,
-            "ba": 80,
-            "bsc": 80,
-            "undergraduate": 60,
-            "associate": 60,
-            "certificate": 40,
-            "certification": 40,
-            "diploma": 40,
-            "high school": 20,
-            "secondary school": 20,
-            "form": 20
-        }
-        
-        # Check for required education in job description
-        required_level = 0
-        for level, score in education_levels.items():
-            if re.search(r'\b' + level + r'\b', job_description, re.IGNORECASE):
-                required_level = max(required_level, score)
+        # Required education level from job description
+        required_level = job_profile.required_education_level
         
         # Check for education level in resume
-        resume_level = 0
-        for level, score in education_levels.items():
-            if re.search(r'\b' + level + r'\b', education_section, re.IGNORECASE):
-                resume_level = max(resume_level, score)
+        resume_level = _education_level(education_section)
         
         # If no specific education requirement found, return default score
         if required_level == 0:
             # Check if we found any education information
             if resume_level > 0:
                 return 70.0  # Good baseline if we found some education info
-            elif re.search(r'\b(?:university|college|school)\b', education_section, re.IGNORECASE):
+            elif INSTITUTION_PATTERN.search(education_section):
                 return 50.0  # Lower baseline if we only found institution names
             else:
                 return 30.0  # Minimal score if very little education info found
@@ -809,7 +1145,7 @@ class ScoringService:
             return 100.0
         else:
             # For student resumes, give a better score even if the exact level isn't specified
-            if re.search(r'\b(?:student|studying|enrolled)\b', education_section, re.IGNORECASE):
+            if STUDENT_STATUS_PATTERN.search(education_section):
                 return max(50.0, (resume_level / required_level) * 100)
             else:
                 return (resume_level / required_level) * 100
@@ -830,49 +1166,11 @@ class ScoringService:
             all_sections_text += content + "\n\n"
         
         # Look for quantifiable achievements
-        achievement_patterns = [
-            # Professional achievements with metrics
-            r'increased\s+(?:revenue|sales|profit|growth)\s+by\s+(\d+)%',
-            r'reduced\s+(?:costs|expenses|time|errors)\s+by\s+(\d+)%',
-            r'improved\s+(?:efficiency|performance|productivity)\s+by\s+(\d+)%',
-            r'(?:managed|led|supervised)\s+(?:a\s+)?team\s+of\s+(\d+)',
-            r'(?:completed|delivered|launched)\s+(\d+)\s+projects',
-            r'(?:achieved|exceeded|surpassed)\s+(?:targets|goals|quotas)\s+by\s+(\d+)%',
-            r'(?:saved|generated)\s+\$(\d+)',
-            
-            # Student/academic achievements
-            r'(?:won|awarded|received)\s+(?:\d+)?\s*(?:award|honor|recognition|scholarship|prize|medal)',
-            r'(?:served|volunteered)\s+(?:for|as)\s+(\d+)\s+(?:year|month|week|day)',
-            r'(?:GPA|grade|score)\s+of\s+(\d+\.?\d*)',
-            r'(?:ranked|placed)\s+(?:#|number|no\.?|top)\s*(\d+)',
-            r'(?:elected|selected|chosen)\s+(?:as|to|for)\s+(?:president|chair|leader|representative)',
-            r'(?:first|second|third|top)\s+place\s+(?:in|at|for)',
-            r'(?:scholarship|fellowship|grant)\s+(?:recipient|awardee|winner)',
-            r'(?:founded|established|created|started)\s+(?:a|an|the)',
-            r'(?:published|presented|authored)\s+(?:paper|article|research|thesis)',
-            
-            # Competition achievements (common in student resumes)
-            r'(?:winner|finalist|runner-up|champion)\s+(?:of|in|at)',
-            r'(?:competed|participated|represented)\s+(?:in|at)\s+(?:national|international|regional|global)',
-            r'(?:hackathon|competition|contest|challenge|olympiad)',
-            
-            # Leadership achievements (common in student resumes)
-            r'(?:president|chair|leader|head|captain|chief|director)\s+of',
-            r'(?:led|organized|coordinated|managed|spearheaded)\s+(?:a|an|the)',
-            r'(?:committee\s+member|executive\s+board|student\s+council)',
-            
-            # Project achievements (common in student resumes)
-            r'(?:developed|built|created|designed|implemented)\s+(?:a|an|the)\s+(?:successful|innovative|award-winning)',
-            r'(?:project|application|system|solution|website|platform)\s+(?:that|which|for)',
-            r'(?:increased|improved|enhanced|optimized|streamlined)\s+(?:user|customer|client|student)'
-        ]
-        
         achievement_count = 0
         achievement_values = []
         
-        for pattern in achievement_patterns:
-            matches = re.finditer(pattern, all_sections_text, re.IGNORECASE)
-            for match in matches:
+        for pattern in ACHIEVEMENT_PATTERNS:
+            for match in pattern.finditer(all_sections_text):
                 achievement_count += 1
                 if match.groups() and match.group(1):
                     try:
@@ -881,33 +1179,9 @@ class ScoringService:
                     except:
                         pass
         
-        # Look for student-specific achievement keywords
-        student_achievement_keywords = [
-            "dean's list", "honor roll", "scholarship", "cum laude", "magna cum laude", "summa cum laude",
-            "valedictorian", "salutatorian", "top student", "academic excellence", "outstanding student",
-            "merit award", "perfect attendance", "perfect score", "high distinction", "distinction",
-            "honor society", "research grant", "best paper", "best poster", "best presentation",
-            "outstanding performance", "exceptional achievement", "academic award", "leadership award",
-            "community service award", "volunteer award", "recognition", "certificate of achievement",
-            "gold medal", "silver medal", "bronze medal", "first place", "second place", "third place",
-            "winner", "finalist", "semi-finalist", "honorable mention", "special mention", "commendation",
-            "prize", "top performer", "star performer", "excellence award", "exceptional contribution"
-        ]
-        
-        for keyword in student_achievement_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', all_sections_text, re.IGNORECASE):
-                achievement_count += 1
-        
-        # Look for Malaysian-specific achievement indicators
-        malaysian_achievements = [
-            "ASEAN", "PETRONAS", "Khazanah", "CIMB", "Maybank", "Axiata", "TalentCorp", "YTL",
-            "Astro", "Maxis", "Digi", "Sunway", "CIMB ASEAN", "Maybank GO Ahead",
-            "Shell", "Ecoworld", "Gamuda", "MARA", "JPA", "MyBrain", "PTPTN"
-        ]
-        
-        for keyword in malaysian_achievements:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', all_sections_text, re.IGNORECASE):
-                achievement_count += 1
+        # Look for student-specific and Malaysian achievement keywords
+        found_keywords = ACHIEVEMENT_KEYWORD_MATCHER.found_terms(all_sections_text)
+        achievement_count += sum(len(keywords) for keywords in found_keywords.values())
         
         # Calculate achievement score based on count
         if achievement_count == 0:
@@ -938,40 +1212,27 @@ class ScoringService:
         
         return achievement_score, achievement_bonus
     
-    def cultural_fit_score(self, resume_data: Dict[str, Any], job_description: str) -> float:
+    def cultural_fit_score(self, resume_data: Dict[str, Any], job_profile: JobProfile) -> float:
         """
         Calculate score based on cultural fit / soft skills
         
         Args:
             resume_data: Structured resume data
-            job_description: Job description text
+            job_profile: Parsed job description
             
         Returns:
             Cultural fit score (0-100)
         """
-        # Define common soft skills
-        soft_skills = [
-            "communication", "teamwork", "leadership", "problem solving", "critical thinking",
-            "time management", "adaptability", "flexibility", "creativity", "collaboration",
-            "interpersonal", "organization", "detail oriented", "work ethic", "self motivated",
-            "proactive", "decision making", "conflict resolution", "customer service"
-        ]
-        
-        # Find soft skills in job description
-        job_soft_skills = []
-        for skill in soft_skills:
-            if re.search(r'\b' + skill + r'\b', job_description, re.IGNORECASE):
-                job_soft_skills.append(skill)
+        # Soft skills in job description
+        job_soft_skills = job_profile.soft_skills
         
         if not job_soft_skills:
             return 50.0  # Default middle score if no soft skills mentioned
         
         # Find soft skills in resume
         resume_text = " ".join(resume_data.get("sections", {}).values())
-        resume_soft_skills = []
-        for skill in soft_skills:
-            if re.search(r'\b' + skill + r'\b', resume_text, re.IGNORECASE):
-                resume_soft_skills.append(skill)
+        found_soft_skills = SOFT_SKILL_MATCHER.found_terms(resume_text).get("soft_skills", set())
+        resume_soft_skills = [skill for skill in SOFT_SKILLS if skill in found_soft_skills]
         
         # Calculate match percentage
         if job_soft_skills:
@@ -991,44 +1252,19 @@ class ScoringService:
         Returns:
             List of keywords
         """
-        keywords = []
-        
-        # Define patterns for different types of keywords
-        patterns = {
-            "skills": [
-                # Programming languages
-                r'\b(?:Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Go|Rust|Swift|Kotlin)\b',
-                # Frameworks and libraries
-                r'\b(?:React|Angular|Vue|Django|Flask|Spring|Express|TensorFlow|PyTorch|Pandas|NumPy)\b',
-                # Databases
-                r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Oracle|SQLite|Redis|Cassandra|DynamoDB)\b',
-                # Cloud platforms
-                r'\b(?:AWS|Azure|GCP|Google Cloud|Heroku|Kubernetes|Docker|CI/CD)\b',
-                # Tools and technologies
-                r'\b(?:Git|GitHub|GitLab|Jira|Agile|Scrum|REST|GraphQL|API|JSON|XML)\b',
-            ],
-            "soft_skills": [
-                r'\b(?:Communication|Teamwork|Leadership|Problem[\s-]Solving|Critical Thinking)\b',
-                r'\b(?:Time Management|Adaptability|Flexibility|Creativity|Collaboration)\b'
-            ],
-            "education": [
-                r'\b(?:Bachelor|Master|PhD|Doctorate|Degree|BS|MS|BA|MA)\b',
-                r'\b(?:Computer Science|Engineering|Information Technology|Business|Mathematics)\b'
-            ],
-            "experience": [
-                r'\b(?:\d+\+?\s*years?)\b',
-                r'\b(?:Senior|Junior|Mid-level|Lead|Manager|Director)\b'
-            ]
-        }
-        
-        # Extract keywords using patterns
-        for category, category_patterns in patterns.items():
-            for pattern in category_patterns:
-                matches = re.finditer(pattern, job_description, re.IGNORECASE)
-                for match in matches:
-                    keyword = match.group(0)
-                    if keyword not in keywords:
-                        keywords.append(keyword)
+        # Technical skills, then soft skills, under their canonical names
+        skills = skill_taxonomy.current().find_skills(job_description)
+        keywords = [skill.name for skill in sorted(skills, key=lambda skill: skill.category == "soft_skills")]
+        
+        # Education, experience years and job levels as written in the job description
+        skill_matches = JOB_KEYWORD_MATCHER.find_all(job_description)
+        written = [job_description[match.start:match.end]
+                   for group in ("degrees", "fields") for match in select_alternation(skill_matches, group)]
+        written += [match.group(0) for match in JOB_YEARS_PATTERN.finditer(job_description)]
+        written += [job_description[match.start:match.end] for match in select_alternation(skill_matches, "levels")]
+        for keyword in written:
+            if keyword not in keywords:
+                keywords.append(keyword)
         
         return keywords
     
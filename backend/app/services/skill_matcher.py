@@ -0,0 +1,240 @@
+import re
+from collections import deque
+from typing import Dict, List, NamedTuple, Sequence, Set, Tuple
+
+# Units the matcher works on: runs of word characters, and every other
+# non-space character on its own. \b can only fall between two tokens or
+# at the edge of the text, so a term never starts or ends inside a token.
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Parts of a term: the whitespace markers \s+ (any whitespace run) and \s
+# (exactly one whitespace character), literal spaces, and tokens
+TERM_PART_PATTERN = re.compile(r"\\s\+|\\s| +|\w+|[^\w\s]")
+
+class _Term(NamedTuple):
+    """A compiled dictionary term, stored at the automaton state where it ends"""
+    group: str
+    priority: int
+    term: str
+    separators: Tuple[str, ...]
+    # Whether \b has to be checked: a term starting and ending with word
+    # characters always spans whole tokens, so \b holds at both ends
+    check_edges: bool
+
+class SkillMatch(NamedTuple):
+    """One occurrence of a dictionary term in a text"""
+    start: int
+    end: int
+    group: str
+    priority: int
+    term: str
+
+def _is_word_char(char: str) -> bool:
+    """Same definition as \\w for str patterns"""
+    return char.isalnum() or char == "_"
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Whether \\b matches at an offset of the text"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+def _parse_term(term: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a term into lower-case tokens and the separators between them
+
+    A separator is "" when the tokens must be adjacent ("node.js"), the
+    literal spaces of the term ("google cloud"), or the markers "\\s" and
+    "\\s+" copied from the regex alternatives the term replaces.
+    """
+    tokens, separators = [], []
+    separator = ""
+    for part in TERM_PART_PATTERN.findall(term):
+        if part.startswith("\\s") or part.isspace():
+            separator = part
+            continue
+        if tokens:
+            separators.append(separator)
+        tokens.append(part.lower())
+        separator = ""
+    return tuple(tokens), tuple(separators)
+
+def _separator_matches(separator: str, text: str, start: int, end: int) -> bool:
+    """Check the text between two matched tokens against a term separator"""
+    if not separator:
+        return start == end
+    if separator == "\\s+":
+        return end > start
+    if separator == "\\s":
+        return end - start == 1
+    return text[start:end] == separator
+
+class SkillMatcher:
+    """
+    Dictionary matcher finding many terms in one pass over a text
+
+    Terms are organized in named groups and compiled into an Aho–Corasick
+    automaton over word tokens. find_all reports every occurrence of every
+    term, case-insensitively and with the same \\b word-boundary semantics as
+    re.search(r'\\b' + re.escape(term) + r'\\b', text, re.IGNORECASE), so one
+    scan replaces a regex search per term. Build matchers once, at import time.
+
+    Terms are literal text, except that "\\s+" and "\\s" inside a term stand
+    for any whitespace run and for exactly one whitespace character, as in
+    the regex alternatives they replace (r"React\\s+Native").
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        """
+        Compile the automaton
+
+        Args:
+            groups: Terms of each group; a term's position in its group is its
+                priority, used by select_alternation
+        """
+        self.groups = {group: list(terms) for group, terms in groups.items()}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[_Term]] = [[]]
+
+        for group, terms in self.groups.items():
+            for priority, term in enumerate(terms):
+                tokens, separators = _parse_term(term)
+                if not tokens:
+                    raise ValueError(f"Empty term in skill group '{group}'")
+                state = 0
+                for token in tokens:
+                    next_state = self._goto[state].get(token)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][token] = next_state
+                        self._goto.append({})
+                        self._outputs.append([])
+                    state = next_state
+                check_edges = not (_is_word_char(term[0]) and _is_word_char(term[-1]))
+                self._outputs[state].append(_Term(group, priority, term, separators, check_edges))
+
+        self._fail = self._build_failure_links()
+        # Tokens outside every term reset the automaton
+        self._vocabulary: Set[str] = {token for transitions in self._goto for token in transitions}
+
+    def _build_failure_links(self) -> List[int]:
+        """Breadth-first failure links; each state also inherits the outputs of its fallback"""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                fallback = fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = self._goto[fallback].get(token, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[fail[next_state]]
+                queue.append(next_state)
+        return fail
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """
+        Find every occurrence of every term
+
+        Occurrences of different terms may overlap. Offsets refer to the text
+        as given, so text[match.start:match.end] is the matched original text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Matches sorted by start offset, then group and priority
+        """
+        goto, fail, outputs, vocabulary = self._goto, self._fail, self._outputs, self._vocabulary
+        # Lower-case the text once; offsets stay valid unless lower() changes
+        # its length (e.g. "İ"), in which case tokens are lower-cased one by one
+        lowered = text.lower()
+        lower_tokens = len(lowered) != len(text)
+        if lower_tokens:
+            lowered = text
+
+        run = []  # Consecutive dictionary tokens ending at the current one
+        matches = []
+        state = 0
+
+        for token_match in TOKEN_PATTERN.finditer(lowered):
+            token = token_match.group()
+            if lower_tokens:
+                token = token.lower()
+            if token not in vocabulary:
+                state = 0
+                if run:
+                    run = []
+                continue
+
+            run.append(token_match)
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            for group, priority, term, separators, check_edges in outputs[state]:
+                start, end = token_match.start(), token_match.end()
+                if separators:
+                    first = len(run) - len(separators) - 1
+                    if not all(_separator_matches(separator, text, run[first + i].end(), run[first + i + 1].start())
+                               for i, separator in enumerate(separators)):
+                        continue
+                    start = run[first].start()
+                if check_edges and not (_is_boundary(text, start) and _is_boundary(text, end)):
+                    continue
+                matches.append(SkillMatch(start, end, group, priority, term))
+
+        matches.sort(key=lambda match: (match.start, match.group, match.priority))
+        return matches
+
+    def found_terms(self, text: str) -> Dict[str, Set[str]]:
+        """Terms of each group that occur in the text (groups without matches are omitted)"""
+        found: Dict[str, Set[str]] = {}
+        for match in self.find_all(text):
+            found.setdefault(match.group, set()).add(match.term)
+        return found
+
+def select_alternation(matches: Sequence[SkillMatch], group: str) -> List[SkillMatch]:
+    """
+    Keep the matches re.finditer would report for the group as one alternation
+
+    For a group ["Java", "JavaScript"] this gives the matches of
+    re.finditer(r'\\b(?:Java|JavaScript)\\b', text, re.IGNORECASE): scanning
+    left to right, the first term in group order that matches at a position
+    wins, and matching resumes after its end.
+
+    Args:
+        matches: Output of SkillMatcher.find_all (sorted by start and priority)
+        group: Group to select
+
+    Returns:
+        Non-overlapping matches of the group in text order
+    """
+    selected = []
+    last_end = 0
+    for match in matches:
+        if match.group == group and match.start >= last_end:
+            selected.append(match)
+            last_end = match.end
+    return selected
+
+def select_longest(matches: Sequence[SkillMatch]) -> List[SkillMatch]:
+    """
+    Keep the leftmost-longest non-overlapping matches
+
+    Where terms overlap, the one starting first wins, and of those starting at
+    the same offset the longest ("React Native" over "React").
+
+    Args:
+        matches: Output of SkillMatcher.find_all, or a subset of it
+
+    Returns:
+        Non-overlapping matches in text order
+    """
+    selected = []
+    last_end = 0
+    for match in sorted(matches, key=lambda match: (match.start, -match.end)):
+        if match.start >= last_end:
+            selected.append(match)
+            last_end = match.end
+    return selected
@@ -0,0 +1,338 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.skill_matcher import SkillMatcher, select_longest
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "skill_taxonomy.json")
+
+# Category of broad terms that are only used by the NLP keyword extraction
+GENERAL_CATEGORY = "general"
+
+# Keywords whose weight is remembered by each taxonomy; the memo is cleared when full
+WEIGHT_CACHE_SIZE = 4096
+
+@dataclass(frozen=True)
+class Skill:
+    """A taxonomy entry: canonical name, category, alternative spellings and keyword weight"""
+    name: str
+    category: str
+    aliases: Tuple[str, ...] = ()
+    # Importance in the keyword overlap bonus: 0 not counted, 1 important, 3 key technology
+    weight: float = 0.0
+
+def _normalize(term: str) -> str:
+    """Lookup key of a name or alias: lower case, single spaces"""
+    return " ".join(term.lower().split())
+
+def _matcher_term(term: str) -> str:
+    """SkillMatcher term for a name or alias; spaces match any whitespace run"""
+    return re.sub(r"\s+", r"\\s+", term.strip())
+
+class SkillTaxonomy:
+    """
+    Compiled, read-only index of a skill taxonomy
+
+    Built once per taxonomy file version: a SkillMatcher over every name and
+    alias (one group per category) and lookup tables by name, alias and
+    weight. Instances are never modified, so they can be shared between
+    threads without locking.
+    """
+
+    def __init__(self, skills: List[Skill], categories: Dict[str, str], version: str = "", source: str = ""):
+        """
+        Compile the index
+
+        Args:
+            skills: Taxonomy entries
+            categories: Description of each category
+            version: Version string of the taxonomy file
+            source: File the taxonomy was loaded from
+
+        Raises:
+            ValueError: A skill has an unknown category, or a name or alias is used twice
+        """
+        self.version = version
+        self.source = source
+        self.categories = dict(categories)
+        self.skills: Dict[str, Skill] = {}
+        self._by_term: Dict[str, Skill] = {}
+        self._by_matcher_term: Dict[str, Skill] = {}
+        groups: Dict[str, List[str]] = {category: [] for category in self.categories}
+
+        for skill in skills:
+            if skill.category not in groups:
+                raise ValueError(f"{source}: skill '{skill.name}' has unknown category '{skill.category}'")
+            for term in (skill.name, *skill.aliases):
+                key = _normalize(term)
+                if key in self._by_term:
+                    raise ValueError(f"{source}: '{term}' is used by both '{self._by_term[key].name}' and '{skill.name}'")
+                self._by_term[key] = skill
+                matcher_term = _matcher_term(term)
+                self._by_matcher_term[matcher_term] = skill
+                groups[skill.category].append(matcher_term)
+            self.skills[skill.name] = skill
+
+        self.matcher = SkillMatcher(groups)
+        # Names and aliases of weighted skills, for weight_of
+        self._weighted_terms = [(key, skill.weight) for key, skill in self._by_term.items() if skill.weight > 0]
+        self._weight_cache: Dict[str, float] = {}
+
+    def lookup(self, term: str) -> Optional[Skill]:
+        """Skill with this name or alias (case-insensitive), if any"""
+        return self._by_term.get(_normalize(term))
+
+    def find_skills(self, text: str, include_general: bool = False) -> List[Skill]:
+        """
+        Skills mentioned in a text
+
+        Names and aliases are matched case-insensitively on word boundaries;
+        where they overlap the leftmost-longest one wins ("React Native" is
+        not also reported as "React").
+
+        Args:
+            text: Text to search
+            include_general: Also report skills of the general category
+
+        Returns:
+            Distinct skills in order of first mention
+        """
+        matches = self.matcher.find_all(text)
+        if not include_general:
+            matches = [match for match in matches if match.group != GENERAL_CATEGORY]
+
+        skills = []
+        seen = set()
+        for match in select_longest(matches):
+            skill = self._by_matcher_term[match.term]
+            if skill.name not in seen:
+                seen.add(skill.name)
+                skills.append(skill)
+        return skills
+
+    def weight_of(self, keyword: str) -> float:
+        """Highest weight of the skills whose name or alias occurs in the keyword, 0 if none"""
+        weight = self._weight_cache.get(keyword)
+        if weight is None:
+            keyword_lower = keyword.lower()
+            weight = max((weight for term, weight in self._weighted_terms if term in keyword_lower), default=0.0)
+            if len(self._weight_cache) >= WEIGHT_CACHE_SIZE:
+                self._weight_cache.clear()
+            self._weight_cache[keyword] = weight
+        return weight
+
+def parse_taxonomy(data: Dict[str, Any], source: str = "") -> SkillTaxonomy:
+    """
+    Validate the contents of a taxonomy file and compile them
+
+    The file is a JSON object with a "version" string, a "categories" object
+    mapping each category to its description, and a "skills" list of objects
+    with "name", "category", and optional "aliases" (list of strings) and
+    "weight" (number, default 0).
+
+    Args:
+        data: Parsed JSON
+        source: File name used in error messages
+
+    Returns:
+        Compiled SkillTaxonomy
+
+    Raises:
+        ValueError: The contents are not a valid taxonomy
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: expected a JSON object")
+    categories = data.get("categories")
+    if not isinstance(categories, dict) or not categories:
+        raise ValueError(f"{source}: 'categories' must be a non-empty object")
+    entries = data.get("skills")
+    if not isinstance(entries, list):
+        raise ValueError(f"{source}: 'skills' must be a list")
+
+    skills = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{source}: skill {index} must be an object")
+        name = entry.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"{source}: skill {index} needs a non-empty 'name'")
+        aliases = entry.get("aliases", [])
+        if not isinstance(aliases, list) or not all(isinstance(alias, str) and alias.strip() for alias in aliases):
+            raise ValueError(f"{source}: aliases of '{name}' must be a list of non-empty strings")
+        weight = entry.get("weight", 0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{source}: weight of '{name}' must be a non-negative number")
+        skills.append(Skill(name.strip(), entry.get("category"), tuple(alias.strip() for alias in aliases), float(weight)))
+
+    return SkillTaxonomy(skills, categories, version=str(data.get("version", "")), source=source)
+
+def load_taxonomy(path: str) -> SkillTaxonomy:
+    """
+    Read and compile a taxonomy file
+
+    Raises:
+        OSError: The file cannot be read
+        ValueError: The file is not valid JSON or not a valid taxonomy
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return parse_taxonomy(data, source=path)
+
+class SkillTaxonomyStore:
+    """
+    Holds the current skill taxonomy and reloads it when its file changes
+
+    A background thread checks the file's modification time every
+    reload_seconds. A changed file is compiled on that thread and then
+    swapped in with a single reference assignment, so readers calling
+    current() always get a complete taxonomy and never wait for a
+    compilation. A file that fails to load is logged and the previous
+    taxonomy stays in use.
+
+    Each process runs its own watcher; it is started by the first current()
+    call, so worker processes pick up changes too.
+    """
+
+    def __init__(self, path: str = None, reload_seconds: float = None):
+        """
+        Load the taxonomy
+
+        Args:
+            path: Taxonomy file (default: SKILL_TAXONOMY_PATH, or the bundled file)
+            reload_seconds: Seconds between file checks, 0 to disable reloading
+                (default: SKILL_TAXONOMY_RELOAD_SECONDS)
+
+        Raises:
+            OSError, ValueError: The taxonomy file cannot be loaded
+        """
+        if path is None:
+            path = os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+        if reload_seconds is None:
+            reload_seconds = float(os.getenv("SKILL_TAXONOMY_RELOAD_SECONDS", "5"))
+
+        self.path = path
+        self.reload_seconds = reload_seconds
+        self._signature = self._file_signature()
+        self._taxonomy = load_taxonomy(path)
+        self.loaded_at = time.time()
+        self._listeners: List[Callable[[SkillTaxonomy], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_pid: Optional[int] = None
+        self.reloads = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        logger.info(f"Loaded skill taxonomy {self._taxonomy.version} with {len(self._taxonomy.skills)} skills from {path}")
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Modification time, size and inode of the file, None if it cannot be read"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def current(self) -> SkillTaxonomy:
+        """The current taxonomy; call once per operation and use the returned object throughout"""
+        if self.reload_seconds > 0 and self._watcher_pid != os.getpid():
+            self.start_watcher()
+        return self._taxonomy
+
+    def add_listener(self, callback: Callable[[SkillTaxonomy], None]):
+        """Call a function with the new taxonomy after every reload (on the watcher thread)"""
+        self._listeners.append(callback)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the taxonomy if its file changed since the last load
+
+        Returns:
+            True if a new taxonomy was swapped in
+        """
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return False
+
+        with self._lock:
+            if signature == self._signature:
+                return False
+            # Remember the failed version too, so it is retried only when the file changes again
+            self._signature = signature
+            try:
+                taxonomy = load_taxonomy(self.path)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                self.last_error = str(e)
+                logger.error(f"Could not reload skill taxonomy, keeping version {self._taxonomy.version}: {str(e)}")
+                return False
+            self._taxonomy = taxonomy
+            self.loaded_at = time.time()
+            self.reloads += 1
+            self.last_error = None
+
+        logger.info(f"Reloaded skill taxonomy {taxonomy.version} with {len(taxonomy.skills)} skills")
+        for callback in self._listeners:
+            try:
+                callback(taxonomy)
+            except Exception as e:
+                logger.error(f"Skill taxonomy reload listener failed: {str(e)}")
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self.reload_seconds):
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                logger.error(f"Skill taxonomy watcher error: {str(e)}")
+
+    def start_watcher(self):
+        """Start the file watcher thread of this process (no-op if running or reloading is disabled)"""
+        if self.reload_seconds <= 0:
+            return
+        with self._lock:
+            if self._watcher_pid == os.getpid():
+                return
+            self._stop = threading.Event()
+            self._watcher = threading.Thread(target=self._watch, name="skill-taxonomy-watcher", daemon=True)
+            self._watcher.start()
+            self._watcher_pid = os.getpid()
+
+    def stop_watcher(self):
+        """Stop the file watcher thread"""
+        watcher = self._watcher
+        self._stop.set()
+        if watcher is not None and self._watcher_pid == os.getpid():
+            watcher.join(timeout=5)
+        self._watcher = None
+        self._watcher_pid = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Version, size and reload counters of the taxonomy"""
+        taxonomy = self._taxonomy
+        return {
+            "path": self.path,
+            "version": taxonomy.version,
+            "skills": len(taxonomy.skills),
+            "categories": len(taxonomy.categories),
+            "loadedAt": self.loaded_at,
+            "reloadSeconds": self.reload_seconds,
+            "reloads": self.reloads,
+            "errors": self.errors,
+            "lastError": self.last_error
+        }
+
+# Shared taxonomy of this process, loaded at import time
+skill_taxonomy = SkillTaxonomyStore()
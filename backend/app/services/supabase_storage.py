@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 import json
 import re
@@ -26,8 +27,15 @@ logger = logging.getLogger(__name__)
 class SupabaseStorageService:
     """Service for storing and retrieving data from Supabase"""
     
-    def __init__(self):
-        """Initialize the Supabase client"""
+    def __init__(self, executor=None):
+        """
+        Initialize the Supabase client
+        
+        Args:
+            executor: Optional ExecutorService used to run the blocking Supabase requests
+        """
+        self.executor = executor
+        
         # Get Supabase URL and key from environment variables
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
@@ -62,6 +70,26 @@ class SupabaseStorageService:
         
         print(f"Using mock implementation: {self._use_mock}")
     
+    async def _execute(self, query):
+        """
+        Execute a Supabase query without blocking the event loop
+        
+        The Supabase client is synchronous, so the request runs on the executor's
+        thread pool (or the loop's default pool) and concurrent storage operations
+        can overlap.
+        
+        Args:
+            query: Supabase query builder to execute
+            
+        Returns:
+            Query response
+        """
+        if self.executor is not None:
+            return await self.executor.run_in_thread(query.execute)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, query.execute)
+    
     async def store_job_description(self, job_description: str, folder_id: str, user_id: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
         Store job description in Supabase
@@ -84,15 +112,15 @@ class SupabaseStorageService:
                 return True, "Job description stored successfully (mock)", {"id": job_id}
             
             # First check if a job description already exists for this folder
-            job_desc_query = self.supabase_client.table('job_descriptions').select('*').eq('folder_id', folder_id).execute()
+            job_desc_query = await self._execute(self.supabase_client.table('job_descriptions').select('*').eq('folder_id', folder_id))
             
             if job_desc_query.data and len(job_desc_query.data) > 0:
                 # Update existing job description
                 job_id = job_desc_query.data[0]['id']
-                update_result = self.supabase_client.table('job_descriptions').update({
+                update_result = await self._execute(self.supabase_client.table('job_descriptions').update({
                     'description': job_description,
                     'updated_at': datetime.now().isoformat()
-                }).eq('id', job_id).execute()
+                }).eq('id', job_id))
                 
                 return True, "Job description updated successfully", {"id": job_id}
             else:
@@ -106,7 +134,7 @@ class SupabaseStorageService:
                     'updated_at': datetime.now().isoformat()
                 }
                 
-                insert_result = self.supabase_client.table('job_descriptions').insert(job_desc).execute()
+                insert_result = await self._execute(self.supabase_client.table('job_descriptions').insert(job_desc))
                 
                 return True, "Job description created successfully", job_desc
                 
@@ -163,19 +191,19 @@ class SupabaseStorageService:
             }
             
             # First check if an analysis result already exists for this file and job description
-            query_result = self.supabase_client.table('analysis_results').select('*').eq('file_id', file_id).eq('job_description_id', job_description_id).execute()
+            query_result = await self._execute(self.supabase_client.table('analysis_results').select('*').eq('file_id', file_id).eq('job_description_id', job_description_id))
             
             if query_result.data and len(query_result.data) > 0:
                 # Update existing analysis result
                 existing_id = query_result.data[0]['id']
                 result_data['id'] = existing_id
                 
-                update_result = self.supabase_client.table('analysis_results').update(result_data).eq('id', existing_id).execute()
+                update_result = await self._execute(self.supabase_client.table('analysis_results').update(result_data).eq('id', existing_id))
                 
                 return True, "Analysis result updated successfully", result_data
             else:
                 # Create new analysis result
-                insert_result = self.supabase_client.table('analysis_results').insert(result_data).execute()
+                insert_result = await self._execute(self.supabase_client.table('analysis_results').insert(result_data))
                 
                 return True, "Analysis result created successfully", result_data
                 
@@ -208,7 +236,7 @@ class SupabaseStorageService:
                 }
             
             # Query job description
-            query_result = self.supabase_client.table('job_descriptions').select('*').eq('folder_id', folder_id).execute()
+            query_result = await self._execute(self.supabase_client.table('job_descriptions').select('*').eq('folder_id', folder_id))
             
             if query_result.data and len(query_result.data) > 0:
                 return True, "Job description retrieved successfully", query_result.data[0]
@@ -244,7 +272,7 @@ class SupabaseStorageService:
                 }]
             
             # Query analysis results
-            query_result = self.supabase_client.table('analysis_results').select('*').eq('folder_id', folder_id).execute()
+            query_result = await self._execute(self.supabase_client.table('analysis_results').select('*').eq('folder_id', folder_id))
             
             if query_result.data and len(query_result.data) > 0:
                 # Parse JSON fields
@@ -291,7 +319,7 @@ class SupabaseStorageService:
                 }
             
             # Query analysis result
-            query_result = self.supabase_client.table('analysis_results').select('*').eq('id', result_id).execute()
+            query_result = await self._execute(self.supabase_client.table('analysis_results').select('*').eq('id', result_id))
             
             if query_result.data and len(query_result.data) > 0:
                 # Parse JSON fields
@@ -329,7 +357,7 @@ class SupabaseStorageService:
                 return True, "Analysis result deleted successfully (mock)"
             
             # Delete analysis result
-            delete_result = self.supabase_client.table('analysis_results').delete().eq('id', result_id).execute()
+            delete_result = await self._execute(self.supabase_client.table('analysis_results').delete().eq('id', result_id))
             
             return True, "Analysis result deleted successfully"
                 
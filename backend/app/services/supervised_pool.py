@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+class JobTimeoutError(TimeoutError):
+    """A job exceeded its wall-clock limit; its worker process was killed"""
+
+class WorkerCrashedError(RuntimeError):
+    """A worker process died while running a job (e.g. killed for using too much memory)"""
+
+class WorkerMemoryError(MemoryError):
+    """A job exceeded the worker memory limit; its worker process was replaced"""
+
+def _apply_memory_limit(memory_limit_mb: int):
+    """Cap the address space of the current process (POSIX only)"""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not apply worker memory limit: {str(e)}")
+
+def _worker_main(conn, memory_limit_mb: int):
+    """
+    Worker process loop: run (func, args, kwargs) jobs received on the pipe
+
+    Each reply is (status, value): ("ok", return value), ("error", message) or
+    ("memory", message) if the job ran out of memory.
+    """
+    _apply_memory_limit(memory_limit_mb)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        func, args, kwargs = job
+        try:
+            reply = ("ok", func(*args, **kwargs))
+        except MemoryError as e:
+            reply = ("memory", f"{type(e).__name__}: {str(e)}")
+        except BaseException as e:
+            reply = ("error", f"{type(e).__name__}: {str(e)}")
+
+        try:
+            conn.send(reply)
+        except MemoryError as e:
+            conn.send(("memory", f"Could not send the job result: {str(e)}"))
+        except Exception as e:
+            conn.send(("error", f"Could not send the job result: {str(e)}"))
+
+class _Worker:
+    """One supervised worker process and its pipe"""
+
+    def __init__(self, context, memory_limit_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit_mb), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def run(self, job, timeout: Optional[float]):
+        """Send a job and wait for its result (blocking)"""
+        self.conn.send(job)
+        if not self.conn.poll(timeout):
+            raise JobTimeoutError(f"Job exceeded {timeout}s")
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            raise WorkerCrashedError(f"Worker process exited with code {self.process.exitcode}")
+
+    def kill(self):
+        """Stop the process immediately"""
+        try:
+            self.process.kill()
+            self.process.join(timeout=5)
+        except Exception:
+            pass
+        self.conn.close()
+
+    def stop(self):
+        """Ask the process to exit, killing it if it does not"""
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=2)
+        except Exception:
+            pass
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+class SupervisedProcessPool:
+    """
+    Process pool that enforces a wall-clock limit per job
+
+    Unlike ProcessPoolExecutor, each worker is owned individually, so a job that
+    overruns its timeout is stopped by killing just its worker, which is then
+    replaced on next use. Workers run with an address-space limit, so a job that
+    tries to use too much memory fails with WorkerMemoryError (or the worker
+    dies) instead of growing without bound; that worker is replaced too, as its
+    heap may be left fragmented or inconsistent.
+
+    Jobs must be picklable module-level functions, as for ProcessPoolExecutor.
+    """
+
+    def __init__(self, workers: int, memory_limit_mb: int = 0):
+        """
+        Initialize the pool; worker processes are started on first use
+
+        Args:
+            workers: Number of worker processes
+            memory_limit_mb: Address-space limit of each worker, 0 for none
+        """
+        self.workers = max(1, workers)
+        self.memory_limit_mb = memory_limit_mb
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: List[Optional[_Worker]] = [None] * self.workers
+        self._idle: Optional[asyncio.Queue] = None
+        self._idle_lock = threading.Lock()
+        # Threads that wait on the worker pipes, one per worker
+        self._waiters = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="supervised")
+        self.timeouts = 0
+        self.crashes = 0
+        self.memory_errors = 0
+
+    def _idle_queue(self) -> asyncio.Queue:
+        with self._idle_lock:
+            if self._idle is None:
+                self._idle = asyncio.Queue()
+                for slot in range(self.workers):
+                    self._idle.put_nowait(slot)
+            return self._idle
+
+    def _run_on_slot(self, slot: int, job, timeout: Optional[float]):
+        """Run a job on a slot's worker, starting or replacing the worker as needed (blocking)"""
+        worker = self._slots[slot]
+        if worker is None or not worker.process.is_alive():
+            if worker is not None:
+                worker.kill()
+            worker = self._slots[slot] = _Worker(self._context, self.memory_limit_mb)
+
+        try:
+            status, value = worker.run(job, timeout)
+        except JobTimeoutError:
+            self.timeouts += 1
+            logger.error(f"Worker {worker.process.pid} exceeded {timeout}s, killing it")
+            worker.kill()
+            self._slots[slot] = None
+            raise
+        except (WorkerCrashedError, OSError) as e:
+            self.crashes += 1
+            logger.error(f"Worker {worker.process.pid} crashed: {str(e)}")
+            worker.kill()
+            self._slots[slot] = None
+            raise WorkerCrashedError(str(e))
+
+        if status == "memory":
+            self.memory_errors += 1
+            logger.error(f"Worker {worker.process.pid} exceeded its memory limit, replacing it")
+            worker.kill()
+            self._slots[slot] = None
+            raise WorkerMemoryError(value)
+        return status, value
+
+    @staticmethod
+    def _release_slot(loop: asyncio.AbstractEventLoop, idle: asyncio.Queue, slot: int):
+        """Return a slot to the idle queue from the waiter thread"""
+        try:
+            loop.call_soon_threadsafe(idle.put_nowait, slot)
+        except RuntimeError:
+            # The event loop is closed (shutdown); nothing waits for the slot
+            pass
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a function on an idle worker
+
+        Args:
+            func: Module-level function to run
+            *args, **kwargs: Arguments for the function
+            timeout: Wall-clock limit in seconds, None for no limit
+
+        Returns:
+            The function's return value
+
+        Raises:
+            JobTimeoutError: The job exceeded the timeout (its worker was killed)
+            WorkerCrashedError: The worker died while running the job
+            WorkerMemoryError: The job exceeded the memory limit (its worker was replaced)
+            RuntimeError: The function raised an exception
+        """
+        idle = self._idle_queue()
+        slot = await idle.get()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._waiters.submit(self._run_on_slot, slot, (func, args, kwargs), timeout)
+        except BaseException:
+            idle.put_nowait(slot)
+            raise
+        # The slot is returned only once the waiter thread is done with the
+        # worker's pipe: if the caller is cancelled, the job keeps running and
+        # the next job must not share the pipe with it
+        future.add_done_callback(lambda _: self._release_slot(loop, idle, slot))
+
+        status, value = await asyncio.wrap_future(future)
+
+        if status != "ok":
+            raise RuntimeError(value)
+        return value
+
+    def stats(self):
+        """Worker and failure counters"""
+        return {
+            "workers": self.workers,
+            "running": sum(1 for worker in self._slots if worker is not None and worker.process.is_alive()),
+            "memoryLimitMb": self.memory_limit_mb,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "memoryErrors": self.memory_errors
+        }
+
+    def shutdown(self):
+        """Stop all worker processes"""
+        for slot, worker in enumerate(self._slots):
+            if worker is not None:
+                worker.stop()
+                self._slots[slot] = None
+        self._waiters.shutdown(wait=False)
@@ -1,11 +1,17 @@
 import tempfile
 import os
 import logging
+import shutil
+import subprocess
 from typing import Optional, Tuple, Dict, Any
 
 # For PDF extraction
 try:
     from pdfminer.high_level import extract_text as pdf_extract_text
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdftypes import resolve1
 except ImportError:
     pdf_extract_text = None
 
@@ -28,6 +34,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Location of the pdftotext binary, looked up once per process (None if not installed)
+PDFTOTEXT_PATH = shutil.which("pdftotext")
+
 class TextExtractionService:
     """Service for extracting text from different document formats"""
     
@@ -83,34 +92,22 @@ class TextExtractionService:
         
         # Try command-line tools if available
         try:
-            import subprocess
-            import platform
-            
-            # Check if pdftotext is available
-            check_cmd = "where pdftotext" if platform.system() == "Windows" else "which pdftotext"
-            subprocess.check_output(check_cmd, shell=True)
-            
-            # Create a temporary file for the text output
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as temp_file:
-                temp_output_path = temp_file.name
+            if PDFTOTEXT_PATH is None:
+                raise FileNotFoundError("pdftotext")
             
-            # Run pdftotext command
+            # Run pdftotext, reading the text from stdout
             logger.info(f"Trying pdftotext command line for {file_path}")
-            cmd = f"pdftotext -layout \"{file_path}\" \"{temp_output_path}\""
-            subprocess.run(cmd, shell=True, check=True)
-            
-            # Read the extracted text
-            with open(temp_output_path, 'r', encoding='utf-8', errors='ignore') as f:
-                text = f.read()
-            
-            # Clean up
-            os.unlink(temp_output_path)
+            result = subprocess.run(
+                [PDFTOTEXT_PATH, "-layout", file_path, "-"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True
+            )
+            text = result.stdout.decode("utf-8", errors="ignore")
             
             if text and len(text.strip()) > 0:
                 logger.info(f"Successfully extracted text using pdftotext for {file_path}")
                 return text
             logger.warning(f"pdftotext returned empty text for {file_path}")
-        except (subprocess.SubprocessError, FileNotFoundError, ImportError):
+        except (subprocess.SubprocessError, FileNotFoundError):
             # Command line tool not available, just continue
             pass
         except Exception as e:
@@ -157,8 +154,8 @@ class TextExtractionService:
             - Extracted text or error message (str)
             - Metadata dictionary (Dict) or None if extraction failed
         """
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        # Create a temporary file (keeping the extension, which selects the extractor)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1].lower()) as temp_file:
             temp_file.write(file_content)
             temp_file_path = temp_file.name
         
@@ -168,12 +165,15 @@ class TextExtractionService:
             text = self.extract_text(temp_file_path)
             
             if text and len(text.strip()) > 0:
+                # Real page count for PDFs, estimated from the text otherwise
+                page_count = self._count_pages(temp_file_path) if filename.lower().endswith('.pdf') else None
+                
                 # Create metadata
                 metadata = {
                     "file_name": filename,
                     "file_size_mb": round(file_size, 2),
                     "text_length": len(text),
-                    "pages": self._estimate_page_count(text),
+                    "pages": page_count or self._estimate_page_count(text),
                     "extraction_method": "standard",
                     "extraction_status": "success",
                     "original_filename": filename
@@ -187,6 +187,37 @@ class TextExtractionService:
             # Clean up the temporary file
             os.unlink(temp_file_path)
     
+    def _count_pages(self, file_path: str) -> Optional[int]:
+        """
+        Number of pages read from the PDF structure, without extracting any text
+        
+        Args:
+            file_path: Path to the PDF file
+            
+        Returns:
+            Page count, or None if it could not be read
+        """
+        if fitz is not None:
+            try:
+                with fitz.open(file_path) as doc:
+                    return doc.page_count
+            except Exception as e:
+                logger.warning(f"PyMuPDF could not count pages of {file_path}: {e}")
+        
+        if pdf_extract_text is not None:
+            try:
+                with open(file_path, "rb") as f:
+                    document = PDFDocument(PDFParser(f))
+                    # The page tree root holds the total count
+                    count = resolve1(resolve1(document.catalog["Pages"]).get("Count"))
+                    if isinstance(count, int) and count > 0:
+                        return count
+                    return sum(1 for _ in PDFPage.create_pages(document))
+            except Exception as e:
+                logger.warning(f"pdfminer could not count pages of {file_path}: {e}")
+        
+        return None
+    
     def _estimate_page_count(self, text: str) -> int:
         """
         Estimate the number of pages based on text length
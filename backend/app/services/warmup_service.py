@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from app.services.executor_service import extract_text_job
+from app.services.model_registry import model_registry
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Components that can be warmed up, in the order they are warmed
+WARMUP_COMPONENTS = ["sentence_model", "name_model", "extraction"]
+
+def build_sample_pdf(text: str = "Warmup Resume") -> bytes:
+    """
+    Build a minimal one-page PDF containing a line of text
+
+    Used for the dummy extraction, so warming up does not need a sample file.
+    """
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    stream = f"BT /F1 12 Tf 72 720 Td ({escaped}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream)).encode("ascii") + b" >>\nstream\n" + stream + b"\nendstream"
+    ]
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode("ascii")
+    pdf += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode("ascii")
+    return pdf
+
+class WarmupService:
+    """
+    Loads the models and runs dummy work before the first real request
+
+    Each component records whether it is warm, how long warming it took and the
+    error if it failed, so a load balancer can wait for the worker via /ready.
+    """
+
+    def __init__(self, executor_service, scoring_service, distilbert_service,
+                 enabled: Optional[bool] = None, components: Optional[List[str]] = None):
+        """
+        Initialize the warmup service
+
+        Args:
+            executor_service: ExecutorService running the blocking work
+            scoring_service: ScoringService whose sentence model is loaded
+            distilbert_service: DistilBERTExtractionService whose models are loaded
+            enabled: Whether to warm up at startup (default: WARMUP_ON_STARTUP)
+            components: Components to warm up (default: WARMUP_COMPONENTS env var, all components)
+        """
+        if enabled is None:
+            enabled = os.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+        if components is None:
+            configured = os.getenv("WARMUP_COMPONENTS", ",".join(WARMUP_COMPONENTS))
+            components = [name.strip() for name in configured.split(",") if name.strip()]
+
+        unknown = [name for name in components if name not in WARMUP_COMPONENTS]
+        if unknown:
+            logger.warning(f"Ignoring unknown warmup components: {', '.join(unknown)}")
+
+        self.executor_service = executor_service
+        self.scoring_service = scoring_service
+        self.distilbert_service = distilbert_service
+        self.enabled = enabled
+        self.components = [name for name in WARMUP_COMPONENTS if name in components]
+        self.state = "pending" if enabled else "disabled"
+        self.results: Dict[str, Dict[str, Any]] = {
+            name: {"warm": False, "seconds": None, "error": None} for name in self.components
+        }
+        self.started_at: Optional[float] = None
+        self.duration: Optional[float] = None
+
+    async def _warm_sentence_model(self):
+        """Load the shared sentence transformer and run one encode"""
+        await self.executor_service.run_in_thread(self.scoring_service._load_model)
+        await self.executor_service.run_in_thread(
+            self.scoring_service.sentence_model.encode, ["Experienced software engineer"]
+        )
+
+    async def _warm_name_model(self):
+        """Load the name extraction model and its name prototype embedding"""
+        await self.executor_service.run_in_thread(self.distilbert_service._load_models)
+
+    async def _warm_extraction(self):
+        """Extract a dummy PDF on every extraction worker"""
+        sample_pdf = build_sample_pdf()
+        workers = self.executor_service.isolated_workers if self.executor_service.use_processes else 1
+
+        # Concurrent jobs make the pool start all of its worker processes
+        results = await asyncio.gather(*[
+            self.executor_service.run_isolated(extract_text_job, sample_pdf, "warmup.pdf", False)
+            for _ in range(workers)
+        ])
+
+        for success, text_or_error, _ in results:
+            if not success:
+                raise RuntimeError(text_or_error)
+
+    async def run(self):
+        """Warm up the configured components one after another"""
+        self.state = "running"
+        self.started_at = time.time()
+        logger.info(f"Warming up: {', '.join(self.components) or 'nothing'}")
+
+        for name in self.components:
+            start = time.time()
+            try:
+                await getattr(self, f"_warm_{name}")()
+                self.results[name]["warm"] = True
+            except Exception as e:
+                logger.error(f"Warmup of {name} failed: {str(e)}")
+                self.results[name]["error"] = str(e)
+            self.results[name]["seconds"] = round(time.time() - start, 3)
+
+        self.duration = time.time() - self.started_at
+        self.state = "done"
+        logger.info(f"Warmup finished in {self.duration:.2f}s")
+
+    @property
+    def ready(self) -> bool:
+        """Whether the worker is ready for traffic"""
+        if self.state == "disabled":
+            return True
+        return self.state == "done" and all(result["warm"] for result in self.results.values())
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness, per-component warm state and the warmup duration"""
+        return {
+            "ready": self.ready,
+            "warmup": self.state,
+            "warmupSeconds": round(self.duration, 3) if self.duration is not None else None,
+            "components": {name: dict(result) for name, result in self.results.items()},
+            "models": model_registry.stats()["models"]
+        }
@@ -0,0 +1,82 @@
+"""
+Regression benchmark for QwenProcessingService.extract_candidate_info on long resumes
+
+Builds a synthetic 2,000-line resume with OCR-garbled "technical skills"
+headers repeated throughout, times extract_candidate_info on it and on its
+first half, and exits with status 1 if:
+- the full resume takes longer than --budget-ms, or
+- doubling the length multiplies the time by more than --max-growth, which
+  catches quadratic behaviour (about 4x) independently of the machine speed.
+
+Usage:
+    python benchmark_candidate_info.py
+    python benchmark_candidate_info.py --lines 4000 --budget-ms 2000
+"""
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+
+from app.services.qwen_processing import QwenProcessingService
+
+OCR_HEADERS = ["TÆCHNICAL SKILLS", "Tech Skills:", "TECHNICAL SKILLS", "TECH SKILL SET", "Technical SkiIls"]
+SECTION_TITLES = ["EXPERIENCE", "EDUCATION", "PROJECTS", "ACHIEVEMENTS"]
+
+def generate_resume(lines: int, seed: int = 42) -> str:
+    """Resume of the given number of lines with many OCR-garbled skills headers"""
+    rng = random.Random(seed)
+    output = ["Jane Doe", "jane.doe@example.com | Penang, Malaysia", ""]
+    while len(output) < lines:
+        roll = rng.random()
+        if roll < 0.05:
+            output.append(rng.choice(OCR_HEADERS))
+        elif roll < 0.07:
+            output.append(rng.choice(SECTION_TITLES))
+        elif roll < 0.15:
+            output.append(f"• Technical skill in python, java and sql ({len(output)})")
+        else:
+            output.append(f"• Developed a web application with react and node.js ({len(output)})")
+    return "\n".join(output[:lines])
+
+def _time_ms(service: QwenProcessingService, text: str, repeat: int) -> float:
+    """Median time of extract_candidate_info in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        service.extract_candidate_info(text)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that extract_candidate_info stays fast on long resumes")
+    parser.add_argument("--lines", type=int, default=2000, help="Lines of the synthetic resume")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per size")
+    parser.add_argument("--budget-ms", type=float, default=750, help="Maximum median time for the full resume")
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help="Maximum time ratio between the full resume and its first half")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    service = QwenProcessingService()
+    half_ms = _time_ms(service, generate_resume(args.lines // 2), args.repeat)
+    full_ms = _time_ms(service, generate_resume(args.lines), args.repeat)
+    growth = full_ms / half_ms if half_ms else 0.0
+
+    print(f"{args.lines // 2} lines: {half_ms:.1f} ms")
+    print(f"{args.lines} lines: {full_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"growth when doubling: {growth:.2f}x (max {args.max_growth:.2f}x)")
+
+    failures = []
+    if full_ms > args.budget_ms:
+        failures.append(f"{args.lines} lines took {full_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    if growth > args.max_growth:
+        failures.append(f"time grew {growth:.2f}x when doubling the length, expected about 2x")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Micro-benchmark for the keyword overlap score
+
+Compares ScoringService.keyword_overlap_score, which matches keywords with
+set lookups and a substring index, against the previous implementation that
+compared every job keyword with every resume keyword, and checks that both
+give the same score, matched and missing keywords.
+
+The corpus pairs the keywords extracted from generated resumes and job
+descriptions (as in the API), and adds generated keyword lists with case
+variants, duplicates, job levels, very short and empty keywords.
+
+Usage:
+    python benchmark_keyword_overlap.py
+    python benchmark_keyword_overlap.py --count 200 --repeat 50
+"""
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+
+from app.services.qwen_processing import QwenProcessingService
+from app.services.scoring_service import ScoringService
+from app.services.skill_taxonomy import skill_taxonomy
+from benchmark_keywords import generate_resume
+
+EXTRA_KEYWORDS = [
+    "", "a", "js", "Go", "C", "BS", "MS", "UI", "ux", "sql", "SQL", "MySQL", "mysql server", "java", "JavaScript ES6",
+    "Junior", "junior developer", "Senior", "Lead", "team lead", "leadership", "student", "university", "graduate",
+    "internship", "Bachelor", "Computer Science", "5 years", "3+ years experience", "React.js", "react native",
+    "node", "Node.js", "typescript", "Firebase", "postgres", "PostgreSQL", "İstanbul", "ß", "data", "science",
+    "odd\0keyword", "\0"
+]
+
+def reference_weight_of(taxonomy, keyword: str) -> float:
+    """Previous SkillTaxonomy.weight_of, without the memo"""
+    keyword_lower = keyword.lower()
+    return max((weight for term, weight in taxonomy._weighted_terms if term in keyword_lower), default=0.0)
+
+def reference_keyword_overlap_score(resume_keywords, job_keywords):
+    """Previous keyword_overlap_score: list lookups and a scan of every keyword pair"""
+    if not job_keywords:
+        return 0.0, [], []
+
+    resume_keywords_norm = [kw.lower() for kw in resume_keywords]
+    job_keywords_norm = [kw.lower() for kw in job_keywords]
+
+    matched_keywords = []
+    exact_matches = []
+    partial_matches = []
+
+    job_level_in_job = [kw for kw in job_keywords_norm if "junior" in kw.lower() or "senior" in kw.lower() or "lead" in kw.lower()]
+    job_level_in_resume = [kw for kw in resume_keywords_norm if "junior" in kw.lower() or "senior" in kw.lower() or "lead" in kw.lower()]
+
+    if job_level_in_job:
+        if job_level_in_resume:
+            for level in job_level_in_job:
+                if level not in matched_keywords:
+                    matched_keywords.append(level)
+                    exact_matches.append(level)
+        else:
+            if any("junior" in level.lower() for level in job_level_in_job):
+                education_terms = ["student", "graduate", "university", "college", "school", "bachelor", "internship"]
+                if any(term in " ".join(resume_keywords_norm).lower() for term in education_terms):
+                    for level in job_level_in_job:
+                        if "junior" in level.lower() and level not in matched_keywords:
+                            matched_keywords.append(level)
+                            partial_matches.append(level)
+
+    for job_kw in job_keywords:
+        job_kw_lower = job_kw.lower()
+        if job_kw in matched_keywords:
+            continue
+        if job_kw_lower in resume_keywords_norm:
+            matched_keywords.append(job_kw)
+            exact_matches.append(job_kw)
+            continue
+        for resume_kw in resume_keywords:
+            resume_kw_lower = resume_kw.lower()
+            if job_kw_lower in resume_kw_lower or resume_kw_lower in job_kw_lower:
+                matched_keywords.append(job_kw)
+                partial_matches.append(job_kw)
+                break
+
+    missing_keywords = [kw for kw in job_keywords if kw not in matched_keywords]
+
+    exact_match_score = len(exact_matches) / len(job_keywords) * 100 * 0.8
+    partial_match_score = len(partial_matches) / len(job_keywords) * 100 * 0.4
+    base_score = exact_match_score + partial_match_score
+
+    taxonomy = skill_taxonomy.current()
+    weighted_important_matches = sum(reference_weight_of(taxonomy, kw) for kw in matched_keywords)
+    total_important = sum(reference_weight_of(taxonomy, kw) for kw in job_keywords)
+
+    if total_important > 0:
+        important_score = (weighted_important_matches / total_important) * 30
+    else:
+        important_score = 0
+
+    match_ratio = len(matched_keywords) / len(job_keywords)
+    if match_ratio >= 0.8:
+        match_bonus = 15
+    elif match_ratio >= 0.6:
+        match_bonus = 10
+    elif len(matched_keywords) >= 5:
+        match_bonus = 5
+    else:
+        match_bonus = len(matched_keywords) * 1
+
+    final_score = min(100, base_score + important_score + match_bonus)
+
+    return final_score, matched_keywords, missing_keywords
+
+def generate_keywords(rng: random.Random, vocabulary, count: int):
+    """Random keywords from the vocabulary, some with changed case or cut short"""
+    keywords = []
+    for _ in range(count):
+        keyword = rng.choice(vocabulary)
+        roll = rng.random()
+        if roll < 0.1:
+            keyword = keyword.upper()
+        elif roll < 0.2:
+            keyword = keyword.lower()
+        elif roll < 0.3 and len(keyword) > 2:
+            start = rng.randrange(len(keyword) - 1)
+            keyword = keyword[start:rng.randint(start + 1, len(keyword))]
+        keywords.append(keyword)
+    return keywords
+
+def build_corpus(count: int, seed: int):
+    """(name, resume keywords, job keywords) pairs"""
+    logging.disable(logging.INFO)
+    rng = random.Random(seed)
+    qwen_service = QwenProcessingService()
+    scoring_service = ScoringService()
+
+    corpus = []
+    extracted = []
+    for i in range(count):
+        resume_keywords = qwen_service._extract_keywords_regex(generate_resume(rng))
+        job_keywords = scoring_service._extract_keywords_from_job(generate_resume(rng))
+        extracted.extend(resume_keywords + job_keywords)
+        corpus.append((f"extracted-{i + 1}", resume_keywords, job_keywords))
+
+    vocabulary = sorted(set(extracted)) + EXTRA_KEYWORDS
+    for i in range(count):
+        resume_keywords = generate_keywords(rng, vocabulary, rng.randint(0, 150))
+        job_keywords = generate_keywords(rng, vocabulary, rng.randint(0, 60))
+        corpus.append((f"generated-{i + 1}", resume_keywords, job_keywords))
+    return corpus
+
+def _time_ms(func, resume_keywords, job_keywords, repeat: int) -> float:
+    """Median time of one call in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(resume_keywords, job_keywords)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the keyword overlap score")
+    parser.add_argument("--count", type=int, default=100, help="Number of extracted and of generated keyword pairs")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per pair")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the corpus")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count, args.seed)
+    scoring_service = ScoringService()
+
+    totals = {}
+    for name, resume_keywords, job_keywords in corpus:
+        expected = reference_keyword_overlap_score(resume_keywords, job_keywords)
+        actual = scoring_service.keyword_overlap_score(resume_keywords, job_keywords)
+        if expected != actual:
+            print(f"Error: {name}: keyword overlap differs from the previous implementation", file=sys.stderr)
+            print(f"  expected {expected}\n  actual   {actual}", file=sys.stderr)
+            sys.exit(1)
+        kind = name.split("-")[0]
+        reference_ms = _time_ms(reference_keyword_overlap_score, resume_keywords, job_keywords, args.repeat)
+        indexed_ms = _time_ms(scoring_service.keyword_overlap_score, resume_keywords, job_keywords, args.repeat)
+        total = totals.setdefault(kind, [0.0, 0.0, 0, 0, 0])
+        total[0] += reference_ms
+        total[1] += indexed_ms
+        total[2] += 1
+        total[3] += len(resume_keywords)
+        total[4] += len(job_keywords)
+
+    for kind, (reference_ms, indexed_ms, pairs, resume_count, job_count) in totals.items():
+        print(f"{kind}: {pairs} pairs, {resume_count / pairs:.0f} resume and {job_count / pairs:.0f} job keywords on average: "
+              f"{reference_ms / pairs * 1000:.1f} us before, {indexed_ms / pairs * 1000:.1f} us indexed "
+              f"({reference_ms / indexed_ms:.1f}x), identical")
+
+if __name__ == "__main__":
+    main()
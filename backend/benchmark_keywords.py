@@ -0,0 +1,180 @@
+"""
+Micro-benchmark for the skill dictionary matcher
+
+Times the per-resume keyword extraction of QwenProcessingService
+(_extract_keywords_regex), the job keyword extraction of ScoringService
+(_extract_keywords_from_job) and the soft skill lookup of cultural_fit_score
+against the same extraction done with one regex search per term or group
+(over the skill taxonomy and the other keyword lists), and checks that both
+give the same keywords.
+
+Without arguments it runs on generated resumes; resume files (.pdf or .txt)
+can be given instead.
+
+Usage:
+    python benchmark_keywords.py
+    python benchmark_keywords.py --repeat 50 ../samples/*.pdf
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+from app.services.qwen_processing import QwenProcessingService, PROJECT_KEYWORDS, EDUCATION_KEYWORDS, JOB_LEVELS
+from app.services.scoring_service import (
+    ScoringService, JOB_KEYWORD_GROUPS, JOB_YEARS_PATTERN, SOFT_SKILLS, SOFT_SKILL_MATCHER
+)
+from app.services.skill_taxonomy import skill_taxonomy, GENERAL_CATEGORY
+
+SAMPLE_HEADERS = ["SUMMARY", "WORK EXPERIENCE", "EDUCATION", "TECHNICAL SKILLS", "PROJECTS", "ACHIEVEMENTS"]
+SAMPLE_WORDS = (
+    "developed built designed implemented led managed team project application system website data users "
+    "Python Java JavaScript TypeScript C++ Go React React.js Node.js Flutter Django Flask SQL MySQL PostgreSQL "
+    "Firebase AWS Docker Kubernetes CI/CD Git GitHub HTML5 CSS REST API Figma UI UX AI NLP Agile Scrum "
+    "leadership communication teamwork problem-solving creativity collaboration bachelor degree computer science "
+    "engineering intern junior senior lead manager university 3 years experience"
+).split()
+
+def _group_regex(terms) -> str:
+    return r'\b(?:' + "|".join(re.escape(term) for term in terms) + r')\b'
+
+def reference_find_skills(text: str, include_general: bool = False):
+    """Taxonomy skills found with a regex search per name and alias, leftmost-longest"""
+    found = []
+    for skill in skill_taxonomy.current().skills.values():
+        if skill.category == GENERAL_CATEGORY and not include_general:
+            continue
+        for term in (skill.name, *skill.aliases):
+            pattern = r'\b' + r'\s+'.join(re.escape(word) for word in term.split()) + r'\b'
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                found.append((match.start(), -match.end(), skill))
+
+    skills = []
+    last_end = 0
+    for start, negative_end, skill in sorted(found, key=lambda item: item[:2]):
+        if start >= last_end:
+            last_end = -negative_end
+            if skill not in skills:
+                skills.append(skill)
+    return skills
+
+def reference_extract_keywords(text: str):
+    """QwenProcessingService._extract_keywords_regex with a regex search per term"""
+    keywords = {skill.name for skill in reference_find_skills(text)}
+    for project, related_skills in PROJECT_KEYWORDS.items():
+        if re.search(r'\b' + re.escape(project) + r'\b', text, re.IGNORECASE):
+            keywords.add(project)
+            keywords.update(related_skills)
+    for pattern in [r'(\d+)[\+]?\s*years?\s+(?:of\s+)?experience', r'experience\s+(?:of\s+)?(\d+)[\+]?\s*years?']:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            if match.group(1):
+                keywords.add(f"{match.group(1)}+ years experience")
+    for keyword in EDUCATION_KEYWORDS:
+        if re.search(r'\b' + re.escape(keyword) + r'\b', text.lower()):
+            keywords.add(keyword.title())
+    for level in JOB_LEVELS:
+        if re.search(r'\b' + re.escape(level) + r'\b', text, re.IGNORECASE):
+            keywords.add(level)
+    return sorted(keywords)
+
+def reference_job_keywords(text: str):
+    """ScoringService._extract_keywords_from_job with a regex search per term or group"""
+    skills = reference_find_skills(text)
+    keywords = [skill.name for skill in sorted(skills, key=lambda skill: skill.category == "soft_skills")]
+    patterns = [_group_regex(JOB_KEYWORD_GROUPS["degrees"]), _group_regex(JOB_KEYWORD_GROUPS["fields"]),
+                JOB_YEARS_PATTERN.pattern, _group_regex(JOB_KEYWORD_GROUPS["levels"])]
+    for pattern in patterns:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            if match.group(0) not in keywords:
+                keywords.append(match.group(0))
+    return keywords
+
+def reference_soft_skills(text: str):
+    """Previous soft skill lookup of cultural_fit_score: a regex search per skill"""
+    return [skill for skill in SOFT_SKILLS if re.search(r'\b' + skill + r'\b', text, re.IGNORECASE)]
+
+def matcher_soft_skills(text: str):
+    """Soft skill lookup of cultural_fit_score with the matcher"""
+    found = SOFT_SKILL_MATCHER.found_terms(text).get("soft_skills", set())
+    return [skill for skill in SOFT_SKILLS if skill in found]
+
+def generate_resume(rng: random.Random) -> str:
+    """Build a plausible resume: contact lines, then headed sections of bullet points"""
+    lines = ["John Tan", "john.tan@example.com | +60 12-345 6789 | Kuala Lumpur, Malaysia", ""]
+    for header in SAMPLE_HEADERS:
+        lines.append(header)
+        for _ in range(rng.randint(4, 14)):
+            lines.append("• " + " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(6, 18))).capitalize())
+        lines.append("")
+    return "\n".join(lines)
+
+def load_resume(path: str) -> str:
+    """Text of a .txt file, or the extracted text of a PDF"""
+    if path.lower().endswith(".pdf"):
+        from app.services.enhanced_text_extraction import EnhancedTextExtractionService
+        success, text_or_error, _ = EnhancedTextExtractionService().extract_text_from_pdf(path)
+        if not success:
+            raise RuntimeError(f"{path}: {text_or_error}")
+        return text_or_error
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+def _time_ms(func, text: str, repeat: int) -> float:
+    """Median time of one call in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill dictionary matcher")
+    parser.add_argument("files", nargs="*", help="Resume files (.pdf or .txt); generated resumes if omitted")
+    parser.add_argument("--count", type=int, default=20, help="Number of generated resumes")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per resume")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated resumes")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.files:
+        resumes = [(os.path.basename(path), load_resume(path)) for path in args.files]
+    else:
+        rng = random.Random(args.seed)
+        resumes = [(f"generated-{i + 1}", generate_resume(rng)) for i in range(args.count)]
+
+    qwen_service = QwenProcessingService()
+    scoring_service = ScoringService()
+    # (name, previous implementation, matcher implementation)
+    extractors = [
+        ("resume keywords", reference_extract_keywords, qwen_service._extract_keywords_regex),
+        ("job keywords", reference_job_keywords, scoring_service._extract_keywords_from_job),
+        ("soft skills", reference_soft_skills, matcher_soft_skills),
+    ]
+
+    print(f"{'resume':<16}{'chars':>7}" + "".join(f"{name + ' ms (before/after)':>34}" for name, _, _ in extractors))
+    totals = {name: [0.0, 0.0] for name, _, _ in extractors}
+    for resume_name, text in resumes:
+        row = f"{resume_name[:15]:<16}{len(text):>7}"
+        for name, reference, matcher in extractors:
+            if reference(text) != matcher(text):
+                print(f"Error: {resume_name}: {name} differ from the per-term regex search", file=sys.stderr)
+                sys.exit(1)
+            reference_ms = _time_ms(reference, text, args.repeat)
+            matcher_ms = _time_ms(matcher, text, args.repeat)
+            totals[name][0] += reference_ms
+            totals[name][1] += matcher_ms
+            row += f"{reference_ms:>20.3f} /{matcher_ms:>8.3f}{reference_ms / matcher_ms:>4.1f}x"
+        print(row)
+
+    print("-" * (23 + 34 * len(extractors)))
+    for name, (reference_ms, matcher_ms) in totals.items():
+        print(f"{name}: {reference_ms / len(resumes):.3f} ms per resume before, {matcher_ms / len(resumes):.3f} ms "
+              f"with the matcher ({reference_ms / matcher_ms:.1f}x), identical on {len(resumes)} resumes")
+
+if __name__ == "__main__":
+    main()
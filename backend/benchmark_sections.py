@@ -0,0 +1,116 @@
+"""
+Micro-benchmark for the resume section header scan
+
+Compares the single-pass SECTION_SCANNER used by QwenProcessingService with
+the previous approach of one re.finditer per section pattern, checks that both
+find the same headers, and times the complete extract_candidate_info for
+context.
+
+Without arguments it runs on generated resumes; resume files (.pdf or .txt)
+can be given instead.
+
+Usage:
+    python benchmark_sections.py
+    python benchmark_sections.py --repeat 500 ../samples/*.pdf
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+from app.services.qwen_processing import QwenProcessingService, SECTION_PATTERNS
+
+SAMPLE_HEADERS = [
+    "SUMMARY", "Professional Summary", "WORK EXPERIENCE", "Experience:", "EDUCATION", "Technical Skills",
+    "SKILLS", "ACADEMIC PROJECTS", "Projects", "Extracurricular Activities", "ACHIEVEMENTS", "Certifications",
+    "LANGUAGES", "Interests", "References"
+]
+SAMPLE_WORDS = (
+    "developed built designed implemented led managed team project application system website data "
+    "python java react flutter sql docker aws api backend frontend testing agile scrum university "
+    "experience skills education projects activities club society volunteer award hackathon winner"
+).split()
+
+def reference_find_section_headers(text: str, text_upper: str):
+    """Previous implementation: a separate non-overlapping search per section"""
+    section_starts = []
+    for section_name, pattern in SECTION_PATTERNS.items():
+        for match in re.finditer(pattern, text_upper):
+            section_starts.append((match.start(), section_name, text[match.start():match.end()]))
+    return section_starts
+
+def generate_resume(rng: random.Random, sections: int = 8) -> str:
+    """Build a plausible resume: contact lines, then headed sections of bullet points"""
+    lines = ["John Tan", "john.tan@example.com | +60 12-345 6789 | Kuala Lumpur, Malaysia", ""]
+    for header in rng.sample(SAMPLE_HEADERS, sections):
+        lines.append(header)
+        for _ in range(rng.randint(3, 12)):
+            lines.append("• " + " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(4, 16))).capitalize())
+        lines.append("")
+    return "\n".join(lines)
+
+def load_resume(path: str) -> str:
+    """Text of a .txt file, or the extracted text of a PDF"""
+    if path.lower().endswith(".pdf"):
+        from app.services.enhanced_text_extraction import EnhancedTextExtractionService
+        success, text_or_error, _ = EnhancedTextExtractionService().extract_text_from_pdf(path)
+        if not success:
+            raise RuntimeError(f"{path}: {text_or_error}")
+        return text_or_error
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+def _time_ms(func, repeat: int) -> float:
+    """Median time of one call in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass section header scan")
+    parser.add_argument("files", nargs="*", help="Resume files (.pdf or .txt); generated resumes if omitted")
+    parser.add_argument("--count", type=int, default=20, help="Number of generated resumes")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per resume")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated resumes")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.files:
+        resumes = [(os.path.basename(path), load_resume(path)) for path in args.files]
+    else:
+        rng = random.Random(args.seed)
+        resumes = [(f"generated-{i + 1}", generate_resume(rng, rng.randint(5, 12))) for i in range(args.count)]
+
+    service = QwenProcessingService()
+    print(f"{'resume':<24}{'chars':>8}{'headers':>9}{'per-section ms':>16}{'single-pass ms':>16}{'speedup':>9}{'full info ms':>14}")
+
+    totals = {"reference": 0.0, "scanner": 0.0}
+    for name, text in resumes:
+        text_upper = text.upper()
+        reference = sorted(reference_find_section_headers(text, text_upper))
+        scanned = sorted(service._find_section_headers(text, text_upper))
+        if reference != scanned:
+            print(f"Error: {name}: the single-pass scan found different headers", file=sys.stderr)
+            sys.exit(1)
+
+        reference_ms = _time_ms(lambda: reference_find_section_headers(text, text_upper), args.repeat)
+        scanner_ms = _time_ms(lambda: service._find_section_headers(text, text_upper), args.repeat)
+        info_ms = _time_ms(lambda: service.extract_candidate_info(text), max(1, args.repeat // 10))
+        totals["reference"] += reference_ms
+        totals["scanner"] += scanner_ms
+        print(f"{name[:23]:<24}{len(text):>8}{len(scanned):>9}{reference_ms:>16.3f}{scanner_ms:>16.3f}"
+              f"{reference_ms / scanner_ms:>8.1f}x{info_ms:>14.2f}")
+
+    print("-" * 96)
+    print(f"total: per-section {totals['reference']:.2f} ms, single-pass {totals['scanner']:.2f} ms "
+          f"({totals['reference'] / totals['scanner']:.1f}x), identical headers on {len(resumes)} resumes")
+
+if __name__ == "__main__":
+    main()
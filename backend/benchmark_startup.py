@@ -0,0 +1,147 @@
+"""
+Startup-time benchmark for the API
+
+Measures, in fresh processes:
+- how long `import app.main` takes and which heavy libraries it pulls in
+- how long a uvicorn worker takes until `/` answers, and the latency of the
+  first requests after that (optionally a first text extraction of a PDF)
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --runs 5 --pdf ../samples/resume.pdf
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+HEAVY_MODULES = ["torch", "transformers", "sentence_transformers", "sklearn", "spacy", "fitz", "pdfminer"]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+def measure_import() -> dict:
+    """Import app.main in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _request(url: str, data: bytes = None, headers: dict = None, timeout: float = 300) -> float:
+    """Send one request and return its latency in seconds"""
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    except urllib.error.HTTPError as e:
+        # The latency is still meaningful, but flag the failed request
+        e.read()
+        print(f"Warning: {url} returned HTTP {e.code}", file=sys.stderr)
+    return time.perf_counter() - start
+
+def _multipart_pdf(path: str):
+    """Build a multipart body uploading a PDF as the `resume` field"""
+    boundary = uuid.uuid4().hex
+    with open(path, "rb") as f:
+        content = f.read()
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="resume"; filename="{os.path.basename(path)}"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode("utf-8") + content + f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+def measure_server(pdf_path: str = None, ready_timeout: float = 120) -> dict:
+    """Start a uvicorn worker and time the first requests"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    try:
+        # Poll until the root endpoint answers
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            if time.perf_counter() - start > ready_timeout:
+                raise RuntimeError(f"server not ready after {ready_timeout}s")
+            try:
+                _request(f"{base_url}/", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.05)
+
+        result = {
+            "timeToFirstResponse": time.perf_counter() - start,
+            "rootRequest": _request(f"{base_url}/"),
+            "firstApiRequest": _request(f"{base_url}/api/weights/default")
+        }
+
+        if pdf_path:
+            body, headers = _multipart_pdf(pdf_path)
+            result["firstExtraction"] = _request(f"{base_url}/api/test-extraction", body, headers)
+            result["secondExtraction"] = _request(f"{base_url}/api/test-extraction", body, headers)
+
+        return result
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+def _summary(values) -> str:
+    if len(values) == 1:
+        return f"{values[0] * 1000:.0f} ms"
+    return f"median {statistics.median(values) * 1000:.0f} ms (min {min(values) * 1000:.0f}, max {max(values) * 1000:.0f})"
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API import and first-request times")
+    parser.add_argument("--runs", type=int, default=3, help="Number of cold starts to measure")
+    parser.add_argument("--pdf", help="PDF file to time the first extraction request with")
+    parser.add_argument("--skip-server", action="store_true", help="Only measure the import time")
+    args = parser.parse_args()
+
+    if args.pdf and not os.path.exists(args.pdf):
+        print(f"Error: File '{args.pdf}' does not exist.")
+        sys.exit(1)
+
+    # Run from the backend directory so `app` is importable
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    imports = [measure_import() for _ in range(args.runs)]
+    print(f"import app.main: {_summary([r['seconds'] for r in imports])}")
+    print(f"heavy modules loaded at import: {', '.join(imports[-1]['loaded']) or 'none'}")
+
+    if args.skip_server:
+        return
+
+    servers = [measure_server(args.pdf) for _ in range(args.runs)]
+    print("-" * 60)
+    for key in servers[0]:
+        print(f"{key}: {_summary([r[key] for r in servers])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import re
+
+from app.services.qwen_processing import QwenProcessingService, SECTION_PATTERNS
+
+# Resumes exercising overlapping headers ("SKILLS" inside "TECHNICAL SKILLS",
+# "ACTIVITIES" in two sections), colons, headers at the end of the text and
+# header words inside sentences
+SAMPLE_RESUMES = [
+    "John Tan\njohn.tan@example.com\n\nSUMMARY\nBuilt apps.\n\nWORK EXPERIENCE\nIntern at Grab\n\n"
+    "EDUCATION\nBSc Computer Science\n\nTECHNICAL SKILLS\nPython, React\n\nSKILLS\nTeamwork",
+    "Professional Summary:\nDeveloper\nExperience: 3 years\nTech Skills\nFlutter\n"
+    "Extracurricular Activities\nChess club\nAchievements and Activities\nHackathon winner\nActivities",
+    "Skill Set:\nSQL\nAcademic Projects\nTransitGo\nProjects\nStudySync\nProject Experience\nFYP\n"
+    "Certifications\nAWS\nLanguages\nEnglish\nInterests\nHiking\nReferences",
+    "My experience with skills such as Python and education in engineering\nSKILLS:PYTHON\n"
+    "Co-Curricular Activities\nVolunteer\nLeadership Experience\nClub president\nPublications",
+    "",
+    "EXPERIENCE\n\nEXPERIENCE\nWORK HISTORY:\nPROFESSIONAL EXPERIENCE\n",
+]
+
+def reference_find_section_headers(text: str, text_upper: str):
+    """Separate non-overlapping search per section, as before SECTION_SCANNER"""
+    section_starts = []
+    for section_name, pattern in SECTION_PATTERNS.items():
+        for match in re.finditer(pattern, text_upper):
+            section_starts.append((match.start(), section_name, text[match.start():match.end()]))
+    return section_starts
+
+def test_section_scanner_parity():
+    """_find_section_headers finds the same headers as a search per section"""
+    service = QwenProcessingService()
+    for text in SAMPLE_RESUMES:
+        text_upper = text.upper()
+        expected = sorted(reference_find_section_headers(text, text_upper))
+        found = sorted(service._find_section_headers(text, text_upper))
+        assert found == expected, f"Headers differ for {text[:40]!r}:\n{found}\n{expected}"
+
+def test_overlapping_headers():
+    """Both sections of an overlapping header are reported"""
+    text = "TECHNICAL SKILLS\nPython\nEXTRACURRICULAR ACTIVITIES\nChess"
+    found = QwenProcessingService()._find_section_headers(text, text.upper())
+    sections = {section_name for _, section_name, _ in found}
+    assert {"skills", "technical skills", "extracurricular", "interests"} <= sections, sections
+
+if __name__ == "__main__":
+    print("=== Section Header Scanner Test ===\n")
+    test_section_scanner_parity()
+    print("✅ Section scanner matches the per-section search")
+    test_overlapping_headers()
+    print("✅ Overlapping headers test passed")
@@ -0,0 +1,78 @@
+import re
+
+from app.services.skill_matcher import SkillMatcher, select_alternation, select_longest
+
+TERMS = {
+    "languages": ["Java", "JavaScript", "C++", "C#", "Go", "Node.js", ".NET", "CI/CD", "R", "snake_case"],
+    "frameworks": ["React", "React\\s+Native", "React.js", "Google Cloud", "Vue\\s3"],
+    "achievements": ["cum laude", "magna cum laude", "summa cum laude", "dean's list", "semi-finalist", "finalist"]
+}
+
+# Texts exercising \b at word/non-word edges, overlapping terms and case
+SAMPLE_TEXTS = [
+    "Java and JavaScript developer; javascript, JAVA, Javas, xJava, Java_ and Java1",
+    "C++ developer, C++, (C++) and C#. Wrote C++17 and c#/C++ code",
+    "Going to Go: Golang, go-lang, GO. Node.js, node.jsx, Node.js. .NET and ASP.NET, .NETCore",
+    "CI/CD pipelines, ci/cd, CI / CD, R, R&D, R2, snake_case, snake_cases",
+    "React Native, React  Native, React\nNative, ReactNative, React.js, React.jsx, React-Native",
+    "Google Cloud, Google  Cloud, google cloud; Vue 3, Vue  3, Vue\t3",
+    "Graduated magna cum laude, summa cum laude and cum laude; Dean's List; finalist, semi-finalist",
+    "",
+]
+
+def _term_regex(term: str) -> str:
+    """Regex of a matcher term: literal text with \\s+ and \\s markers"""
+    return "".join(part if part in ("\\s+", "\\s") else re.escape(part) for part in re.split(r"(\\s\+|\\s)", term))
+
+def reference_find_all(text: str):
+    """Every occurrence of every term with one re.finditer per term"""
+    matches = []
+    for group, terms in TERMS.items():
+        for priority, term in enumerate(terms):
+            for match in re.finditer(r"(?=(\b" + _term_regex(term) + r"\b))", text, re.IGNORECASE):
+                matches.append((match.start(1), match.end(1), group, priority, term))
+    return sorted(matches, key=lambda match: (match[0], match[2], match[3]))
+
+def test_find_all_parity():
+    """find_all reports the same occurrences as a \\b-delimited regex per term"""
+    matcher = SkillMatcher(TERMS)
+    for text in SAMPLE_TEXTS:
+        found = [tuple(match) for match in matcher.find_all(text)]
+        assert found == reference_find_all(text), f"Matches differ for {text!r}"
+
+def test_overlapping_terms():
+    """Terms contained in longer terms are reported as well ("cum laude" in "magna cum laude")"""
+    text = "Graduated magna cum laude"
+    found = SkillMatcher(TERMS).found_terms(text)
+    assert found == {"achievements": {"magna cum laude", "cum laude"}}, found
+
+    expected = {term for term in TERMS["achievements"] if re.search(r"\b" + re.escape(term) + r"\b", text, re.IGNORECASE)}
+    assert found["achievements"] == expected
+
+def test_select_alternation_parity():
+    """select_alternation keeps what re.finditer over the group's alternation finds"""
+    matcher = SkillMatcher(TERMS)
+    for text in SAMPLE_TEXTS:
+        for group, terms in TERMS.items():
+            pattern = r"\b(?:" + "|".join(_term_regex(term) for term in terms) + r")\b"
+            expected = [(match.start(), match.end()) for match in re.finditer(pattern, text, re.IGNORECASE)]
+            selected = [(match.start, match.end) for match in select_alternation(matcher.find_all(text), group)]
+            assert selected == expected, f"Alternation of {group} differs for {text!r}"
+
+def test_select_longest():
+    """Of overlapping matches the leftmost-longest one is kept"""
+    matcher = SkillMatcher(TERMS)
+    text = "React Native and React, magna cum laude"
+    terms = [match.term for match in select_longest(matcher.find_all(text))]
+    assert terms == ["React\\s+Native", "React", "magna cum laude"], terms
+
+if __name__ == "__main__":
+    print("=== Skill Matcher Test ===\n")
+    test_find_all_parity()
+    print("✅ find_all matches the per-term regex search")
+    test_overlapping_terms()
+    print("✅ Overlapping terms test passed")
+    test_select_alternation_parity()
+    print("✅ select_alternation matches the group alternation")
+    test_select_longest()
+    print("✅ select_longest test passed")
@@ -0,0 +1,102 @@
+import json
+import os
+import re
+import tempfile
+
+from app.services.skill_taxonomy import SkillTaxonomyStore, load_taxonomy, DEFAULT_TAXONOMY_PATH, GENERAL_CATEGORY
+
+# Texts with names, aliases, multi-word aliases split by line breaks, general
+# terms and overlapping names
+SAMPLE_TEXTS = [
+    "Built web and mobile apps with React.js, ReactJS and Node.js on Amazon Web Services",
+    "Golang, ECMAScript and CPP services on Google Cloud Platform; Google\nCloud; Postgres and PostgreSQL",
+    "React Native developer: testing, automation, security and cloud; Spring Boot and Express.js",
+    "Java, JavaScript, C++, C#, Go. Going to the cloud; SRE on-call",
+    "",
+]
+
+def reference_find_skills(taxonomy, text: str, include_general: bool = False):
+    """Skills found with a regex search per name and alias, leftmost-longest"""
+    found = []
+    for skill in taxonomy.skills.values():
+        if skill.category == GENERAL_CATEGORY and not include_general:
+            continue
+        for term in (skill.name, *skill.aliases):
+            pattern = r'\b' + r'\s+'.join(re.escape(word) for word in term.split()) + r'\b'
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                found.append((match.start(), -match.end(), skill))
+
+    skills = []
+    last_end = 0
+    for start, negative_end, skill in sorted(found, key=lambda item: item[:2]):
+        if start >= last_end:
+            last_end = -negative_end
+            if skill not in skills:
+                skills.append(skill)
+    return skills
+
+def _write_taxonomy(path: str, version: str, skills):
+    """Write a taxonomy file with a languages and a general category"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "categories": {"languages": "Languages", GENERAL_CATEGORY: "General"},
+                   "skills": skills}, f)
+
+def test_find_skills_parity():
+    """find_skills gives the same skills as a regex search per name and alias"""
+    taxonomy = load_taxonomy(DEFAULT_TAXONOMY_PATH)
+    for text in SAMPLE_TEXTS:
+        for include_general in (False, True):
+            expected = [skill.name for skill in reference_find_skills(taxonomy, text, include_general)]
+            found = [skill.name for skill in taxonomy.find_skills(text, include_general)]
+            assert found == expected, f"Skills differ for {text!r} (include_general={include_general})"
+
+def test_aliases_and_general_category():
+    """Aliases map to their skill; general terms are only reported on request"""
+    taxonomy = load_taxonomy(DEFAULT_TAXONOMY_PATH)
+    text = "ReactJS and Golang apps for the web"
+    names = [skill.name for skill in taxonomy.find_skills(text)]
+    assert names == ["React", "Go"], names
+    names = [skill.name for skill in taxonomy.find_skills(text, include_general=True)]
+    assert names == ["React", "Go", "Web"], names
+    assert taxonomy.lookup("golang").name == "Go"
+
+def test_reload_and_listeners():
+    """A changed file is swapped in and listeners are called; an invalid one is ignored"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "skill_taxonomy.json")
+        _write_taxonomy(path, "1", [{"name": "Python", "category": "languages"}])
+        store = SkillTaxonomyStore(path, reload_seconds=0)
+
+        # Stands in for a cache built from the taxonomy, such as ScoringService's job profiles
+        cache = {"job": "profile"}
+        reloaded = []
+        store.add_listener(lambda taxonomy: cache.clear())
+        store.add_listener(reloaded.append)
+
+        assert not store.reload_if_changed()
+        assert [skill.name for skill in store.current().find_skills("Rust and Python")] == ["Python"]
+
+        _write_taxonomy(path, "2", [{"name": "Python", "category": "languages"},
+                                    {"name": "Rust", "category": "languages", "aliases": ["rust-lang"]}])
+        assert store.reload_if_changed()
+        assert store.current().version == "2"
+        assert [skill.name for skill in store.current().find_skills("rust-lang and Python")] == ["Rust", "Python"]
+        assert cache == {}, "Listener did not invalidate the cache"
+        assert reloaded == [store.current()]
+
+        cache["job"] = "profile"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert not store.reload_if_changed()
+        assert store.current().version == "2"
+        assert store.stats()["errors"] == 1
+        assert cache == {"job": "profile"} and len(reloaded) == 1
+
+if __name__ == "__main__":
+    print("=== Skill Taxonomy Test ===\n")
+    test_find_skills_parity()
+    print("✅ find_skills matches the per-term regex search")
+    test_aliases_and_general_category()
+    print("✅ Aliases and general category test passed")
+    test_reload_and_listeners()
+    print("✅ Reload and listener test passed")
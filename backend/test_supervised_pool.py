@@ -0,0 +1,73 @@
+import asyncio
+import os
+import time
+
+from app.services.supervised_pool import SupervisedProcessPool, WorkerMemoryError
+
+def sleep_and_return(value, delay):
+    """Job: return value after delay seconds"""
+    time.sleep(delay)
+    return value
+
+def allocate(megabytes):
+    """Job: allocate and return the size of a megabytes-sized buffer"""
+    return len(bytearray(megabytes * 1024 * 1024))
+
+def worker_pid():
+    """Job: process id of the worker"""
+    return os.getpid()
+
+def test_cancelled_job_keeps_its_slot():
+    """A cancelled job holds its worker until it ends; the next job gets its own result"""
+    async def run():
+        pool = SupervisedProcessPool(workers=1)
+        try:
+            # Start the worker so the timings below do not include the spawn
+            assert await pool.run(sleep_and_return, "warm", 0) == "warm"
+
+            first = asyncio.create_task(pool.run(sleep_and_return, "first", 1.0))
+            await asyncio.sleep(0.2)
+            first.cancel()
+            try:
+                await first
+            except asyncio.CancelledError:
+                pass
+
+            # The worker is still busy with the cancelled job
+            assert pool._idle_queue().qsize() == 0
+
+            start = time.time()
+            second = await pool.run(sleep_and_return, "second", 0)
+            assert second == "second", f"Next job got {second!r}"
+            assert time.time() - start > 0.5, "Next job did not wait for the cancelled one"
+        finally:
+            pool.shutdown()
+
+    asyncio.run(run())
+
+def test_memory_error_replaces_worker():
+    """A job over the memory limit raises WorkerMemoryError and gets a new worker"""
+    async def run():
+        pool = SupervisedProcessPool(workers=1, memory_limit_mb=512)
+        try:
+            pid = await pool.run(worker_pid)
+            try:
+                await pool.run(allocate, 1024)
+                assert False, "Allocation over the memory limit succeeded"
+            except WorkerMemoryError:
+                pass
+
+            assert pool.stats()["memoryErrors"] == 1
+            assert await pool.run(allocate, 1) == 1024 * 1024
+            assert await pool.run(worker_pid) != pid, "Worker was not replaced"
+        finally:
+            pool.shutdown()
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    print("=== Supervised Process Pool Test ===\n")
+    test_cancelled_job_keeps_its_slot()
+    print("✅ Cancelled job test passed")
+    test_memory_error_replaces_worker()
+    print("✅ Memory limit test passed")